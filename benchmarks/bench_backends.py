@@ -0,0 +1,108 @@
+"""
+추론 백엔드 벤치마크.
+같은 프레임에 대해 PyTorch(ultralytics) 백엔드와 ONNX Runtime(CPU) 백엔드의
+PersonDetector / PoseDetector 지연 시간(ms)을 비교하고, 탐지 결과가 일치하는지 확인합니다.
+ONNX 모델이 없으면 처음 실행할 때 .pt 옆에 내보내 캐시합니다.
+
+실행: python benchmarks/bench_backends.py [--video path.mp4] [--frames 100] [--threads 4] [--fall-mode crops]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.config import get_config
+from detect.person_detector import PersonDetector
+from detect.pose_detector import PoseDetector
+
+
+def load_frames(video_path, count, width, height):
+    """영상에서 프레임을 읽어오고, 영상이 없으면 무작위 프레임을 생성합니다."""
+    if video_path:
+        cap = cv2.VideoCapture(str(video_path))
+        frames = []
+        while len(frames) < count:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+        if frames:
+            return frames
+        print(f"영상을 읽을 수 없어 무작위 프레임을 사용합니다: {video_path}")
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def measure(run, frames, warmup=3):
+    """프레임별 지연 시간(ms)을 측정하여 평균/p50/p95와 결과 목록을 반환합니다."""
+    for frame in frames[:warmup]:
+        run(frame)
+    latencies, outputs = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        outputs.append(run(frame))
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies = np.array(latencies)
+    return {
+        "mean": latencies.mean(),
+        "p50": np.percentile(latencies, 50),
+        "p95": np.percentile(latencies, 95),
+    }, outputs
+
+
+def agreement(reference, candidate):
+    """프레임별 탐지 인원 수가 같은 프레임의 비율."""
+    same = sum(len(a) == len(b) for a, b in zip(reference, candidate))
+    return same / len(reference) if reference else 1.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video", help="벤치마크에 사용할 영상 (없으면 무작위 프레임)")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--threads", type=int, default=None, help="ONNX Runtime intra-op 스레드 수")
+    parser.add_argument("--fall-mode", choices=PoseDetector.INFERENCE_MODES, default="crops")
+    args = parser.parse_args()
+
+    detection_config = get_config()["detection"]
+    person_config = detection_config.get("person_detector", {})
+    fall_config = {**detection_config.get("fall_detector", {}), "inference_mode": args.fall_mode}
+    frames = load_frames(args.video, args.frames, args.width, args.height)
+
+    results = {}
+    for backend in ("torch", "onnx"):
+        options = {"backend": backend, "intra_op_threads": args.threads}
+        person_detector = PersonDetector(**{**person_config, **options})
+        pose_detector = PoseDetector(**{**fall_config, **options})
+
+        person_stats, persons = measure(person_detector.detect, frames)
+        # 넘어짐 모델은 PyTorch 백엔드가 찾은 사람 목록을 공통 입력으로 사용 (사람 탐지 차이의 영향 제외)
+        reference_persons = results["torch"]["persons"] if "torch" in results else persons
+        pose_inputs = iter([[dict(p) for p in frame_persons] for frame_persons in reference_persons])
+        pose_stats, _ = measure(lambda frame: pose_detector.detect(frame, next(pose_inputs)), frames, warmup=0)
+
+        results[backend] = {"person": person_stats, "pose": pose_stats, "persons": persons}
+
+    print(f"\n프레임 {len(frames)}개, {frames[0].shape[1]}x{frames[0].shape[0]}, "
+          f"ONNX 스레드: {args.threads or '기본값'}, 넘어짐 모드: {args.fall_mode}")
+    print(f"{'백엔드':<8} {'단계':<8} {'평균(ms)':>10} {'p50(ms)':>10} {'p95(ms)':>10}")
+    for backend, result in results.items():
+        for stage in ("person", "pose"):
+            stats = result[stage]
+            print(f"{backend:<8} {stage:<8} {stats['mean']:>10.2f} {stats['p50']:>10.2f} {stats['p95']:>10.2f}")
+
+    speedup = results["torch"]["person"]["mean"] / results["onnx"]["person"]["mean"]
+    print(f"\n사람 탐지 속도 향상 (torch / onnx): {speedup:.2f}x")
+    print(f"프레임별 탐지 인원 수 일치율: {agreement(results['torch']['persons'], results['onnx']['persons']):.1%}")
+
+
+if __name__ == "__main__":
+    main()
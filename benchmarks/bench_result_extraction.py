@@ -0,0 +1,98 @@
+"""
+YOLO 결과 추출 마이크로 벤치마크.
+박스마다 텐서에 접근하던 기존 방식(.item()/.tolist()/.cpu().numpy() 반복)과
+한 번의 .cpu().numpy() 전송으로 배열을 만든 뒤 레코드를 구성하는 방식의
+프레임당 처리 시간을 박스 수별로 비교합니다. (모델 없이 합성 결과 사용)
+
+실행: python benchmarks/bench_result_extraction.py [--counts 0 1 5 10 20 50 100] [--repeat 2000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from detect.box_utils import boxes_to_array
+from detect.onnx_backend import OnnxBoxes
+
+try:
+    from ultralytics.engine.results import Boxes
+except ImportError:  # ultralytics가 없으면 같은 접근 방식을 제공하는 OnnxBoxes로 측정
+    Boxes = None
+
+NAMES = {0: "Fall-Detected", 1: "Normal"}
+
+
+def make_boxes(count, rng):
+    """count개의 합성 탐지 박스 (N, 6) [x1, y1, x2, y2, conf, cls]."""
+    xy = rng.uniform(0, 1200, (count, 2))
+    wh = rng.uniform(20, 300, (count, 2))
+    data = np.column_stack([xy, xy + wh, rng.uniform(0.3, 1.0, count), rng.integers(0, 2, count)]).astype(np.float32)
+    tensor = torch.from_numpy(data)
+    return Boxes(tensor, (720, 1280)) if Boxes is not None else OnnxBoxes(tensor)
+
+
+def persons_per_box(boxes):
+    """기존 PersonDetector 방식."""
+    persons = []
+    for box in boxes:
+        conf = float(box.conf[0].item())
+        x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
+        persons.append({"bbox": [x1, y1, x2, y2], "confidence": conf})
+    return persons
+
+
+def persons_vectorized(boxes):
+    """한 번의 전송 후 배열에서 레코드 구성."""
+    detections = boxes_to_array(boxes)
+    bboxes = detections[:, :4].astype(int).tolist()
+    return [{"bbox": bbox, "confidence": conf} for bbox, conf in zip(bboxes, detections[:, 4].tolist())]
+
+
+def falls_per_box(boxes):
+    """기존 PoseDetector 방식."""
+    fall_bboxes = []
+    if boxes:
+        for box in boxes:
+            if NAMES[int(box.cls)] == "Fall-Detected":
+                fall_bboxes.append(box.xyxy[0].cpu().numpy().astype(int) + np.array([0, 0, 0, 0]))
+    return fall_bboxes
+
+
+def falls_vectorized(boxes, fall_class_ids=(0,)):
+    detections = boxes_to_array(boxes)
+    is_fall = np.isin(detections[:, 5].astype(int), fall_class_ids)
+    return list(detections[is_fall, :4].astype(int) + np.array([0, 0, 0, 0]))
+
+
+def measure_us(func, boxes, repeat):
+    func(boxes)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(boxes)
+    return (time.perf_counter() - start) * 1e6 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[0, 1, 5, 10, 20, 50, 100])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"결과 객체: {'ultralytics Boxes' if Boxes is not None else 'OnnxBoxes'}")
+    print(f"{'박스 수':>8} {'사람(기존) µs':>14} {'사람(배열) µs':>14} {'넘어짐(기존) µs':>16} {'넘어짐(배열) µs':>16}")
+    for count in args.counts:
+        boxes = make_boxes(count, rng)
+        assert persons_per_box(boxes) == persons_vectorized(boxes)
+        assert all((a == b).all() for a, b in zip(falls_per_box(boxes), falls_vectorized(boxes)))
+        row = [measure_us(f, boxes, args.repeat) for f in (persons_per_box, persons_vectorized, falls_per_box, falls_vectorized)]
+        print(f"{count:>8} {row[0]:>14.1f} {row[1]:>14.1f} {row[2]:>16.1f} {row[3]:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+위험 구역 겹침 면적 계산 벤치마크.
+사람×구역 쌍마다 전체 크기 마스크를 만들어 fillPoly 두 번 + bitwise_and + countNonZero로 계산하던 기존 방식과
+DangerZoneMapper의 두 겹침 계산 방식을 비교합니다.
+- raster: 구역을 로드할 때 한 번 래스터화한 누적합 테이블(summed-area table)을 네 번 조회 (기존 방식과 픽셀 수가 같아야 함)
+- polygon: 구역마다 모든 사람 bbox로 다각형을 한 번에 잘라낸(Sutherland–Hodgman) 정확한 면적 (픽셀 수와의 IoU 차이를 보고)
+또한 사람×구역 쌍마다 check_person_in_zone을 부르던 이중 루프와 일괄 처리하는 check_all_zones의 속도와 결과를 비교합니다.
+
+실행: python benchmarks/bench_zone_overlap.py [--persons 20] [--zones 10] [--frames 20] [--width 1280] [--height 720]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from detect.danger_zone_mapper import DangerZoneMapper
+
+
+def legacy_overlap_area(person_bbox, zone):
+    """기존 check_person_in_zone 2단계의 마스크 기반 교차 면적 계산."""
+    px1, py1, px2, py2 = person_bbox
+    zx, zy, zw, zh = zone['bounding_rect']
+    person_rect_points = np.array([[px1, py1], [px2, py1], [px2, py2], [px1, py2]], dtype=np.int32)
+    mask = np.zeros((max(py2, zy + zh), max(px2, zx + zw)), dtype=np.uint8)
+    cv2.fillPoly(mask, [person_rect_points], 255)
+    person_mask = mask.copy()
+    mask.fill(0)
+    cv2.fillPoly(mask, [zone['points']], 255)
+    return cv2.countNonZero(cv2.bitwise_and(person_mask, mask))
+
+
+def pairwise_check_all_zones(mapper, persons, frame_size):
+    """기존 check_all_zones: 사람×구역 쌍마다 check_person_in_zone을 호출하는 이중 루프."""
+    alerts = []
+    for zone in mapper.get_zones_for_camera(None, frame_size):
+        persons_in_zone = []
+        for i, person in enumerate(persons):
+            is_in, iou = mapper.check_person_in_zone(person["bbox"], zone)
+            if is_in:
+                persons_in_zone.append({"person_index": i, "bbox": person["bbox"],
+                                        "confidence": person["confidence"], "intrusion_iou": round(iou, 2)})
+        if persons_in_zone:
+            alerts.append({"zone_id": zone["id"], "zone_name": zone["name"], "camera_id": None,
+                           "person_count": len(persons_in_zone), "persons": persons_in_zone})
+    return alerts
+
+
+def random_zone(rng, width, height, index):
+    """구역 중심 주변에 무작위 각도로 꼭짓점을 놓은 오목/볼록 다각형 구역."""
+    cx, cy = rng.uniform(0.2, 0.8) * width, rng.uniform(0.2, 0.8) * height
+    angles = np.sort(rng.uniform(0, 2 * np.pi, rng.integers(4, 9)))
+    radii = rng.uniform(60, 250, len(angles))
+    points = [{"x": float(np.clip(cx + r * np.cos(a), 0, width - 1)), "y": float(np.clip(cy + r * np.sin(a), 0, height - 1))}
+              for a, r in zip(angles, radii)]
+    return {"id": f"zone_{index}", "name": f"Zone {index}", "points": points}
+
+
+def random_persons(rng, count, width, height):
+    x1 = rng.integers(-40, width - 40, count)
+    y1 = rng.integers(-40, height - 80, count)
+    w = rng.integers(30, 300, count)
+    h = rng.integers(60, 400, count)
+    return [[int(a), int(b), int(a + c), int(b + d)] for a, b, c, d in zip(x1, y1, w, h)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--persons", type=int, default=20)
+    parser.add_argument("--zones", type=int, default=10)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--frames", type=int, default=20, help="측정할 프레임(사람 배치) 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frame_size = (args.width, args.height)
+    zones_data = [random_zone(rng, args.width, args.height, i) for i in range(args.zones)]
+    batches = [np.array(random_persons(rng, args.persons, args.width, args.height)) for _ in range(args.frames)]
+    pair_count = len(batches) * args.persons * args.zones
+
+    legacy_areas = []
+    start = time.perf_counter()
+    reference_zones = DangerZoneMapper(reference_size=frame_size, overlap_method="raster")
+    reference_zones.update_zones_from_data(zones_data)
+    for bboxes in batches:
+        for zone in reference_zones.get_zones_for_camera(None, frame_size):
+            legacy_areas.append([legacy_overlap_area(bbox, zone) for bbox in bboxes.tolist()])
+    legacy_us = (time.perf_counter() - start) * 1e6 / pair_count
+    legacy_areas = np.array(legacy_areas)
+
+    print(f"\n사람 {args.persons}명 × 구역 {args.zones}개, {args.width}x{args.height}, 프레임 {args.frames}개 ({pair_count}쌍)")
+    print(f"기존 마스크: 쌍당 {legacy_us:.1f}µs")
+    for method in DangerZoneMapper.OVERLAP_METHODS:
+        mapper = DangerZoneMapper(reference_size=frame_size, overlap_method=method)
+        start = time.perf_counter()
+        mapper.update_zones_from_data(zones_data)
+        zones = mapper.get_zones_for_camera(None, frame_size)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        areas = []
+        start = time.perf_counter()
+        for bboxes in batches:
+            for zone in zones:
+                areas.append(mapper._zone_overlap_areas(bboxes, zone))
+        method_us = (time.perf_counter() - start) * 1e6 / pair_count
+        areas = np.array(areas)
+
+        frames = [[{"bbox": bbox, "confidence": 1.0} for bbox in bboxes.tolist()] for bboxes in batches]
+        mapper.check_all_zones(frames[0], frame_size=frame_size)  # 워밍업
+        pairwise_check_all_zones(mapper, frames[0], frame_size)
+        start = time.perf_counter()
+        batched = [mapper.check_all_zones(persons, frame_size=frame_size) for persons in frames]
+        check_ms = (time.perf_counter() - start) * 1000 / len(batches)
+        start = time.perf_counter()
+        pairwise = [pairwise_check_all_zones(mapper, persons, frame_size) for persons in frames]
+        pairwise_ms = (time.perf_counter() - start) * 1000 / len(batches)
+
+        person_areas = np.concatenate([np.prod(b[:, 2:] - b[:, :2], axis=1) for b in batches for _ in zones])
+        iou_diff = np.abs(areas.ravel() - legacy_areas.ravel()) / np.maximum(person_areas, 1)
+        print(f"[{method}] 구역 준비 {build_ms:.2f}ms | 쌍당 {method_us:.2f}µs ({legacy_us / method_us:.0f}x) | 기존 대비 면적 불일치 쌍 "
+              f"{int(np.count_nonzero(areas.ravel() != legacy_areas.ravel()))}/{pair_count}, 최대 IoU 차이 {iou_diff.max():.4f}")
+        print(f"[{method}] check_all_zones 프레임당 일괄 {check_ms:.3f}ms | 쌍별 루프 {pairwise_ms:.3f}ms "
+              f"({pairwise_ms / check_ms:.1f}x) | 경보 일치 프레임 {sum(a == b for a, b in zip(batched, pairwise))}/{len(frames)}")
+
+
+if __name__ == "__main__":
+    main()
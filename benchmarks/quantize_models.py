@@ -0,0 +1,160 @@
+"""
+INT8 양자화 작업 및 정확도/속도 보고서.
+녹화 자료(.session, 영상, 이미지 디렉터리)에서 프레임을 뽑아 절반은 보정(calibration)에, 나머지 절반은 평가에 사용합니다.
+사람 모델과 넘어짐 모델을 여러 설정(QUANTIZATION_VARIANTS)으로 INT8 양자화한 뒤,
+FP32 ONNX 모델의 탐지 결과를 기준으로 한 mAP 변화량과 프레임당 지연 시간을 보고서(.md/.json)로 저장합니다.
+(녹화 자료에는 정답 라벨이 없으므로 mAP는 FP32 모델과의 일치도입니다)
+
+넘어짐 모델은 설정의 inference_mode가 'crops'이면 FP32 사람 모델이 찾은 사람 크롭으로 보정/평가합니다.
+보고서를 본 뒤 --install로 고른 후보를 '<모델명>.int8.onnx'로 설치하면
+설정에서 backend='onnx', precision='int8'로 사용할 수 있습니다.
+(--install 없이 --auto-install을 주면 mAP50 하락이 --max-map-drop 이하인 후보 중 가장 빠른 것을 설치)
+
+실행: python benchmarks/quantize_models.py recordings/*.session [--models person fall] [--install person=qdq_minmax_pc]
+"""
+import argparse
+import inspect
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.config import get_config, ROOT_DIR
+from detect.onnx_backend import OnnxYoloModel, ensure_onnx_model, quantized_model_path
+from detect.pose_detector import PoseDetector, crop_person_regions
+from detect.quantization import (QUANTIZATION_VARIANTS, collect_frames, install_variant, mean_average_precision,
+                                 quantize_variant, run_model)
+
+EVAL_CONF = 0.001  # mAP 계산용 (낮은 신뢰도까지 포함해 PR 곡선 전체를 사용)
+
+
+def evaluate(model, inputs, reference, conf, classes, imgsz):
+    """평가 입력에 대한 기준 대비 mAP와 운영 임계값에서의 지연 시간을 측정합니다."""
+    predictions, _ = run_model(model, inputs, EVAL_CONF, classes, imgsz, warmup=0)
+    _, latency = run_model(model, inputs, conf, classes, imgsz)
+    return {**mean_average_precision(predictions, reference), **latency}
+
+
+def build_model_inputs(args, frames, person_model, person_classes, person_conf):
+    """모델별 (보정 이미지, 평가 입력, 입력 크기, 클래스, 임계값)을 구성합니다."""
+    detection_config = get_config()["detection"]
+    fall_config = detection_config.get("fall_detector", {})
+    calibration_frames, eval_frames = frames[0::2], frames[1::2]
+
+    specs = {}
+    if "person" in args.models:
+        specs["person"] = {
+            "model_path": detection_config.get("person_detector", {}).get("model_path", "yolov8n.pt"),
+            "calibration": calibration_frames,
+            "inputs": [[frame] for frame in eval_frames],
+            "imgsz": 640, "classes": person_classes, "conf": person_conf,
+        }
+    if "fall" in args.models:
+        defaults = inspect.signature(PoseDetector).parameters
+        fall_spec = {"model_path": fall_config.get("fall_model_path", defaults["fall_model_path"].default),
+                     "conf": fall_config.get("conf_threshold", defaults["conf_threshold"].default), "classes": None}
+        if fall_config.get("inference_mode", "full_frame") == "crops":
+            # 운영과 같이 FP32 사람 모델이 찾은 사람 영역 크롭을 입력으로 사용
+            padding, crop_imgsz = fall_config.get("crop_padding", 0.15), fall_config.get("crop_imgsz", 320)
+
+            def crops_of(frame):
+                result = person_model.predict(frame, conf=person_conf, classes=person_classes)[0]
+                bboxes = result.boxes.data[:, :4].numpy().astype(int).tolist()
+                return crop_person_regions(frame, bboxes, padding)[0]
+
+            fall_spec["calibration"] = [crop for frame in calibration_frames for crop in crops_of(frame)]
+            fall_spec["inputs"] = [crops for crops in map(crops_of, eval_frames) if crops]
+            fall_spec["imgsz"] = crop_imgsz
+        else:
+            fall_spec.update({"calibration": calibration_frames, "inputs": [[frame] for frame in eval_frames], "imgsz": 640})
+        specs["fall"] = fall_spec
+    return specs
+
+
+def write_report(report, report_path):
+    """보고서를 JSON과 마크다운 표로 저장합니다."""
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.with_suffix(".json").write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    lines = [f"# INT8 양자화 보고서 ({report['created_at']})", "",
+             f"- 보정 프레임: {report['calibration_frames']}장, 평가 프레임: {report['eval_frames']}장",
+             f"- ONNX Runtime intra-op 스레드: {report['intra_op_threads'] or '기본값'}",
+             "- mAP는 FP32 ONNX 모델 탐지 결과 기준 (라벨 없는 녹화 자료)", ""]
+    for model_name, model_report in report["models"].items():
+        lines += [f"## {model_name} ({model_report['model_path']})", "",
+                  "| 후보 | mAP50 | ΔmAP50 | mAP50-95 | ΔmAP50-95 | 평균(ms) | p95(ms) | 속도 향상 | 크기(MB) |",
+                  "|---|---|---|---|---|---|---|---|---|"]
+        baseline = model_report["variants"]["fp32"]
+        for variant, row in model_report["variants"].items():
+            lines.append(f"| {variant} | {row['map50']:.3f} | {row['map50'] - baseline['map50']:+.3f} | "
+                         f"{row['map50_95']:.3f} | {row['map50_95'] - baseline['map50_95']:+.3f} | "
+                         f"{row['mean_ms']:.1f} | {row['p95_ms']:.1f} | {baseline['mean_ms'] / row['mean_ms']:.2f}x | "
+                         f"{row['size_mb']:.1f} |")
+        lines += ["", f"설치된 후보: {model_report.get('installed') or '없음'}", ""]
+    report_path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sources", nargs="+", help="녹화 세션(.session), 영상 파일 또는 이미지 디렉터리")
+    parser.add_argument("--models", nargs="+", choices=["person", "fall"], default=["person", "fall"])
+    parser.add_argument("--variants", nargs="+", choices=list(QUANTIZATION_VARIANTS), default=list(QUANTIZATION_VARIANTS))
+    parser.add_argument("--every", type=int, default=15, help="녹화 자료에서 몇 프레임마다 하나씩 뽑을지")
+    parser.add_argument("--max-frames", type=int, default=400, help="보정+평가에 사용할 최대 프레임 수")
+    parser.add_argument("--threads", type=int, default=None, help="ONNX Runtime intra-op 스레드 수")
+    parser.add_argument("--install", nargs="*", default=[], metavar="MODEL=VARIANT", help="설치할 후보 (예: person=qdq_minmax_pc)")
+    parser.add_argument("--auto-install", action="store_true", help="허용 범위 안에서 가장 빠른 후보를 설치")
+    parser.add_argument("--max-map-drop", type=float, default=0.02, help="--auto-install의 허용 mAP50 하락폭")
+    parser.add_argument("--report", type=Path, default=ROOT_DIR / "models" / "quantization_report.md")
+    args = parser.parse_args()
+    selected = dict(item.split("=", 1) for item in args.install)
+    for model_name, variant in selected.items():
+        if model_name not in args.models or variant not in args.variants:
+            parser.error(f"--install {model_name}={variant}: 이번 실행의 모델/후보가 아닙니다.")
+
+    frames = collect_frames(args.sources, every=args.every, max_frames=args.max_frames)
+    if len(frames) < 2:
+        parser.error("보정/평가에 사용할 프레임이 부족합니다.")
+
+    person_config = get_config()["detection"].get("person_detector", {})
+    person_model = OnnxYoloModel(ensure_onnx_model(person_config.get("model_path", "yolov8n.pt")), intra_op_threads=args.threads)
+    person_classes = [class_id for class_id, name in person_model.names.items() if name.lower() == "person"]
+    person_conf = person_config.get("conf_threshold", 0.3)
+    specs = build_model_inputs(args, frames, person_model, person_classes, person_conf)
+
+    report = {"created_at": time.strftime("%Y-%m-%d %H:%M:%S"), "calibration_frames": len(frames[0::2]),
+              "eval_frames": len(frames[1::2]), "intra_op_threads": args.threads, "models": {}}
+    for model_name, spec in specs.items():
+        fp32_path = ensure_onnx_model(spec["model_path"])
+        fp32_model = OnnxYoloModel(fp32_path, intra_op_threads=args.threads)
+        # 운영 임계값에서의 FP32 탐지 결과를 기준 박스로 사용
+        reference, _ = run_model(fp32_model, spec["inputs"], spec["conf"], spec["classes"], spec["imgsz"], warmup=0)
+
+        rows = {"fp32": {**evaluate(fp32_model, spec["inputs"], reference, spec["conf"], spec["classes"], spec["imgsz"]),
+                         "size_mb": fp32_path.stat().st_size / 1e6}}
+        for variant in args.variants:
+            int8_path = quantize_variant(fp32_path, variant, spec["calibration"], spec["imgsz"])
+            int8_model = OnnxYoloModel(int8_path, intra_op_threads=args.threads)
+            rows[variant] = {**evaluate(int8_model, spec["inputs"], reference, spec["conf"], spec["classes"], spec["imgsz"]),
+                             "size_mb": int8_path.stat().st_size / 1e6}
+            print(f"[{model_name}] {variant}: mAP50 {rows[variant]['map50']:.3f}, {rows[variant]['mean_ms']:.1f}ms "
+                  f"(FP32 {rows['fp32']['mean_ms']:.1f}ms)")
+
+        installed = selected.get(model_name)
+        if installed is None and args.auto_install:
+            acceptable = [v for v in args.variants if rows["fp32"]["map50"] - rows[v]["map50"] <= args.max_map_drop]
+            installed = min(acceptable, key=lambda v: rows[v]["mean_ms"], default=None)
+        if installed is not None:
+            install_variant(fp32_path, installed)
+
+        report["models"][model_name] = {"model_path": str(spec["model_path"]), "variants": rows, "installed": installed,
+                                        "installed_path": str(quantized_model_path(fp32_path)) if installed else None}
+
+    write_report(report, args.report)
+    print(f"\n보고서 저장: {args.report} / {args.report.with_suffix('.json')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+녹화 세션(.session) 재생 벤치마크.
+세션의 영상/센서 값/서버 명령을 InputAdapter와 SensorReader를 통해 다시 흘려보내며
+Detector → LogicFacade 파이프라인의 처리량을 측정하고, 판단한 위험 등급을
+녹화 당시 UI로 전송된 StatusUpdateMessage의 위험 등급과 비교합니다.
+
+실행: python benchmarks/replay_session.py recordings/session_xxx.session [--pacing fast|realtime]
+"""
+import argparse
+import queue
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.config import get_config
+from detect.detect_facade import Detector
+from input_adapter.input_facade import create_input_adapter
+from logic.logic_facade import LogicFacade
+from server.state_manager import SystemStateManager
+
+MODE_COMMANDS = {
+    "START_AUTOMATIC": "start_automatic_mode",
+    "START_MAINTENANCE": "start_maintenance_mode",
+    "STOP": "stop_system_globally",
+    "RESET": "reset_system",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("session", help="세션 파일 경로")
+    parser.add_argument("--pacing", choices=["fast", "realtime"], default="fast")
+    args = parser.parse_args()
+
+    config = get_config()
+    input_config = {**config["input"], "session_replay": {"path": args.session, "pacing": args.pacing},
+                    "sensor_event_driven": False, "threaded_capture": False}
+    input_config.pop("replay", None)
+    input_adapter = create_input_adapter(input_config)
+    player = input_adapter.session_player
+    detector = Detector(config["detection"])
+    logic_facade = LogicFacade(config.get("logic", {}))
+    state_manager = SystemStateManager()
+    commands = queue.Queue()
+
+    frames = 0
+    compared = 0
+    agreements = 0
+    mismatches = Counter()
+    conveyor_is_on, conveyor_speed = False, 100
+
+    start = time.perf_counter()
+    while True:
+        player.pump_commands(commands)
+        while not commands.empty():
+            command = commands.get_nowait()
+            if command.get("command") == "UPDATE_ZONES":
+                detector.danger_zone_mapper.update_zones_from_data(command.get("data", []))
+            elif command.get("command") in MODE_COMMANDS:
+                getattr(state_manager, MODE_COMMANDS[command["command"]])()
+
+        if input_adapter.is_multi_camera:
+            envelopes = input_adapter.get_frame_envelopes()
+            if not envelopes:
+                break
+            detection_result = detector.detect_cameras(envelopes)
+        else:
+            envelope = input_adapter.get_frame_envelope()
+            if envelope is None:
+                break
+            detection_result = detector.detect(envelope)
+        frames += 1
+
+        if not state_manager.is_active():
+            continue
+
+        logic_result = logic_facade.process(
+            detection_result=detection_result,
+            sensor_data=input_adapter.get_sensor_data(),
+            current_mode=state_manager.get_mode(),
+            current_conveyor_status=conveyor_is_on,
+            current_conveyor_speed=conveyor_speed
+        )
+        for action in logic_result["actions"]:
+            if action["type"] == "LOCK_SYSTEM":
+                state_manager.lock_system(action.get("details", {}).get("reason", ""))
+            elif action["type"] == "POWER_ON":
+                conveyor_is_on = True
+            elif action["type"] == "POWER_OFF":
+                conveyor_is_on = False
+            elif action["type"] == "REDUCE_SPEED_50":
+                conveyor_speed = 50
+            elif action["type"] == "RESUME_FULL_SPEED":
+                conveyor_speed = 100
+
+        recorded = player.status_at(player.clock())
+        if recorded is not None:
+            compared += 1
+            replayed_level = logic_result["status"]["risk_level"]
+            if replayed_level == recorded.get("risk_level"):
+                agreements += 1
+            else:
+                mismatches[(recorded.get("risk_level"), replayed_level)] += 1
+
+    elapsed = time.perf_counter() - start
+    input_adapter.release()
+
+    print(f"\n세션: {args.session} ({args.pacing})")
+    print(f"프레임 {frames}개, {elapsed:.2f}초, {frames / elapsed if elapsed > 0 else 0.0:.1f} FPS")
+    if compared:
+        print(f"위험 등급 일치율: {agreements / compared:.1%} ({agreements}/{compared})")
+        for (recorded_level, replayed_level), count in mismatches.most_common():
+            print(f"  녹화 {recorded_level:<20} → 재생 {replayed_level:<20} {count}회")
+    else:
+        print("비교할 상태 메시지가 없습니다.")
+
+
+if __name__ == "__main__":
+    main()
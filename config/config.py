@@ -14,16 +14,130 @@ def get_config() -> Dict[str, Any]:
     config = {
         "input": {
             "camera_index": 3,  # 실제 사용할 카메라 인덱스
-            "mock_mode": False # True일 경우, 실제 카메라 대신 비디오 파일을 사용
+            "threaded_capture": True,  # 백그라운드 스레드로 최신 프레임만 유지 (캡처 블로킹 제거)
+            # 카메라 재연결: 연속 읽기 실패 시 백그라운드에서 지수 백오프로 소스를 다시 엽니다.
+            # 끊긴 동안 워커는 멈추지 않고 'camera lost' 상태를 알리며 컨베이어를 정지시킵니다.
+            # 시작 시 열리지 않는 카메라도 끊김 상태로 시작하여 같은 방식으로 재연결합니다.
+            "reconnect": {
+                "enabled": True,
+                "max_read_failures": 30,
+                "backoff_initial": 0.5,
+                "backoff_max": 10.0
+            },
+            # 다중 카메라 구성 예시. 지정 시 camera_index 대신 사용되며, 구역은 camera_id로 카메라에 매핑됩니다.
+            # "cameras": [{"camera_id": "line1_left", "camera_index": 0}, {"camera_id": "line1_right", "camera_index": 1}],
+            "mock_mode": False, # True일 경우, 실제 카메라 대신 더미 프레임을 사용
+            # 멈춘 영상 감지: 프레임 지문이 직전과 같으면 추론을 건너뛰고,
+            # stale_after(초) 이상 같은 프레임이 이어지면 STALE_FEED 위험 요소로 컨베이어를 정지시킵니다.
+            "frozen_feed": {
+                "enabled": True,
+                "sample_step": 8,
+                "stale_after": 3.0
+            },
+            # 센서: sensor_mock_mode가 False이면 sensor_pin(GPIO BCM 번호)의 실제 센서를 읽습니다.
+            "sensor_mock_mode": True,
+            "sensor_pin": None,
+            "sensor_types": ["touch"],
+            # 전처리(블러 -> 크기 조정 -> 정규화)를 미리 할당된 버퍼 위에서 수행하여 프레임마다의 배열 할당을 제거합니다.
+            # 전처리 결과는 다음 프레임에서 덮어써지므로, 프레임 간에 보관하는 곳이 생기면 copy() 하거나 끄십시오.
+            "fused_preprocess": True,
+            # 센서 이벤트 구동 모드: 프레임마다 폴링하지 않고, 경보 전환 시 콜백으로 즉시 비상 정지를 수행
+            # 실제 하드웨어에서 읽는 센서가 터치(GPIO) 하나뿐이면 샘플러 대신 GPIO 에지 콜백으로 경보를 즉시 전달합니다.
+            "sensor_event_driven": True,
+            "sensor_sample_interval": 0.02,  # GPIO 에지 콜백을 쓸 수 없을 때 백그라운드 샘플링 주기 (초)
+            "sensor_history_seconds": 60.0,  # 센서별 이력 보관 시간 (초). 버퍼 크기 = 보관 시간 / 샘플링 주기
+            # 녹화 영상 재생 설정. 지정 시 카메라 대신 사용됩니다. (벤치마크/회귀 테스트용)
+            # path: 비디오 파일 또는 이미지 디렉토리, pacing: 'realtime' | 'fast', loop: 반복 재생 여부
+            # "replay": {"path": str(ROOT_DIR / "recordings" / "line1.mp4"), "pacing": "fast", "loop": False},
+            # 녹화 세션 재생 설정. 지정 시 세션의 영상/센서 값/서버 명령을 녹화 시각에 맞춰 재생합니다. (가장 우선)
+            # "session_replay": {"path": str(ROOT_DIR / "recordings" / "session_20250101_120000.session"), "pacing": "fast"},
         },
         "detection": {
+            # 이중 해상도 파이프라인: 이 너비로 축소한 프레임으로 추론하고, 표시는 원본 해상도로 수행 (None이면 비활성)
+            "inference_width": 640,
+            # 픽셀 좌표 구역이 그려진 기준 해상도 (width, height). 지정 시 픽셀 구역을 이 해상도 기준으로 정규화합니다.
+            # 모든 카메라가 이 해상도일 때만 지정하세요. None이면 픽셀 구역은 그대로 사용되고,
+            # 대시보드는 'normalized': True인 비율 좌표로 구역을 보내므로 카메라 해상도와 관계없이 같은 영역을 가리킵니다.
+            "zone_reference_size": None,
+            # 사람 bbox와 구역의 겹침 면적 계산 방식: 'polygon'(다각형 클리핑, 정확한 면적) | 'raster'(픽셀 누적합 테이블)
+            "zone_overlap_method": "polygon",
+            # 모션 게이트: 저해상도 그레이스케일 차분으로 변화가 없으면 추론을 건너뛰고 직전 결과를 재사용
+            # 마지막 실제 추론에서 max_skip_interval(초)이 지나면 변화가 없어도 반드시 추론합니다.
+            # 추론을 건너뛰는 기능이므로 현장에서 지연 한계를 검토한 뒤 명시적으로 켭니다. (기본 비활성)
+            "motion_gate": {
+                "enabled": False,
+                "downscale_width": 160,
+                "pixel_threshold": 25,
+                "min_changed_ratio": 0.002,
+                "max_skip_interval": 0.5
+            },
+            # 사람 bbox가 구역에서 이 거리(픽셀) 이내면 구역 근처로 보고 최대 추론 속도로 동작 (inference_rate 참고)
+            "near_zone_margin": 80,
+            # 사람 추적기: 추적 ID 부여, detect_interval 프레임마다만 탐지하고 그 사이는 칼만 예측으로 전파
+            # 추적 중인 사람이 위험 구역 zone_margin(픽셀) 이내로 접근하거나 넘어짐 상태이면 즉시 탐지하고,
+            # 모션 게이트와 함께 쓰면 구역 주변(near_zone_margin)의 새 움직임에도 즉시 탐지합니다.
+            # 탐지를 건너뛰는 기능이므로 현장에서 지연 한계를 검토한 뒤 명시적으로 켭니다. (기본 비활성)
+            "tracker": {
+                "enabled": False,
+                "detect_interval": 3,
+                "iou_threshold": 0.3,
+                "max_missed": 2,
+                "zone_margin": 60,
+                "max_detection_gap": 0.5
+            },
+            # 위험 구역 ROI 크롭 추론: 구역 주변(margin 픽셀)만 잘라 추론하고,
+            # full_frame_interval(초)마다 전체 프레임을 추론하여 구역에 접근하는 사람을 확인합니다.
+            "zone_roi": {
+                "enabled": False,
+                "margin": 80,
+                "full_frame_interval": 1.0,
+                "max_area_ratio": 0.6
+            },
+            # 추론 백엔드: 'torch'(ultralytics/PyTorch) 또는 'onnx'(ONNX Runtime CPU)
+            # 'onnx'는 .pt 가중치를 처음 한 번 ONNX로 내보내 모델 옆(.onnx)에 캐시합니다.
+            # ('onnx'/'int8'은 onnxruntime, onnx 패키지가 필요합니다. requirements.txt 하단의 선택 의존성 참고)
+            # onnx_intra_op_threads: ONNX Runtime 연산자 내부 스레드 수 (None이면 물리 코어 수)
+            # precision: 'fp32' 또는 'int8'. 'int8'은 benchmarks/quantize_models.py로 만든
+            # '<모델명>.int8.onnx'를 로드합니다. ('onnx' 백엔드 전용, 탐지기별 설정으로 개별 지정 가능)
+            "backend": "torch",
+            "onnx_intra_op_threads": None,
+            "precision": "fp32",
             "person_detector": {
                 "model_path": ROOT_DIR / "models" / "yolov8n.pt"
             },
+            # 넘어짐 모델(PoseDetector) 추론 설정
+            # inference_mode: 'full_frame'은 프레임 전체를 다시 추론, 'crops'는 탐지된 사람 영역만 잘라 한 번에 배치 추론
+            # ('crops'는 넘어짐 모델이 크롭 입력으로 검증된 현장에서만 켭니다)
+            "fall_detector": {
+                "inference_mode": "full_frame",
+                "crop_padding": 0.15,  # 사람 bbox 주변 여백 (bbox 크기 대비 비율)
+                "crop_imgsz": 320,     # 크롭 배치 추론 입력 크기
+                # 사람-넘어짐 bbox 연결: 'greedy'/'hungarian'은 넘어짐 bbox 하나를 한 사람에게만 배정, 'any'는 기존 방식
+                # ('hungarian'은 scipy가 필요합니다. requirements.txt 하단의 선택 의존성 참고)
+                "match_strategy": "greedy",
+                "fall_iou_threshold": 0.5
+            },
             "pose_detector": {
                 "pose_model_path": ROOT_DIR / "models" / "yolov8n-pose.pt"
             }
         },
+        # 위험도 적응형 추론 속도 (비전 워커 루프 주기)
+        # IDLE: 사람 없음, PERSONS: 사람 있음, ACTIVE: 사람이 구역 안/근처(detection.near_zone_margin), 위험 등급, MAINTENANCE 모드
+        # 속도는 즉시 올리고, hold_time(초) 동안 높은 단계가 다시 필요하지 않을 때만 내립니다.
+        "inference_rate": {
+            "idle_fps": 3.0,
+            "persons_fps": 8.0,
+            "max_fps": 15.0,
+            "hold_time": 2.0
+        },
+        # 세션 녹화: 원본 프레임(압축 영상), 센서 값, 서버 명령, 상태 메시지를 하나의 .session 파일로 기록
+        # max_duration(초)마다 파일을 나누어 저장합니다.
+        "recording": {
+            "enabled": False,
+            "directory": ROOT_DIR / "recordings",
+            "codec": "mp4v",
+            "max_duration": 300.0
+        },
         "control": {
             "mock_mode": False # True일 경우, 실제 시리얼 통신 대신 로그만 출력
         },
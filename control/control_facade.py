@@ -2,6 +2,7 @@ from loguru import logger
 from typing import List, Dict, Any, Optional
 
 from core.serial_communicator import SerialCommunicator
+from core.frame_envelope import latency_ms
 from control.power_controller import PowerController
 from control.speed_controller import SpeedController
 from control.alert_controller import AlertController, AlertLevel
@@ -23,6 +24,9 @@ class ControlFacade:
         self.power_controller = PowerController(communicator=self.communicator, mock_mode=self.mock_mode)
         self.alert_controller = AlertController(communicator=self.communicator, mock_mode=self.mock_mode)
 
+        # 마지막으로 실행된 명령의 캡처→명령 지연 시간 (액션에 frame_meta가 있는 경우)
+        self.last_command_latency: Optional[Dict[str, Any]] = None
+
         if not self.mock_mode:
             logger.success("하드웨어 제어 모드가 활성화되었습니다 (모의 모드 OFF).")
         else:
@@ -107,6 +111,19 @@ class ControlFacade:
                     self.speed_controller.stop_conveyor(reason)
                 else:
                     logger.warning(f"알 수 없는 제어 액션 타입 '{action_type}'은 무시됩니다.")
+                    continue
+
+            # 4. 프레임 캡처 시점부터 명령 전달까지의 종단 지연 시간을 기록합니다.
+            frame_meta = action.get("frame_meta")
+            command_latency = latency_ms(frame_meta)
+            if command_latency is not None:
+                self.last_command_latency = {
+                    "action": action_type,
+                    "seq": frame_meta.get("seq"),
+                    "camera_id": frame_meta.get("camera_id"),
+                    "latency_ms": command_latency
+                }
+                logger.debug(f"[Latency] {action_type}: 캡처→명령 {command_latency:.1f}ms (frame #{frame_meta.get('seq')})")
 
     def get_power_status(self) -> dict:
         """PowerController의 현재 상태를 조회하여 반환합니다."""
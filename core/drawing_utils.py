@@ -3,6 +3,7 @@ import cv2
 import numpy as np
 from PIL import ImageFont, ImageDraw, Image
 from pathlib import Path
+from typing import Dict, List, Tuple
 from loguru import logger
 
 # 프로젝트 루트를 기준으로 폰트 경로를 설정합니다.
@@ -58,3 +59,69 @@ def put_text_korean(
     except Exception as e:
         logger.error(f"한글 텍스트 렌더링 중 오류 발생: {e}")
         return image # 오류 발생 시 원본 이미지 반환
+
+
+def tile_layout(count: int) -> Tuple[int, int]:
+    """tile_frames()가 count개 프레임을 배치하는 격자 크기 (rows, cols)를 반환합니다."""
+    cols = int(np.ceil(np.sqrt(count)))
+    rows = int(np.ceil(count / cols))
+    return rows, cols
+
+
+def tile_frames(frames: list) -> np.ndarray:
+    """
+    여러 카메라 프레임을 하나의 격자 이미지로 합칩니다.
+    모든 타일은 첫 번째 프레임 크기에 맞춰 조정됩니다.
+    None인 프레임(연결이 끊긴 카메라)은 검은 타일로 두어, 다른 카메라의 타일 위치가 바뀌지 않게 합니다.
+
+    Args:
+        frames (list): BGR 이미지(np.ndarray 또는 None) 리스트.
+
+    Returns:
+        np.ndarray: 격자 형태로 합쳐진 이미지. (모든 프레임이 None이면 None)
+    """
+    available = [frame for frame in frames if frame is not None]
+    if not available:
+        return None
+    if len(frames) == 1:
+        return frames[0]
+
+    tile_h, tile_w = available[0].shape[:2]
+    rows, cols = tile_layout(len(frames))
+
+    canvas = np.zeros((rows * tile_h, cols * tile_w, 3), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        if frame is None:
+            continue
+        r, c = divmod(i, cols)
+        if frame.shape[:2] != (tile_h, tile_w):
+            frame = cv2.resize(frame, (tile_w, tile_h), interpolation=cv2.INTER_AREA)
+        canvas[r * tile_h:(r + 1) * tile_h, c * tile_w:(c + 1) * tile_w] = frame
+    return canvas
+
+
+def tile_points_to_camera(points: List[Dict[str, float]], count: int) -> Tuple[int, List[Dict[str, float]]]:
+    """
+    tile_frames()로 합친 격자 이미지 전체에 대한 0~1 비율 좌표를, 다각형 중심이 놓인 타일의 카메라 기준 비율 좌표로 변환합니다.
+    (다중 카메라 격자 영상 위에 그린 구역을 카메라별 구역으로 저장하기 위해 사용)
+
+    Args:
+        points: 격자 이미지 기준 비율 좌표 [{"x", "y"}, ...]
+        count: 격자에 배치된 카메라 수
+
+    Returns:
+        (타일 인덱스, 그 타일 기준 비율 좌표 목록). 타일 밖으로 나간 점은 타일 경계로 자릅니다.
+
+    Raises:
+        ValueError: 다각형 중심이 카메라가 없는 빈 칸에 놓인 경우
+    """
+    rows, cols = tile_layout(count)
+    xy = np.array([[p["x"], p["y"]] for p in points], dtype=np.float64)
+    cx, cy = xy.mean(axis=0)
+    col = min(max(int(cx * cols), 0), cols - 1)
+    row = min(max(int(cy * rows), 0), rows - 1)
+    index = row * cols + col
+    if index >= count:
+        raise ValueError("구역의 중심이 카메라 영상이 없는 빈 칸에 있습니다.")
+    local = np.clip(xy * [cols, rows] - [col, row], 0.0, 1.0)
+    return index, [{"x": float(x), "y": float(y)} for x, y in local]
@@ -0,0 +1,55 @@
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+
+import numpy as np
+
+@dataclass
+class FrameEnvelope:
+    """
+    프레임과 캡처 시점 정보를 함께 전달하는 경량 봉투.
+    입력 → 탐지 → 로직 → 제어의 모든 단계가 이 정보를 넘겨받아,
+    카메라 캡처부터 릴레이 명령까지의 종단 지연 시간을 이벤트별로 측정할 수 있게 합니다.
+    """
+    frame: np.ndarray
+    capture_ts: float              # 캡처 시각 (time.monotonic() 기준, 같은 프로세스 안에서만 비교 가능)
+    seq: int                       # 카메라별 프레임 순번
+    camera_id: Optional[str] = None
+    duplicate: bool = False        # 직전 프레임과 픽셀이 동일한지 (입력 계층의 프레임 지문 비교 결과)
+    frozen_for: float = 0.0        # 동일 프레임이 이어진 시간 (초)
+    stale: bool = False            # 동일 프레임이 임계 시간 이상 이어져 영상이 멈춘 것으로 판단되는지
+
+    @property
+    def shape(self) -> tuple:
+        """프레임 형태 (height, width, channels)."""
+        return self.frame.shape
+
+    def age_ms(self, now: float = None) -> float:
+        """캡처 이후 경과 시간(ms)을 반환합니다."""
+        return ((now if now is not None else time.monotonic()) - self.capture_ts) * 1000
+
+    def meta(self) -> Dict[str, Any]:
+        """프레임 데이터를 제외한 메타 정보를 반환합니다. (액션/로그 이벤트에 첨부용)"""
+        return {
+            "seq": self.seq,
+            "camera_id": self.camera_id,
+            "capture_ts": self.capture_ts,
+            "shape": list(self.frame.shape),
+            "duplicate": self.duplicate,
+            "frozen_for": round(self.frozen_for, 3),
+            "stale": self.stale,
+        }
+
+
+def latency_ms(frame_meta: Optional[Dict[str, Any]], now: float = None) -> Optional[float]:
+    """frame_meta의 캡처 시각으로부터 현재까지의 지연 시간(ms)을 계산합니다. 메타 정보가 없으면 None."""
+    if not frame_meta or frame_meta.get("capture_ts") is None:
+        return None
+    return round(((now if now is not None else time.monotonic()) - frame_meta["capture_ts"]) * 1000, 2)
+
+
+def frame_event_details(frame_meta: Optional[Dict[str, Any]], now: float = None) -> Optional[Dict[str, Any]]:
+    """로그 이벤트의 details['frame']에 첨부할 캡처 정보와 현재까지의 지연 시간(latency_ms). 메타 정보가 없으면 None."""
+    if frame_meta is None:
+        return None
+    return {**frame_meta, "latency_ms": latency_ms(frame_meta, now)}
@@ -0,0 +1,193 @@
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+from core.frame_envelope import FrameEnvelope
+
+_ALIGN = 64
+
+
+def _align(size: int) -> int:
+    return (size + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class SharedFrameRing:
+    """
+    multiprocessing.shared_memory 위에 고정 형태의 프레임 슬롯을 원형으로 배치한 프레임 링.
+    캡처 프로세스 하나가 프레임을 게시하고, 하나 이상의 추론 프로세스가 피클링/복사 없이 읽습니다.
+
+    메모리 배치: [게시 횟수][슬롯별 순번][슬롯별 캡처 시각][프레임 슬롯 x N]
+    슬롯 순번은 seqlock 방식으로, 쓰는 중에는 홀수(2n+1), 쓰기가 끝나면 짝수(2n+2)가 됩니다.
+    읽는 쪽은 이 값으로 찢어진(쓰는 도중의) 프레임을 걸러내고, 제로 카피 뷰가 아직 유효한지 확인합니다.
+    """
+
+    def __init__(self, name: Optional[str], shape: Tuple[int, ...], dtype=np.uint8, slots: int = 4,
+                 create: bool = False, camera_id: Optional[str] = None):
+        """
+        직접 호출하기보다 create() / attach()를 사용하세요.
+
+        :param name: 공유 메모리 이름 (create=True이고 None이면 자동 생성)
+        :param shape: 프레임 형태 (height, width, channels)
+        :param dtype: 프레임 자료형
+        :param slots: 슬롯 수. 읽는 쪽이 처리하는 동안 최대 slots-1 프레임까지 덮어쓰이지 않습니다.
+        :param create: True면 새 공유 메모리를 만들고, False면 기존 메모리에 연결합니다.
+        :param camera_id: 읽은 FrameEnvelope에 기록할 카메라 ID
+        """
+        if slots < 2:
+            raise ValueError("slots는 2 이상이어야 합니다.")
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.slots = slots
+        self.camera_id = camera_id
+        self.is_owner = create
+
+        frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        self._slot_stride = _align(frame_bytes)
+        counter_offset = 0
+        seq_offset = _align(8)
+        ts_offset = seq_offset + _align(8 * slots)
+        frames_offset = ts_offset + _align(8 * slots)
+        total_size = frames_offset + self._slot_stride * slots
+
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=total_size if create else 0)
+        if not create:
+            # 연결만 한 프로세스도 resource_tracker에 등록되어, 종료 시 생산자의 공유 메모리를 unlink해 버립니다.
+            # 정리는 생성한 프로세스(unlink)의 책임이므로 연결한 쪽은 추적 대상에서 뺍니다.
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+        if self.shm.size < total_size:
+            self.shm.close()
+            raise ValueError(f"공유 메모리 '{name}'의 크기({self.shm.size})가 요청한 링 구성({total_size})보다 작습니다.")
+        self.name = self.shm.name
+
+        buf = self.shm.buf
+        self._write_count = np.ndarray((1,), dtype=np.int64, buffer=buf, offset=counter_offset)
+        self._slot_seq = np.ndarray((slots,), dtype=np.int64, buffer=buf, offset=seq_offset)
+        self._slot_ts = np.ndarray((slots,), dtype=np.float64, buffer=buf, offset=ts_offset)
+        self._frames = [
+            np.ndarray(self.shape, dtype=self.dtype, buffer=buf, offset=frames_offset + i * self._slot_stride)
+            for i in range(slots)
+        ]
+
+        if create:
+            self._write_count[0] = 0
+            self._slot_seq[:] = 0
+            self._slot_ts[:] = 0.0
+
+    @classmethod
+    def create(cls, shape: Tuple[int, ...], dtype=np.uint8, slots: int = 4, name: Optional[str] = None,
+               camera_id: Optional[str] = None) -> "SharedFrameRing":
+        """새 프레임 링을 생성합니다. (캡처 프로세스 쪽)"""
+        return cls(name, shape, dtype=dtype, slots=slots, create=True, camera_id=camera_id)
+
+    @classmethod
+    def attach(cls, name: str, shape: Tuple[int, ...], dtype=np.uint8, slots: int = 4,
+               camera_id: Optional[str] = None) -> "SharedFrameRing":
+        """이미 생성된 프레임 링에 연결합니다. (추론 프로세스 쪽)"""
+        return cls(name, shape, dtype=dtype, slots=slots, create=False, camera_id=camera_id)
+
+    def spec(self) -> dict:
+        """다른 프로세스가 attach()에 넘길 연결 정보를 반환합니다. (프로세스 인자로 전달용)"""
+        return {"name": self.name, "shape": self.shape, "dtype": self.dtype.str,
+                "slots": self.slots, "camera_id": self.camera_id}
+
+    # ------------------------------------------------------------------
+    # 쓰기 (단일 생산자)
+    # ------------------------------------------------------------------
+    def publish(self, frame: np.ndarray, capture_ts: Optional[float] = None) -> int:
+        """
+        프레임을 다음 슬롯에 복사하고 게시합니다. 생산자는 하나여야 합니다.
+        :return: 게시된 프레임 순번 (1부터 시작)
+        """
+        if frame.shape != self.shape:
+            raise ValueError(f"프레임 형태 {frame.shape}가 링의 형태 {self.shape}와 다릅니다.")
+        seq = int(self._write_count[0]) + 1
+        slot = (seq - 1) % self.slots
+
+        self._slot_seq[slot] = 2 * seq - 1  # 쓰는 중 표시
+        np.copyto(self._frames[slot], frame, casting="unsafe")
+        self._slot_ts[slot] = time.monotonic() if capture_ts is None else capture_ts
+        self._slot_seq[slot] = 2 * seq      # 쓰기 완료
+        self._write_count[0] = seq
+        return seq
+
+    def publish_envelope(self, envelope: FrameEnvelope) -> int:
+        """FrameEnvelope의 프레임과 캡처 시각을 그대로 게시합니다."""
+        return self.publish(envelope.frame, envelope.capture_ts)
+
+    # ------------------------------------------------------------------
+    # 읽기 (다중 소비자)
+    # ------------------------------------------------------------------
+    @property
+    def latest_seq(self) -> int:
+        """마지막으로 게시된 프레임 순번. 아직 게시된 프레임이 없으면 0."""
+        return int(self._write_count[0])
+
+    def read(self, seq: int, copy: bool = False) -> Optional[FrameEnvelope]:
+        """
+        지정한 순번의 프레임을 읽습니다.
+        copy=False면 공유 메모리를 직접 가리키는 뷰를 반환하므로, 사용 후 is_valid()로 덮어쓰이지 않았는지 확인하세요.
+        :return: FrameEnvelope. 이미 덮어쓰였거나 쓰는 중이면 None.
+        """
+        if seq <= 0:
+            return None
+        slot = (seq - 1) % self.slots
+        if self._slot_seq[slot] != 2 * seq:
+            return None
+
+        frame = self._frames[slot]
+        if copy:
+            frame = frame.copy()
+        capture_ts = float(self._slot_ts[slot])
+
+        # 읽는 동안 생산자가 슬롯을 덮어쓰지 않았는지 다시 확인
+        if self._slot_seq[slot] != 2 * seq:
+            return None
+        return FrameEnvelope(frame=frame, capture_ts=capture_ts, seq=seq, camera_id=self.camera_id)
+
+    def read_latest(self, copy: bool = False) -> Optional[FrameEnvelope]:
+        """가장 최근에 게시된 프레임을 읽습니다. 게시된 프레임이 없으면 None."""
+        return self.read(self.latest_seq, copy=copy)
+
+    def wait_next(self, last_seq: int, timeout: float = 1.0, poll_interval: float = 0.001,
+                  copy: bool = False) -> Optional[FrameEnvelope]:
+        """
+        last_seq보다 새로운 프레임이 게시될 때까지 기다린 뒤 최신 프레임을 반환합니다.
+        처리가 늦어 밀린 중간 프레임은 건너뜁니다. timeout 동안 새 프레임이 없으면 None.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.latest_seq > last_seq:
+                envelope = self.read_latest(copy=copy)
+                if envelope is not None:
+                    return envelope
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def is_valid(self, envelope: FrameEnvelope) -> bool:
+        """제로 카피로 읽은 프레임이 아직 덮어쓰이지 않았는지 확인합니다."""
+        slot = (envelope.seq - 1) % self.slots
+        return bool(self._slot_seq[slot] == 2 * envelope.seq)
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+    def close(self):
+        """이 프로세스의 공유 메모리 연결을 닫습니다. 반환했던 제로 카피 뷰는 더 이상 사용할 수 없습니다."""
+        self._frames = []
+        self._write_count = self._slot_seq = self._slot_ts = None
+        self.shm.close()
+
+    def unlink(self):
+        """공유 메모리를 시스템에서 제거합니다. 생성한 프로세스가 모든 소비자 종료 후 호출합니다."""
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if self.is_owner:
+            self.unlink()
@@ -0,0 +1,133 @@
+import numpy as np
+from typing import List, Tuple
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """(N, 4)와 (M, 4) xyxy 박스 사이의 (N, M) IoU 행렬."""
+    boxes_a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    boxes_b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    inter = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    return inter / np.maximum(area_a[:, None] + area_b[None, :] - inter, 1e-9)
+
+
+def boxes_to_array(boxes) -> np.ndarray:
+    """
+    YOLO 결과의 boxes(ultralytics Boxes 또는 OnnxBoxes)를 한 번의 .cpu().numpy() 전송으로
+    (N, 6) [x1, y1, x2, y2, conf, cls] float32 배열로 변환합니다.
+    (추적 결과처럼 id 열이 포함된 7열 데이터도 conf/cls는 항상 마지막 두 열)
+    """
+    if boxes is None or len(boxes) == 0:
+        return np.zeros((0, 6), dtype=np.float32)
+    data = boxes.data.cpu().numpy()
+    return np.column_stack([data[:, :4], data[:, -2:]]).astype(np.float32, copy=False)
+
+
+def assign_boxes(ious: np.ndarray, threshold: float, strategy: str = "greedy") -> List[Tuple[int, int]]:
+    """
+    IoU 행렬에서 행(예: 사람)과 열(예: 탐지 박스)을 일대일로 짝지어 (행, 열) 목록을 반환합니다.
+    IoU가 threshold 미만인 쌍은 짝짓지 않습니다.
+
+    Args:
+        strategy: 'greedy'는 IoU가 큰 쌍부터 차례로 확정하고,
+                  'hungarian'은 IoU 합이 최대가 되는 최적 배정을 구합니다. (scipy 필요)
+    """
+    if ious.size == 0:
+        return []
+    if strategy == "hungarian":
+        from scipy.optimize import linear_sum_assignment
+        rows, cols = linear_sum_assignment(-ious)
+        return [(int(r), int(c)) for r, c in zip(rows, cols) if ious[r, c] >= threshold]
+    if strategy != "greedy":
+        raise ValueError(f"알 수 없는 배정 방식입니다: {strategy} (사용 가능: 'greedy', 'hungarian')")
+
+    pairs = []
+    used_rows, used_cols = set(), set()
+    for flat_index in np.argsort(-ious, axis=None):
+        r, c = np.unravel_index(flat_index, ious.shape)
+        if ious[r, c] < threshold:
+            break
+        if r in used_rows or c in used_cols:
+            continue
+        used_rows.add(r)
+        used_cols.add(c)
+        pairs.append((int(r), int(c)))
+    return pairs
+
+
+def suppress_duplicates(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float) -> np.ndarray:
+    """
+    NMS: 신뢰도가 높은 박스부터 남기고, 이미 남긴 박스와 IoU가 iou_threshold를 넘는 박스는 버립니다.
+    남긴 박스의 인덱스 배열을 신뢰도 내림차순으로 반환합니다.
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    if not len(boxes):
+        return np.zeros(0, dtype=int)
+    order = np.argsort(-np.asarray(scores), kind="stable")
+    ious = box_iou(boxes, boxes)
+    suppressed = np.zeros(len(boxes), dtype=bool)
+    keep = []
+    for index in order:
+        if suppressed[index]:
+            continue
+        keep.append(index)
+        suppressed |= ious[index] > iou_threshold
+    return np.array(keep, dtype=int)
+
+
+def _clip_polygons(polygons: np.ndarray, counts: np.ndarray, axis: int, bounds: np.ndarray, keep_below: bool):
+    """
+    Sutherland–Hodgman 한 단계: (N, M, 2) 다각형 묶음을 각자의 경계 (axis 좌표 <= 또는 >= bounds[i])로 자릅니다.
+    빈 자리는 마지막 유효 꼭짓점을 반복해 채우므로 (면적 0인 변) 모든 다각형을 한 배열로 처리할 수 있습니다.
+    """
+    current = polygons
+    previous = np.roll(polygons, 1, axis=1)
+    bounds = bounds[:, None]
+    if keep_below:
+        current_in, previous_in = current[..., axis] <= bounds, previous[..., axis] <= bounds
+    else:
+        current_in, previous_in = current[..., axis] >= bounds, previous[..., axis] >= bounds
+
+    # 변 (previous → current)가 경계를 가로지르는 지점
+    delta = current[..., axis] - previous[..., axis]
+    t = np.divide(bounds - previous[..., axis], delta, out=np.zeros_like(delta), where=delta != 0)
+    crossing = previous + t[..., None] * (current - previous)
+
+    # 변마다 [교차점, 현재 꼭짓점] 두 칸을 출력 후보로 두고 유효한 칸만 앞으로 모음
+    candidates = np.stack([crossing, current], axis=2).reshape(len(polygons), -1, 2)
+    valid = np.stack([current_in != previous_in, current_in], axis=2).reshape(len(polygons), -1)
+    valid &= np.arange(valid.shape[1] // 2).repeat(2)[None, :] < counts[:, None]
+    new_counts = valid.sum(axis=1)
+    width = max(int(new_counts.max()), 1)
+    order = np.argsort(~valid, axis=1, kind="stable")[:, :width]
+    # 유효 개수를 넘는 자리는 마지막 유효 꼭짓점으로 채움
+    order = np.take_along_axis(order, np.minimum(np.arange(width)[None, :], np.maximum(new_counts - 1, 0)[:, None]), axis=1)
+    return np.take_along_axis(candidates, order[..., None], axis=1), new_counts
+
+
+def polygon_box_intersection_area(polygon: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """
+    다각형과 (N, 4) xyxy 박스 각각의 교차 면적을 (N,) 배열로 반환합니다.
+    다각형을 박스의 네 변으로 차례로 잘라내고(Sutherland–Hodgman) 신발끈 공식으로 면적을 구하므로,
+    픽셀 수와 관계없이 꼭짓점 수에만 비례하는 비용으로 정확한 면적을 계산합니다. (오목 다각형도 가능)
+
+    Args:
+        polygon: 모든 박스에 공통인 (V, 2) 다각형, 또는 박스마다 다른 (N, V, 2) 다각형.
+                 꼭짓점 수가 다른 다각형은 마지막 꼭짓점을 반복해 V개로 맞춥니다.
+    """
+    polygon = np.asarray(polygon, dtype=np.float64)
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    if len(boxes) == 0 or polygon.shape[-2] < 3:
+        return np.zeros(len(boxes))
+
+    polygons = np.broadcast_to(polygon, (len(boxes),) + polygon.shape[-2:])
+    counts = np.full(len(boxes), polygon.shape[-2])
+    for axis, column, keep_below in ((0, 0, False), (0, 2, True), (1, 1, False), (1, 3, True)):
+        polygons, counts = _clip_polygons(polygons, counts, axis, boxes[:, column], keep_below)
+
+    x, y = polygons[..., 0], polygons[..., 1]
+    area = 0.5 * np.abs(np.sum(x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y, axis=1))
+    return np.where(counts >= 3, area, 0.0)
@@ -1,70 +1,289 @@
 
+import json
 import cv2
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 import threading
 from core.drawing_utils import put_text_korean
+from .box_utils import polygon_box_intersection_area
+
+class ZoneSnapshot:
+    """
+    특정 시점의 위험 구역 목록 (변경 불가, 버전 번호 포함).
+    구역이 바뀌면 DangerZoneMapper가 새 스냅샷을 만들어 참조를 한 번에 교체하므로,
+    읽는 쪽은 잠금 없이 스냅샷 하나를 잡고 끝까지 일관된 구역 목록을 사용합니다.
+    구역 dict와 그 안의 배열은 여러 스냅샷이 공유하므로 수정하면 안 됩니다. (배열은 읽기 전용)
+    """
+
+    def __init__(self, version: int, entries: List[Tuple[Any, str, Dict[str, Any]]],
+                 scaled: Dict[Tuple[int, int], Tuple[Dict[str, Any], ...]] = None):
+        """
+        Args:
+            version: 스냅샷 버전 (구역이 바뀔 때마다 1씩 증가)
+            entries: (구역 ID, 원본 데이터 지문, 파싱된 구역) 목록. 구역 순서를 유지합니다.
+            scaled: 해상도별로 변환해 둔 구역 목록 (이전 스냅샷에서 이어받은 것)
+        """
+        self.version = version
+        self.entries = tuple(entries)
+        self.zones = tuple(zone for _, _, zone in self.entries)
+        # 구역 ID → (지문, 구역): 다음 업데이트에서 바뀌지 않은 구역을 재사용하는 데 사용
+        self.sources: Dict[Any, Tuple[str, Dict[str, Any]]] = {}
+        for zone_id, fingerprint, zone in self.entries:
+            self.sources.setdefault(zone_id, (fingerprint, zone))
+        # 해상도별 변환 결과 캐시. 읽는 쪽이 채울 수 있지만 같은 값을 계산하므로 경쟁해도 무해합니다.
+        self._scaled: Dict[Tuple[int, int], Tuple[Dict[str, Any], ...]] = dict(scaled or {})
+
 
 class DangerZoneMapper:
     """다각형 위험 구역을 설정하고, 사람의 침입 여부를 정교하게 판단합니다.
        이 클래스는 외부로부터 구역 데이터를 수동적으로 받아 업데이트됩니다.
+       구역은 변경 불가 스냅샷(ZoneSnapshot)으로 보관되며, 업데이트는 구역 ID 기준 차이만 반영하여
+       바뀐 구역만 다시 파싱한 새 스냅샷으로 교체됩니다. (침입 검사/시각화는 잠금 없이 동작)
     """
 
-    def __init__(self):
+    # 정규화 좌표 구역을 프레임 크기 정보 없이 픽셀로 변환할 때 사용하는 기본 해상도 (VideoStream 기본값과 동일)
+    DEFAULT_FRAME_SIZE = (1280, 720)
+    # 사람 bbox와 구역의 겹침 면적 계산 방식
+    # - polygon: 구역 다각형을 bbox로 잘라낸 정확한 면적 (꼭짓점 수에 비례하는 비용)
+    # - raster: 구역 래스터의 누적합 테이블 조회 (겹치는 픽셀 수, 화면 밖 영역은 제외)
+    OVERLAP_METHODS = ("polygon", "raster")
+
+    def __init__(self, reference_size: Tuple[int, int] = None, overlap_method: str = "polygon"):
         """
         위험 구역 매퍼를 초기화합니다.
-        """
-        self.danger_zones = []
-        self._lock = threading.Lock()  # 스레드 안전성을 위한 잠금 장치
-        logger.info("DangerZoneMapper 초기화 완료. (수동 업데이트 모드)")
 
-    
+        Args:
+            reference_size: 픽셀 좌표로 들어오는 구역이 그려진 기준 해상도 (width, height).
+                            지정 시 구역을 정규화 좌표로 저장하여 어떤 프레임 해상도에서도 같은 영역을 가리키게 합니다.
+                            None이면 픽셀 좌표 구역은 그대로 사용됩니다.
+                            ('normalized': True로 보낸 0~1 비율 좌표 구역은 항상 정규화 좌표로 보관됨)
+            overlap_method: 겹침 면적 계산 방식 ('polygon' | 'raster', OVERLAP_METHODS 참고)
+        """
+        if overlap_method not in self.OVERLAP_METHODS:
+            raise ValueError(f"알 수 없는 겹침 계산 방식입니다: {overlap_method} (사용 가능: {self.OVERLAP_METHODS})")
+        self.overlap_method = overlap_method
+        self.reference_size = tuple(reference_size) if reference_size else None
+        self._snapshot = ZoneSnapshot(0, [])
+        self._lock = threading.Lock()  # 업데이트끼리만 직렬화 (읽는 쪽은 스냅샷 참조만 사용)
+        logger.info(f"DangerZoneMapper 초기화 완료. (수동 업데이트 모드, 겹침 계산: {overlap_method})")
+
+    @property
+    def danger_zones(self) -> Tuple[Dict[str, Any], ...]:
+        """현재 스냅샷의 구역 목록 (기준 해상도 픽셀 좌표)."""
+        return self._snapshot.zones
+
+    @property
+    def snapshot(self) -> ZoneSnapshot:
+        """현재 구역 스냅샷. 여러 번 조회해야 하면 한 번 받아 두고 사용하면 같은 버전을 보장합니다."""
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
 
     def update_zones_from_data(self, zones_data: List[Dict[str, Any]]):
-        """외부에서 받은 데이터로 메모리의 위험 구역을 전체 업데이트합니다."""
-        logger.info(f"DangerZoneMapper를 외부 데이터로 업데이트합니다. {len(zones_data)}개의 구역을 로드합니다.")
-        new_zones = []
-        for zone_data in zones_data:
-            # add_zone 메소드를 재활용하여 파싱 및 추가 로직을 수행합니다.
-            self.add_zone(zone_data, target_list=new_zones)
-        
+        """
+        외부에서 받은 전체 구역 목록으로 위험 구역을 갱신합니다.
+        현재 스냅샷과 구역 ID별로 비교하여 추가/변경된 구역만 파싱하고, 목록에 없는 구역은 제거합니다.
+        """
         with self._lock:
-            self.danger_zones = new_zones
-        logger.success(f"DangerZoneMapper가 {len(self.danger_zones)}개의 위험 구역으로 업데이트되었습니다.")
-
-    def add_zone(self, zone_data: Dict[str, Any], target_list: List = None):
-        """메모리에 위험 구역을 추가합니다. (DB 저장 X)
-           target_list를 지정하여 특정 리스트에 추가할 수 있습니다.
+            current = self._snapshot
+            entries, parsed, seen = [], 0, set()
+            for zone_data in zones_data:
+                zone_id, fingerprint = zone_data.get('id'), self._fingerprint(zone_data)
+                previous = current.sources.get(zone_id) if zone_id not in seen else None
+                seen.add(zone_id)
+                if previous is not None and previous[0] == fingerprint:
+                    entries.append((zone_id, fingerprint, previous[1]))
+                    continue
+                zone = self._parse_zone(zone_data)
+                parsed += 1
+                if zone is not None:
+                    entries.append((zone_id, fingerprint, zone))
+            removed = len({key for key, _, _ in current.entries} - seen)
+            self._commit(current, entries, f"{len(zones_data)}개 수신, {parsed}개 파싱, {removed}개 제거")
+
+    def apply_zone_changes(self, upserts: List[Dict[str, Any]] = None, removed_ids: List[Any] = None):
+        """
+        구역 일부만 추가/변경(upserts)하거나 제거(removed_ids)합니다. 나머지 구역은 그대로 유지됩니다.
+        같은 ID의 구역은 제자리에서 교체되고, 새 ID는 목록 끝에 추가됩니다.
         """
+        with self._lock:
+            current = self._snapshot
+            entries = list(current.entries)
+            for zone_data in upserts or []:
+                zone = self._parse_zone(zone_data)
+                if zone is None:
+                    continue
+                entry = (zone_data.get('id'), self._fingerprint(zone_data), zone)
+                index = next((i for i, (zone_id, _, _) in enumerate(entries) if zone_id == entry[0]), None)
+                if index is None:
+                    entries.append(entry)
+                else:
+                    entries[index] = entry
+            removed = set(removed_ids or [])
+            entries = [entry for entry in entries if entry[0] not in removed]
+            self._commit(current, entries, f"{len(upserts or [])}개 추가/변경, {len(removed)}개 제거 요청")
+
+    def add_zone(self, zone_data: Dict[str, Any]):
+        """메모리에 위험 구역을 추가합니다. (DB 저장 X, 같은 ID의 구역이 있으면 교체)"""
+        self.apply_zone_changes(upserts=[zone_data])
+
+    def _commit(self, current: ZoneSnapshot, entries: List[Tuple[Any, str, Dict[str, Any]]], summary: str):
+        """구역이 바뀌었으면 새 버전의 스냅샷을 만들어 교체합니다. (self._lock 안에서 호출)"""
+        if len(entries) == len(current.entries) and all(
+                new[2] is old[2] for new, old in zip(entries, current.entries)):
+            logger.info(f"위험 구역 변경 없음 (v{current.version}, {summary}).")
+            return
+
+        # 바뀌지 않은 구역은 이전 스냅샷에서 해상도별로 변환해 둔 결과를 이어받음
+        zones = [zone for _, _, zone in entries]
+        scaled = {}
+        for frame_size, previous_scaled in list(current._scaled.items()):
+            reusable = {id(base): zone for base, zone in zip(current.zones, previous_scaled)}
+            scaled[frame_size] = tuple(reusable.get(id(zone)) or self._scale_zone(zone, frame_size) for zone in zones)
+
+        self._snapshot = ZoneSnapshot(current.version + 1, entries, scaled)
+        logger.success(f"위험 구역 스냅샷 v{self._snapshot.version}: {len(entries)}개 구역 ({summary}).")
+
+    @staticmethod
+    def _fingerprint(zone_data: Dict[str, Any]) -> str:
+        """구역 원본 데이터가 바뀌었는지 비교하기 위한 지문."""
+        return json.dumps(zone_data, sort_keys=True, default=str)
+
+    def _parse_zone(self, zone_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """구역 원본 데이터를 파싱하여 미리 계산한 기하 정보를 포함한 구역을 만듭니다. 잘못된 데이터는 None."""
         try:
             zone_id = zone_data.get('id', 'N/A')
             zone_name = zone_data.get('name', 'Unknown Zone')
             points_list = [[p['x'], p['y']] for p in zone_data['points']]
-            points = np.array(points_list, dtype=np.int32)
+            raw_points = np.array(points_list, dtype=np.float32)
             iou_threshold = zone_data.get('iou_threshold', 0.2)
 
-            if points.size == 0:
+            if raw_points.size == 0:
                 logger.warning(f"Zone '{zone_name}' ({zone_id}) has no points.")
-                return
+                return None
+
+            # 정규화 좌표(0~1) 결정: 'normalized'로 명시된 비율 좌표이거나, 기준 해상도가 설정된 경우
+            # (좌표 값의 크기로 비율/픽셀을 추측하지 않음)
+            if zone_data.get('normalized', False):
+                points_norm = raw_points
+            elif self.reference_size is not None:
+                points_norm = raw_points / np.array(self.reference_size, dtype=np.float32)
+            else:
+                points_norm = None  # 레거시 픽셀 좌표 구역
+
+            if points_norm is not None:
+                points_norm.setflags(write=False)
+                points = self._denormalize(points_norm, self.reference_size or self.DEFAULT_FRAME_SIZE)
+            else:
+                points = raw_points.astype(np.int32)
 
-            zone = {
+            return {
                 "id": zone_id,
                 "name": zone_name,
-                "points": points,
+                # 구역이 속한 카메라 ID. None이면 모든 카메라에 적용됩니다.
+                "camera_id": zone_data.get('camera_id'),
+                "points_norm": points_norm,
                 "iou_threshold": iou_threshold,
-                "bounding_rect": cv2.boundingRect(points)
+                **self._zone_geometry(points)
             }
-            
-            # target_list가 주어지면 거기에 추가, 아니면 self.danger_zones에 추가
-            if target_list is not None:
-                target_list.append(zone)
-            else:
-                with self._lock:
-                    self.danger_zones.append(zone)
 
         except (KeyError, TypeError) as e:
             logger.error(f"위험 구역 데이터에 필수 키가 없습니다: {e}. 데이터: {zone_data}")
+            return None
+
+    @staticmethod
+    def _denormalize(points_norm: np.ndarray, frame_size: Tuple[int, int]) -> np.ndarray:
+        """정규화 좌표를 주어진 프레임 크기 (width, height)의 픽셀 좌표로 변환합니다."""
+        return np.round(points_norm * np.array(frame_size, dtype=np.float32)).astype(np.int32)
+
+    def _zone_geometry(self, points: np.ndarray) -> Dict[str, Any]:
+        """
+        픽셀 좌표 꼭짓점에서 침입 판정에 쓰는 구역 정보를 미리 계산합니다. (구역 로드/해상도 변환 시 1회)
+        스냅샷 간에 공유되므로 배열은 읽기 전용으로 만듭니다.
+        """
+        geometry = {
+            "points": points,
+            # 변 배열 [x1, y1, x2, y2] (i번째 꼭짓점 → 다음 꼭짓점): 포인트 검사를 NumPy로 일괄 처리
+            "edges": np.concatenate([points, np.roll(points, -1, axis=0)], axis=1).astype(np.float64),
+            # 구역 래스터의 누적합 테이블: bbox와의 겹침 면적을 네 번의 조회로 계산 (raster 방식)
+            "area_table": self._build_area_table(points) if self.overlap_method == "raster" else None,
+        }
+        for array in geometry.values():
+            if array is not None:
+                array.setflags(write=False)
+        geometry["bounding_rect"] = cv2.boundingRect(points)
+        return geometry
+
+    @staticmethod
+    def _build_area_table(points: np.ndarray) -> np.ndarray:
+        """
+        구역 다각형을 bounding_rect 크기의 마스크에 한 번 래스터화하고, 그 누적합 테이블(summed-area table)을 반환합니다.
+        table[y, x]는 bounding_rect 좌상단 기준 (0..x-1, 0..y-1) 영역에 포함된 구역 픽셀 수입니다.
+        """
+        zx, zy, zw, zh = cv2.boundingRect(points)
+        mask = np.zeros((zh, zw), dtype=np.uint8)
+        cv2.fillPoly(mask, [points], 1, offset=(-zx, -zy))
+        return cv2.integral(mask, sdepth=cv2.CV_32S)
+
+    @staticmethod
+    def _raster_overlap_areas(bboxes: np.ndarray, zone: Dict[str, Any]) -> np.ndarray:
+        """
+        사람 bbox들(양 끝 픽셀 포함)과 구역 다각형이 겹치는 픽셀 수를 누적합 테이블 네 번 조회로 계산합니다.
+        (bbox와 구역을 각각 fillPoly로 그려 AND한 뒤 픽셀을 센 값과 같음)
+        """
+        bboxes = np.asarray(bboxes, dtype=np.int64).reshape(-1, 4)
+        zx, zy, zw, zh = zone['bounding_rect']
+        # 구역 래스터 좌표로 변환 후 래스터 범위와 음수 좌표(화면 밖)를 잘라냄
+        x1 = np.clip(np.maximum(bboxes[:, 0], 0) - zx, 0, zw)
+        y1 = np.clip(np.maximum(bboxes[:, 1], 0) - zy, 0, zh)
+        x2 = np.clip(bboxes[:, 2] + 1 - zx, 0, zw)
+        y2 = np.clip(bboxes[:, 3] + 1 - zy, 0, zh)
+        x2, y2 = np.maximum(x2, x1), np.maximum(y2, y1)
+        table = zone['area_table']
+        return (table[y2, x2] - table[y1, x2] - table[y2, x1] + table[y1, x1]).astype(np.float64)
+
+    def _zone_overlap_areas(self, bboxes: np.ndarray, zone: Dict[str, Any]) -> np.ndarray:
+        """사람 bbox (N, 4)들과 구역의 겹침 면적 (N,)을 설정된 방식으로 한 번에 계산합니다."""
+        if self.overlap_method == "raster":
+            return self._raster_overlap_areas(bboxes, zone)
+        return polygon_box_intersection_area(zone['points'], bboxes)
+
+    def _scale_zone(self, zone: Dict[str, Any], frame_size: Tuple[int, int]) -> Dict[str, Any]:
+        """정규화 좌표 구역을 주어진 프레임 크기의 픽셀 좌표 구역으로 변환합니다. (레거시 픽셀 구역은 그대로)"""
+        if zone.get('points_norm') is None:
+            return zone
+        return {**zone, **self._zone_geometry(self._denormalize(zone['points_norm'], frame_size))}
+
+    def _zones_at_frame_size(self, frame_size: Tuple[int, int] = None,
+                             snapshot: ZoneSnapshot = None) -> Tuple[Dict[str, Any], ...]:
+        """
+        정규화 좌표 구역을 주어진 프레임 크기의 픽셀 좌표로 변환한 구역 목록을 반환합니다.
+        해상도별로 스냅샷마다 한 번만 계산하여 캐시합니다. (잠금 없음)
+        """
+        snapshot = snapshot or self._snapshot
+        if frame_size is None:
+            return snapshot.zones
+
+        frame_size = (int(frame_size[0]), int(frame_size[1]))
+        scaled = snapshot._scaled.get(frame_size)
+        if scaled is None:
+            scaled = tuple(self._scale_zone(zone, frame_size) for zone in snapshot.zones)
+            snapshot._scaled[frame_size] = scaled
+        return scaled
+
+    def get_zones_for_camera(self, camera_id: str = None, frame_size: Tuple[int, int] = None) -> List[Dict[str, Any]]:
+        """
+        특정 카메라에 적용되는 위험 구역 목록을 반환합니다.
+        camera_id가 None이면 (단일 카메라 구성) 모든 구역을 반환합니다.
+        frame_size (width, height)가 주어지면 구역 좌표를 해당 해상도의 픽셀 좌표로 변환합니다.
+        """
+        zones = self._zones_at_frame_size(frame_size)
+        if camera_id is None:
+            return list(zones)
+        return [zone for zone in zones if zone.get('camera_id') in (None, camera_id)]
 
     def check_person_in_zone(self, person_bbox: List[int], zone: Dict[str, Any]) -> Tuple[bool, float]:
         """
@@ -80,6 +299,15 @@ class DangerZoneMapper:
         Returns:
             (침입 여부, 신뢰도(IoU 또는 1.0))
         """
+        result = self._check_by_points(person_bbox, zone)
+        if result is None:
+            overlap_area = self._zone_overlap_areas(np.array([person_bbox]), zone)[0]
+            result = self._check_by_overlap(person_bbox, zone, overlap_area)
+        return result
+
+    @staticmethod
+    def _check_by_points(person_bbox: List[int], zone: Dict[str, Any]) -> Optional[Tuple[bool, float]]:
+        """check_person_in_zone의 0~1단계. 교차 영역 계산(2단계)이 필요하면 None을 반환합니다."""
         px1, py1, px2, py2 = person_bbox
         zx, zy, zw, zh = zone['bounding_rect']
 
@@ -88,8 +316,6 @@ class DangerZoneMapper:
         if px2 < zx or px1 > zx + zw or py2 < zy or py1 > zy + zh:
             return False, 0.0
 
-        person_rect_points = np.array([[px1, py1], [px2, py1], [px2, py2], [px1, py2]], dtype=np.int32)
-
         # --- 1단계: 빠른 포인트 검사 ---
         key_points = [
             (px1, py1), (px2, py1), (px1, py2), (px2, py2), # 네 모서리
@@ -99,80 +325,153 @@ class DangerZoneMapper:
             if cv2.pointPolygonTest(zone['points'], point, False) >= 0:
                 return True, 1.0 # 주요 포인트가 하나라도 들어가면 즉시 침입으로 확정
 
-        # --- 2단계: 정교한 교차 영역(Intersection) 계산 ---
-        try:
-            person_area = (px2 - px1) * (py2 - py1)
-            if person_area == 0: return False, 0.0
-
-            # 두 다각형(사람 bbox, 위험 구역)의 교차 영역을 계산
-            # 1. 두 다각형을 모두 포함하는 빈 마스크(검은 이미지) 생성
-            mask = np.zeros((max(py2, zone['bounding_rect'][1] + zone['bounding_rect'][3]), 
-                               max(px2, zone['bounding_rect'][0] + zone['bounding_rect'][2])), dtype=np.uint8)
-            
-            # 2. 마스크에 사람의 바운딩 박스를 흰색으로 채움
-            cv2.fillPoly(mask, [person_rect_points], 255)
-            person_mask = mask.copy()
-
-            # 3. 마스크에 위험 구역 다각형을 흰색으로 채움
-            mask.fill(0)
-            cv2.fillPoly(mask, [zone['points']], 255)
-            zone_mask = mask
-
-            # 4. 두 마스크에 대해 비트 AND 연산을 수행하여 교차 영역 마스크를 얻음
-            intersection_mask = cv2.bitwise_and(person_mask, zone_mask)
+        if (px2 - px1) * (py2 - py1) == 0:
+            return False, 0.0
+        return None
 
-            # 5. 교차 영역의 면적(흰색 픽셀의 개수)을 계산
-            intersection_area = cv2.countNonZero(intersection_mask)
+    @staticmethod
+    def _check_by_overlap(person_bbox: List[int], zone: Dict[str, Any], overlap_area: float) -> Tuple[bool, float]:
+        """check_person_in_zone의 2단계: 정교한 교차 영역(Intersection) 면적으로 판단합니다."""
+        px1, py1, px2, py2 = person_bbox
+        person_area = (px2 - px1) * (py2 - py1)
 
-            # 6. 사람 면적 대비 교차 영역의 비율(IoU)을 계산
-            iou = intersection_area / person_area
+        # 사람 면적 대비 교차 영역의 비율(IoU)을 계산
+        iou = float(overlap_area) / person_area
 
-            is_in_zone = iou >= zone['iou_threshold']
-            return is_in_zone, round(iou, 2)
+        is_in_zone = iou >= zone['iou_threshold']
+        return is_in_zone, round(iou, 2)
 
-        except Exception as e:
-            logger.warning(f"교차 영역 계산 중 오류 발생: {e}")
-            return False, 0.0
+    @staticmethod
+    def _key_points(bboxes: np.ndarray) -> np.ndarray:
+        """1단계 포인트 검사에 쓰는 사람별 주요 포인트 (N, 5, 2): 네 모서리와 발 위치."""
+        x1, y1, x2, y2 = bboxes.T
+        foot_x = (x1 + x2) // 2
+        return np.stack([np.stack([x1, y1], 1), np.stack([x2, y1], 1), np.stack([x1, y2], 1),
+                         np.stack([x2, y2], 1), np.stack([foot_x, y2], 1)], axis=1)
 
-    def check_all_zones(self, persons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _points_in_polygons(points: np.ndarray, edges: np.ndarray, edge_valid: np.ndarray) -> np.ndarray:
+        """
+        (K, P, 2) 포인트가 각자 짝지어진 다각형 (K, E, 4) 변 배열의 내부 또는 경계 위에 있는지 (K, P)를 반환합니다.
+        cv2.pointPolygonTest(..., False) >= 0과 같은 판정을 교차 수(ray crossing) 검사로 한 번에 계산합니다.
+        (정수 좌표에서는 나눗셈 없이 곱셈 비교만 사용하므로 경계 판정도 정확)
+        """
+        px, py = points[:, :, None, 0], points[:, :, None, 1]
+        x1, y1, x2, y2 = (edges[:, None, :, i] for i in range(4))
+        valid = edge_valid[:, None, :]
+
+        # 오른쪽으로 뻗은 반직선과 교차하는 변의 수가 홀수면 내부
+        lhs = (px - x1) * (y2 - y1)
+        rhs = (x2 - x1) * (py - y1)
+        straddle = (y1 > py) != (y2 > py)
+        crossing = straddle & np.where(y2 > y1, lhs < rhs, lhs > rhs) & valid
+        inside = np.count_nonzero(crossing, axis=2) % 2 == 1
+
+        # 변 위의 점은 내부로 간주 (pointPolygonTest의 0 반환)
+        on_edge = ((lhs == rhs) & (np.minimum(x1, x2) <= px) & (px <= np.maximum(x1, x2)) &
+                   (np.minimum(y1, y2) <= py) & (py <= np.maximum(y1, y2)) & valid)
+        return inside | on_edge.any(axis=2)
+
+    def _pair_overlap_areas(self, bboxes: np.ndarray, zones: List[Dict[str, Any]],
+                            person_idx: np.ndarray, zone_idx: np.ndarray) -> np.ndarray:
+        """(사람, 구역) 쌍 목록의 겹침 면적. polygon 방식은 모든 쌍을 한 번의 클리핑으로 계산합니다."""
+        if self.overlap_method == "polygon":
+            # 구역마다 꼭짓점 수가 달라 마지막 꼭짓점을 반복해 맞춤
+            max_points = max(len(zone['points']) for zone in zones)
+            vertices = np.stack([np.concatenate([zone['points'], np.repeat(zone['points'][-1:], max_points - len(zone['points']), 0)])
+                                 for zone in zones])
+            return polygon_box_intersection_area(vertices[zone_idx], bboxes[person_idx])
+
+        areas = np.zeros(len(person_idx))
+        for z in np.unique(zone_idx):
+            pairs = zone_idx == z
+            areas[pairs] = self._zone_overlap_areas(bboxes[person_idx[pairs]], zones[z])
+        return areas
+
+    def check_all_zones(self, persons: List[Dict[str, Any]], camera_id: str = None,
+                        frame_size: Tuple[int, int] = None) -> List[Dict[str, Any]]:
         """
         모든 위험 구역에 대해 침입 검사를 수행하고 상세 정보를 반환합니다.
+        check_person_in_zone과 같은 판정을 모든 사람×구역 쌍에 대해 한 번에 수행합니다.
+        0. bbox 교차 행렬로 후보 쌍을 고르고, 1. 후보 쌍의 주요 포인트를 구역 변 배열로 일괄 검사한 뒤,
+        2. 포인트 검사로 확정되지 않은 쌍만 겹침 면적을 계산합니다.
 
         Args:
             persons: 감지된 사람 리스트
+            camera_id: 사람을 감지한 카메라 ID. 지정 시 해당 카메라의 구역만 검사합니다.
+            frame_size: 사람 bbox 좌표계의 프레임 크기 (width, height). 정규화 구역을 이 해상도로 변환합니다.
 
         Returns:
             위험 구역별 침입 상세 정보 리스트
         """
+        zones = self.get_zones_for_camera(camera_id, frame_size)
+        if not zones or not persons:
+            return []
+
+        bboxes = np.array([person["bbox"] for person in persons], dtype=np.float64).reshape(-1, 4)
+        rects = np.array([zone['bounding_rect'] for zone in zones], dtype=np.float64)
+        inside = np.zeros((len(persons), len(zones)), dtype=bool)
+        ious = np.zeros((len(persons), len(zones)))
+
+        # --- 0단계: 사람×구역 bbox 교차 행렬로 후보 쌍 선택 ---
+        candidate = ((bboxes[:, None, 2] >= rects[None, :, 0]) & (bboxes[:, None, 0] <= rects[None, :, 0] + rects[None, :, 2]) &
+                     (bboxes[:, None, 3] >= rects[None, :, 1]) & (bboxes[:, None, 1] <= rects[None, :, 1] + rects[None, :, 3]))
+        person_idx, zone_idx = np.nonzero(candidate)
+
+        if len(person_idx):
+            # --- 1단계: 후보 쌍의 주요 포인트를 각 구역의 변 배열로 일괄 검사 (구역마다 변 수가 달라 패딩) ---
+            max_edges = max(len(zone['edges']) for zone in zones)
+            edges = np.zeros((len(zones), max_edges, 4))
+            edge_valid = np.zeros((len(zones), max_edges), dtype=bool)
+            for z, zone in enumerate(zones):
+                edges[z, :len(zone['edges'])] = zone['edges']
+                edge_valid[z, :len(zone['edges'])] = True
+            hit = self._points_in_polygons(self._key_points(bboxes)[person_idx], edges[zone_idx],
+                                           edge_valid[zone_idx]).any(axis=1)
+            inside[person_idx[hit], zone_idx[hit]] = True
+            ious[person_idx[hit], zone_idx[hit]] = 1.0
+
+            # --- 2단계: 포인트 검사로 확정되지 않은 쌍의 겹침 면적 계산 ---
+            person_areas = np.prod(bboxes[:, 2:] - bboxes[:, :2], axis=1)
+            pending = ~hit & (person_areas[person_idx] != 0)
+            pending_persons, pending_zones = person_idx[pending], zone_idx[pending]
+            if len(pending_persons):
+                overlap_areas = self._pair_overlap_areas(bboxes, zones, pending_persons, pending_zones)
+                pair_ious = overlap_areas / person_areas[pending_persons]
+                thresholds = np.array([zone['iou_threshold'] for zone in zones])
+                ious[pending_persons, pending_zones] = pair_ious
+                inside[pending_persons, pending_zones] = pair_ious >= thresholds[pending_zones]
+
         alerts = []
-        for zone in self.danger_zones:
+        for z, zone in enumerate(zones):
             persons_in_zone = []
-            for i, person in enumerate(persons):
-                is_in, iou = self.check_person_in_zone(person["bbox"], zone)
-                if is_in:
-                    persons_in_zone.append({
-                        "person_index": i,
-                        "bbox": person["bbox"],
-                        "confidence": person["confidence"],
-                        "intrusion_iou": round(iou, 2)
-                    })
+            for i in np.flatnonzero(inside[:, z]):
+                person = persons[i]
+                persons_in_zone.append({
+                    "person_index": int(i),
+                    "bbox": person["bbox"],
+                    "confidence": person["confidence"],
+                    "intrusion_iou": round(float(ious[i, z]), 2)
+                })
             
             if persons_in_zone:
                 alerts.append({
                     "zone_id": zone["id"],
                     "zone_name": zone["name"],
+                    "camera_id": camera_id,
                     "person_count": len(persons_in_zone),
                     "persons": persons_in_zone
                 })
         return alerts
 
-    def visualize_zones(self, frame: np.ndarray, alerts: List[Dict] = None) -> np.ndarray:
+    def visualize_zones(self, frame: np.ndarray, alerts: List[Dict] = None, camera_id: str = None) -> np.ndarray:
         """
         위험 구역과 침입 상태를 프레임에 그립니다.
 
         Args:
             frame: 원본 프레임
             alerts: check_all_zones의 결과. 침입 시 구역 색상을 변경하는 데 사용됩니다.
+            camera_id: 프레임을 촬영한 카메라 ID. 지정 시 해당 카메라의 구역만 그립니다.
 
         Returns:
             구역이 그려진 프레임
@@ -180,7 +479,8 @@ class DangerZoneMapper:
         result_frame = frame.copy()
         alert_zone_ids = {alert['zone_id'] for alert in alerts} if alerts else set()
 
-        for zone in self.danger_zones:
+        frame_size = (frame.shape[1], frame.shape[0])
+        for zone in self.get_zones_for_camera(camera_id, frame_size):
             color = (0, 0, 255) if zone['id'] in alert_zone_ids else (0, 255, 0) # 침입 시 빨간색, 평시 초록색
             thickness = 4 if zone['id'] in alert_zone_ids else 2
 
@@ -1,12 +1,18 @@
 
 import cv2
+import math
+import time
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 
 from .person_detector import PersonDetector
 from .pose_detector import PoseDetector
 from .danger_zone_mapper import DangerZoneMapper
+from .motion_gate import MotionGate
+from .person_tracker import PersonTracker
+from core.drawing_utils import tile_frames
+from core.frame_envelope import FrameEnvelope
 
 class Detector:
     """모든 하위 탐지 모듈을 총괄하고, 종합적인 탐지 결과를 반환하는 클래스."""
@@ -19,53 +25,370 @@ class Detector:
             config: 전체 탐지기 설정을 담은 딕셔너리
         """
         try:
-            self.person_detector = PersonDetector(**config.get('person_detector', {}))
+            # 추론 백엔드는 두 탐지기에 공통으로 적용하되, 탐지기별 설정이 있으면 그 값을 우선합니다.
+            backend_options = {
+                "backend": config.get('backend', 'torch'),
+                "intra_op_threads": config.get('onnx_intra_op_threads'),
+                "precision": config.get('precision', 'fp32'),
+            }
+            self.person_detector = PersonDetector(**{**backend_options, **config.get('person_detector', {})})
             # PoseDetector는 이제 pose_model 관련 설정을 받지 않습니다.
-            self.pose_detector = PoseDetector(**config.get('fall_detector', {}))
+            self.pose_detector = PoseDetector(**{**backend_options, **config.get('fall_detector', {})})
             
-            self.danger_zone_mapper = DangerZoneMapper()
+            # 구역은 정규화 좌표로 보관되어 추론/표시 해상도가 달라도 같은 영역을 가리킵니다.
+            self.danger_zone_mapper = DangerZoneMapper(reference_size=config.get('zone_reference_size'),
+                                                       overlap_method=config.get('zone_overlap_method', 'polygon'))
+
+            # 이중 해상도 파이프라인: 지정 시 프레임을 이 너비로 한 번만 축소하여 추론하고,
+            # 결과 bbox는 원본(표시) 해상도 좌표로 되돌립니다. None이면 원본 해상도로 추론합니다.
+            self.inference_width = config.get('inference_width')
+
+            # 모션 게이트: 장면 변화가 없으면 직전 추론 결과를 재사용 (카메라별로 생성)
+            motion_gate_config = dict(config.get('motion_gate') or {})
+            self._motion_gate_config = motion_gate_config if motion_gate_config.pop('enabled', False) else None
+            self.motion_gates: Dict[Any, MotionGate] = {}
+            self._last_persons: Dict[Any, List[Dict[str, Any]]] = {}
+
+            # 사람 추적기: 추적 ID를 부여하고, detect_interval 프레임마다만 탐지하며 그 사이는 운동 예측으로 전파
+            # (위험 구역에 접근하는 추적이 있으면 즉시 탐지, 카메라별로 생성)
+            tracker_config = dict(config.get('tracker') or {})
+            self._tracker_config = tracker_config if tracker_config.pop('enabled', False) else None
+            self.trackers: Dict[Any, PersonTracker] = {}
+
+            # 위험 구역 ROI 크롭 추론: 구역 bounding_rect 합집합(+여백)만 잘라 추론하고,
+            # full_frame_interval(초)마다 전체 프레임 추론으로 구역에 접근하는 사람도 놓치지 않습니다.
+            self.zone_roi_config = {
+                "enabled": False,
+                "margin": 80,              # ROI 여백 (표시 해상도 픽셀)
+                "full_frame_interval": 1.0,
+                "max_area_ratio": 0.6,     # ROI가 프레임의 이 비율보다 크면 전체 프레임으로 추론
+                **(config.get('zone_roi') or {})
+            }
+            self._last_full_frame_time: Dict[Any, float] = {}
+
+            # 사람 bbox가 구역 bounding_rect에서 이 거리(표시 해상도 픽셀) 이내면 'near_zone'으로 표시 (추론 속도 결정용)
+            self.near_zone_margin = config.get('near_zone_margin', 80)
             
             logger.info("Detector 및 모든 하위 탐지기 초기화 완료")
         except Exception as e:
             logger.error(f"Detector 초기화 중 심각한 오류 발생: {e}")
             raise
 
-    def detect(self, frame: np.ndarray) -> Dict[str, Any]:
+    def detect(self, frame, camera_id: str = None) -> Dict[str, Any]:
         """
         2단계 탐지 파이프라인:
         1. 가벼운 PersonDetector로 사람을 먼저 찾습니다.
         2. 사람이 감지된 경우에만 PoseDetector로 넘어짐 등 상세 분석을 수행합니다.
+        모션 게이트가 활성화된 경우, 장면 변화가 없으면 1~2단계를 건너뛰고 직전 추론 결과를 재사용합니다.
+        입력 계층이 직전과 동일한 프레임(duplicate)으로 표시한 봉투도 같은 방식으로 건너뜁니다.
+        추적기가 활성화된 경우, 탐지 주기가 아닌 프레임은 추적 예측 bbox를 사용합니다. (위험 구역 근처에서는 탐지 강제)
+        (위험 구역 검사는 구역 변경을 즉시 반영하도록 매 프레임 수행합니다.)
+
+        Args:
+            frame: BGR 이미지 또는 FrameEnvelope. 봉투가 주어지면 결과의 'frame_meta'에 캡처 정보가 기록됩니다.
+            camera_id: 다중 카메라 구성에서 프레임을 촬영한 카메라 ID (해당 카메라의 구역만 검사)
         """
-        # 1. 사람 탐지 (항상 실행)
-        detected_persons = self.person_detector.detect(frame)
-        
+        frame_meta = None
+        duplicate = False
+        stale_cameras = []
+        if isinstance(frame, FrameEnvelope):
+            frame_meta = frame.meta()
+            camera_id = camera_id if camera_id is not None else frame.camera_id
+            duplicate = frame.duplicate
+            if frame.stale:
+                stale_cameras.append(camera_id or "default")
+            frame = frame.frame
+        frame_h, frame_w = frame.shape[:2]
+
+        persons_with_pose_analysis, inference_skipped = self._infer_or_reuse(frame, camera_id, duplicate)
+
         # 사람이 없으면 더 이상 분석할 필요가 없음
-        if not detected_persons:
+        if not persons_with_pose_analysis:
             return {
                 "persons": [],
                 "poses": [], # 호환성을 위해 유지
-                "danger_zone_alerts": []
+                "danger_zone_alerts": [],
+                "near_zone": False,
+                "inference_skipped": inference_skipped,
+                "stale_cameras": stale_cameras,
+                "frame_meta": frame_meta
             }
 
-        # 2. 자세 분석 (사람이 감지된 경우에만 실행)
-        # person_detector의 결과를 pose_detector로 넘겨서 추가 분석을 요청합니다.
-        # 이제 detected_persons 리스트에 pose_analysis 결과가 추가되어 반환됩니다.
-        persons_with_pose_analysis = self.pose_detector.detect(frame, detected_persons)
-
         # 3. 위험 구역 침입 분석 (분석이 완료된 최종 결과 사용)
-        danger_zone_alerts = self.danger_zone_mapper.check_all_zones(persons_with_pose_analysis)
+        danger_zone_alerts = self.danger_zone_mapper.check_all_zones(
+            persons_with_pose_analysis, camera_id=camera_id, frame_size=(frame_w, frame_h)
+        )
 
         # 4. 최종 결과 종합
         detection_result = {
             # 이제 persons 키가 모든 정보를 담는 유일한 정보원이 됩니다.
             "persons": persons_with_pose_analysis,
             "poses": [], # 레거시 호환 또는 디버깅을 위해 빈 리스트로 유지
-            "danger_zone_alerts": danger_zone_alerts
+            "danger_zone_alerts": danger_zone_alerts,
+            "near_zone": bool(danger_zone_alerts) or self._persons_near_zone(persons_with_pose_analysis, camera_id, (frame_w, frame_h)),
+            "inference_skipped": inference_skipped,
+            "stale_cameras": stale_cameras,
+            "frame_meta": frame_meta
         }
 
         return detection_result
 
-    def draw_detections(self, frame: np.ndarray, detection_result: Dict[str, Any]) -> np.ndarray:
+    def _infer_or_reuse(self, frame: np.ndarray, camera_id: str = None, duplicate: bool = False,
+                        now: float = None) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        이번 프레임의 사람 목록을 모델 실행, 추적 예측, 직전 결과 재사용 중 하나로 얻고 (사람 목록, 추론 생략 여부)를 반환합니다.
+        - 중복 프레임 / 모션 게이트가 변화 없음으로 판단한 프레임: 직전 결과 재사용 (추적기 탐지 주기에는 포함)
+        - 게이트가 최대 간격 초과로 강제했거나 위험 구역 주변(near_zone_margin)에서 움직임을 감지한 프레임: 반드시 모델 실행
+          (아직 추적되지 않은 사람이 구역 근처에 처음 나타나도 탐지 주기를 기다리지 않음)
+        - 그 밖의 프레임: 추적기가 있으면 탐지 주기/구역 접근 여부에 따라 모델 실행 또는 예측
+        게이트의 비교 기준과 최대 간격 시계는 모델을 실제로 실행한 프레임에서만 갱신되므로,
+        두 기능을 함께 켜도 실제 추론 사이의 최대 간격은 max_skip_interval을 넘지 않습니다.
+        """
+        now = time.monotonic() if now is None else now
+        frame_size = (frame.shape[1], frame.shape[0])
+        gate = self._get_motion_gate(camera_id)
+        tracker = self._get_tracker(camera_id)
+        has_previous = camera_id in self._last_persons
+
+        if duplicate and has_previous:
+            # 픽셀이 동일한 프레임은 추론 결과도 같으므로 모션 게이트 계산 없이 바로 재사용
+            if tracker is not None:
+                tracker.skip_frame(now)
+            return self._last_persons[camera_id], True
+
+        gate_infer = gate.should_infer(frame, now) if gate is not None else True
+        if not gate_infer and has_previous:
+            if tracker is not None:
+                tracker.skip_frame(now)
+            return self._last_persons[camera_id], True
+
+        zone_rects = self._zone_rects(camera_id, frame_size) if tracker is not None else []
+        force = not has_previous or (gate is not None and (
+            gate.overdue or gate.motion_in_rects(zone_rects, frame_size, margin=self.near_zone_margin)))
+        if tracker is not None and not tracker.should_detect(zone_rects, now, force=force):
+            persons = tracker.predict(frame_size, now)
+            inference_skipped = True
+        else:
+            persons = self._run_models(frame, camera_id)
+            inference_skipped = False
+            if gate is not None:
+                gate.mark_inferred(frame, now)
+            if tracker is not None:
+                tracker.update(persons, now)
+        self._last_persons[camera_id] = persons
+        return persons, inference_skipped
+
+    def _run_models(self, frame: np.ndarray, camera_id: str = None) -> List[Dict[str, Any]]:
+        """
+        사람 탐지 및 자세 분석 모델을 실행하고, 표시 해상도 좌표의 사람 목록을 반환합니다.
+        ROI 크롭 모드에서는 위험 구역 주변만 잘라 추론한 뒤 bbox를 프레임 좌표로 되돌립니다.
+        """
+        roi = self._select_roi(frame, camera_id)
+        if roi is not None:
+            x, y, w, h = roi
+            region = frame[y:y + h, x:x + w]
+        else:
+            region = frame
+
+        # 축소 배율은 항상 전체 프레임 기준으로 계산하여, 크롭 여부와 관계없이 사람의 픽셀 크기가 같도록 유지
+        inference_frame, scale = self._prepare_inference_frame(region, reference_width=frame.shape[1])
+        # 크롭은 원래 크기 그대로 추론 (모델 기본 입력 크기로 확대하면 연산량 절감 효과가 사라짐)
+        imgsz = self._roi_imgsz(inference_frame) if roi is not None else None
+
+        # 1. 사람 탐지 (항상 실행)
+        detected_persons = self.person_detector.detect(inference_frame, imgsz=imgsz)
+        if not detected_persons:
+            return []
+
+        # 2. 자세 분석 (사람이 감지된 경우에만 실행)
+        # person_detector의 결과를 pose_detector로 넘겨서 추가 분석을 요청합니다.
+        # 이제 detected_persons 리스트에 pose_analysis 결과가 추가되어 반환됩니다.
+        # (넘어짐 모델의 bbox와 IoU를 비교해야 하므로, 축소 해상도 좌표 그대로 전달합니다.)
+        persons_with_pose_analysis = self.pose_detector.detect(inference_frame, detected_persons, imgsz=imgsz)
+
+        # 축소 해상도에서 추론한 경우 bbox를 표시 해상도 좌표로 복원
+        if scale is not None:
+            self._rescale_persons(persons_with_pose_analysis, scale)
+        # ROI 크롭 좌표를 프레임 좌표로 복원
+        if roi is not None:
+            self._offset_persons(persons_with_pose_analysis, roi[0], roi[1])
+        return persons_with_pose_analysis
+
+    def _select_roi(self, frame: np.ndarray, camera_id: str = None) -> Optional[Tuple[int, int, int, int]]:
+        """
+        이번 프레임에서 사용할 ROI (x, y, w, h)를 결정합니다.
+        ROI 모드가 꺼져 있거나, 전체 프레임 추론 주기가 되었거나, 구역이 없거나 ROI가 충분히 작지 않으면 None을 반환합니다.
+        """
+        cfg = self.zone_roi_config
+        if not cfg["enabled"]:
+            return None
+
+        now = time.monotonic()
+        if now - self._last_full_frame_time.get(camera_id, 0.0) >= cfg["full_frame_interval"]:
+            self._last_full_frame_time[camera_id] = now
+            return None
+
+        frame_h, frame_w = frame.shape[:2]
+        zones = self.danger_zone_mapper.get_zones_for_camera(camera_id, (frame_w, frame_h))
+        if not zones:
+            return None
+
+        margin = cfg["margin"]
+        rects = np.array([zone["bounding_rect"] for zone in zones], dtype=np.int64)
+        x1 = max(0, int(rects[:, 0].min()) - margin)
+        y1 = max(0, int(rects[:, 1].min()) - margin)
+        x2 = min(frame_w, int((rects[:, 0] + rects[:, 2]).max()) + margin)
+        y2 = min(frame_h, int((rects[:, 1] + rects[:, 3]).max()) + margin)
+        if x2 <= x1 or y2 <= y1:
+            return None
+
+        # ROI가 프레임 대부분을 차지하면 크롭 이득이 없으므로 전체 프레임으로 추론
+        if (x2 - x1) * (y2 - y1) > cfg["max_area_ratio"] * frame_w * frame_h:
+            return None
+        return x1, y1, x2 - x1, y2 - y1
+
+    @staticmethod
+    def _roi_imgsz(inference_frame: np.ndarray) -> int:
+        """크롭의 긴 변을 YOLO stride(32)의 배수로 올림하여 모델 입력 크기로 사용합니다. (최대 640)"""
+        long_side = max(inference_frame.shape[:2])
+        return min(640, max(32, int(math.ceil(long_side / 32)) * 32))
+
+    @staticmethod
+    def _offset_persons(persons: List[Dict[str, Any]], dx: int, dy: int) -> None:
+        """사람 bbox를 (dx, dy)만큼 이동합니다. (제자리 수정)"""
+        for person in persons:
+            x1, y1, x2, y2 = person["bbox"]
+            person["bbox"] = [x1 + dx, y1 + dy, x2 + dx, y2 + dy]
+
+    def _get_motion_gate(self, camera_id: str = None):
+        """카메라별 모션 게이트를 반환합니다. 게이트가 비활성화되어 있으면 None을 반환합니다."""
+        if self._motion_gate_config is None:
+            return None
+        gate = self.motion_gates.get(camera_id)
+        if gate is None:
+            gate = MotionGate(**self._motion_gate_config)
+            self.motion_gates[camera_id] = gate
+        return gate
+
+    def _get_tracker(self, camera_id: str = None) -> Optional[PersonTracker]:
+        """카메라별 사람 추적기를 반환합니다. 추적기가 비활성화되어 있으면 None을 반환합니다."""
+        if self._tracker_config is None:
+            return None
+        tracker = self.trackers.get(camera_id)
+        if tracker is None:
+            tracker = PersonTracker(**self._tracker_config)
+            self.trackers[camera_id] = tracker
+        return tracker
+
+    def _zone_rects(self, camera_id: str, frame_size: Tuple[int, int]) -> List[Tuple[int, int, int, int]]:
+        """카메라의 위험 구역 bounding_rect (x, y, w, h) 목록 (frame_size 픽셀 좌표)."""
+        return [zone["bounding_rect"] for zone in self.danger_zone_mapper.get_zones_for_camera(camera_id, frame_size)]
+
+    def _persons_near_zone(self, persons: List[Dict[str, Any]], camera_id: str, frame_size: Tuple[int, int]) -> bool:
+        """사람 bbox 중 하나라도 위험 구역 bounding_rect(+near_zone_margin)와 겹치는지 검사합니다."""
+        zone_rects = self._zone_rects(camera_id, frame_size)
+        if not persons or not zone_rects:
+            return False
+        m = self.near_zone_margin
+        boxes = np.array([person["bbox"] for person in persons], dtype=np.float64)
+        rects = np.array(zone_rects, dtype=np.float64)
+        overlap = ((boxes[:, None, 0] <= rects[None, :, 0] + rects[None, :, 2] + m) &
+                   (boxes[:, None, 2] >= rects[None, :, 0] - m) &
+                   (boxes[:, None, 1] <= rects[None, :, 1] + rects[None, :, 3] + m) &
+                   (boxes[:, None, 3] >= rects[None, :, 1] - m))
+        return bool(overlap.any())
+
+    def get_tracker_stats(self) -> Dict[Any, Dict[str, Any]]:
+        """카메라별 추적기 통계(탐지 비율, 강제 탐지 횟수 등)를 반환합니다."""
+        return {camera_id: tracker.get_stats() for camera_id, tracker in self.trackers.items()}
+
+    def get_motion_gate_stats(self) -> Dict[Any, Dict[str, Any]]:
+        """카메라별 모션 게이트 통계(건너뛰기 비율 등)를 반환합니다."""
+        return {camera_id: gate.get_stats() for camera_id, gate in self.motion_gates.items()}
+
+    def _prepare_inference_frame(self, frame: np.ndarray, reference_width: int = None):
+        """
+        추론용 프레임을 준비합니다. inference_width가 설정되어 있고 프레임이 더 크면 한 번만 축소합니다.
+        reference_width가 주어지면 (ROI 크롭) 축소 배율을 전체 프레임 너비 기준으로 계산합니다.
+
+        Returns:
+            (추론용 프레임, (sx, sy) 표시 좌표 복원 배율 또는 축소하지 않은 경우 None)
+        """
+        frame_h, frame_w = frame.shape[:2]
+        reference_width = reference_width or frame_w
+        if not self.inference_width or reference_width <= self.inference_width:
+            return frame, None
+
+        ratio = self.inference_width / reference_width
+        small_w = max(1, int(round(frame_w * ratio)))
+        small_h = max(1, int(round(frame_h * ratio)))
+        small = cv2.resize(frame, (small_w, small_h), interpolation=cv2.INTER_AREA)
+        return small, (frame_w / small_w, frame_h / small_h)
+
+    @staticmethod
+    def _rescale_persons(persons: List[Dict[str, Any]], scale) -> None:
+        """사람 bbox를 추론 해상도에서 표시 해상도 좌표로 변환합니다. (제자리 수정)"""
+        sx, sy = scale
+        for person in persons:
+            x1, y1, x2, y2 = person["bbox"]
+            person["bbox"] = [int(round(x1 * sx)), int(round(y1 * sy)), int(round(x2 * sx)), int(round(y2 * sy))]
+
+    def detect_cameras(self, frames: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        여러 카메라의 프레임을 동일한 모델로 탐지하고, 결과를 하나로 종합합니다.
+        모든 사람/경보에는 camera_id가 태깅되며, 카메라별 원본 결과는 'cameras' 키에 보관됩니다.
+        종합 결과의 'frame_meta'는 가장 먼저 캡처된 프레임의 정보입니다. (지연 시간을 보수적으로 측정)
+
+        Args:
+            frames: {camera_id: frame 또는 FrameEnvelope} 딕셔너리
+
+        Returns:
+            detect()와 같은 형식의 종합 결과 + 'cameras': {camera_id: 카메라별 결과}
+        """
+        merged_persons = []
+        merged_alerts = []
+        per_camera = {}
+
+        for camera_id, frame in frames.items():
+            result = self.detect(frame, camera_id=camera_id)
+            per_camera[camera_id] = result
+
+            # 종합 결과에서의 사람 인덱스가 겹치지 않도록 오프셋을 적용
+            offset = len(merged_persons)
+            for person in result["persons"]:
+                person["camera_id"] = camera_id
+                merged_persons.append(person)
+            for alert in result["danger_zone_alerts"]:
+                merged_alerts.append({
+                    **alert,
+                    "persons": [{**p, "person_index": p["person_index"] + offset} for p in alert["persons"]]
+                })
+
+        frame_metas = [r["frame_meta"] for r in per_camera.values() if r.get("frame_meta")]
+        return {
+            "persons": merged_persons,
+            "poses": [],
+            "danger_zone_alerts": merged_alerts,
+            "near_zone": any(r.get("near_zone") for r in per_camera.values()),
+            "inference_skipped": all(r.get("inference_skipped") for r in per_camera.values()) if per_camera else False,
+            "stale_cameras": [c for r in per_camera.values() for c in r.get("stale_cameras", [])],
+            "frame_meta": min(frame_metas, key=lambda m: m["capture_ts"]) if frame_metas else None,
+            "cameras": per_camera
+        }
+
+    def draw_camera_detections(self, frames: Dict[str, np.ndarray], detection_result: Dict[str, Any]) -> np.ndarray:
+        """
+        detect_cameras()의 결과를 카메라별로 시각화한 뒤 하나의 격자 이미지로 합칩니다.
+        프레임이 None인 카메라는 빈 타일로 남겨 타일 위치를 유지합니다.
+        """
+        per_camera = detection_result.get('cameras', {})
+        drawn = [
+            self.draw_detections(frame, per_camera.get(camera_id, {}), camera_id=camera_id) if frame is not None else None
+            for camera_id, frame in frames.items()
+        ]
+        return tile_frames(drawn)
+
+    def draw_detections(self, frame: np.ndarray, detection_result: Dict[str, Any], camera_id: str = None) -> np.ndarray:
         """
         모든 탐지 결과를 입력 프레임에 시각화합니다.
         """
@@ -73,7 +396,7 @@ class Detector:
         
         # 1. 위험 구역 그리기 (침입 시 색상 변경)
         alerts = detection_result.get('danger_zone_alerts', [])
-        result_frame = self.danger_zone_mapper.visualize_zones(result_frame, alerts)
+        result_frame = self.danger_zone_mapper.visualize_zones(result_frame, alerts, camera_id=camera_id)
 
         # 2. 최종 탐지 결과(사람 BBox + 넘어짐 분석) 그리기
         # 이제 PoseDetector의 draw_poses가 이 역할을 담당합니다.
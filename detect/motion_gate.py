@@ -0,0 +1,121 @@
+import cv2
+import numpy as np
+import time
+from typing import Dict, Any, List, Optional, Tuple
+from loguru import logger
+
+class MotionGate:
+    """
+    저해상도 그레이스케일 차분으로 장면 변화를 판단하여, 변화가 없으면 추론을 건너뛰도록 알려주는 게이트.
+    비교 기준은 '마지막으로 모델을 실제로 실행한 프레임'(mark_inferred)이므로 느린 변화도 누적되어 감지됩니다.
+    마지막 실제 추론에서 max_skip_interval이 지나면 변화가 없어도 반드시 추론을 수행하여 안전성을 보장합니다.
+    """
+
+    def __init__(self, downscale_width: int = 160, pixel_threshold: int = 25,
+                 min_changed_ratio: float = 0.002, max_skip_interval: float = 0.5):
+        """
+        Args:
+            downscale_width: 차분 계산용으로 축소할 프레임 너비 (픽셀)
+            pixel_threshold: 픽셀이 '변화함'으로 판단되는 그레이스케일 차이 (0~255)
+            min_changed_ratio: 추론을 수행할 최소 변화 픽셀 비율 (0~1)
+            max_skip_interval: 변화가 없어도 추론을 강제하는 최대 간격 (초)
+        """
+        self.downscale_width = downscale_width
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_ratio = min_changed_ratio
+        self.max_skip_interval = max_skip_interval
+
+        self._reference: Optional[np.ndarray] = None
+        self._last_inference_time = 0.0
+        self._candidate = None  # 마지막으로 판단한 (프레임, 축소 그레이스케일) - mark_inferred에서 재사용
+        self.last_motion_mask: Optional[np.ndarray] = None  # 비교 기준 대비 변화한 픽셀 (축소 해상도)
+        self.overdue = False  # 마지막 판단이 max_skip_interval 초과로 인한 강제 추론인지
+
+        # 통계
+        self.frames_total = 0
+        self.frames_skipped = 0
+        self.forced_inferences = 0
+        self.last_changed_ratio = 0.0
+
+        logger.info(f"MotionGate 초기화 완료: 축소 너비={downscale_width}, 변화 비율 임계값={min_changed_ratio}, "
+                    f"최대 건너뛰기 간격={max_skip_interval}s")
+
+    def _to_small_gray(self, frame: np.ndarray) -> np.ndarray:
+        """프레임을 축소한 뒤 그레이스케일로 변환합니다. (축소를 먼저 하여 색 변환 비용을 줄임)"""
+        h, w = frame.shape[:2]
+        if w > self.downscale_width:
+            small_h = max(1, int(round(h * self.downscale_width / w)))
+            frame = cv2.resize(frame, (self.downscale_width, small_h), interpolation=cv2.INTER_AREA)
+        if frame.ndim == 3:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return frame
+
+    def should_infer(self, frame: np.ndarray, now: Optional[float] = None) -> bool:
+        """
+        현재 프레임에 대해 전체 추론이 필요한지 판단합니다. (판단만 하며 비교 기준은 바꾸지 않음)
+        실제로 모델을 실행한 뒤 mark_inferred()를 호출해야 그 프레임이 새 비교 기준이 되고
+        max_skip_interval 시계가 다시 시작됩니다. (추적 예측 등으로 추론을 건너뛴 프레임은 기준이 되지 않음)
+        판단 근거는 overdue(최대 간격 초과)와 motion_in_rects()로 확인할 수 있습니다.
+        """
+        now = time.monotonic() if now is None else now
+        self.frames_total += 1
+        small = self._to_small_gray(frame)
+        self._candidate = (frame, small)
+        self.last_motion_mask = None
+        self.overdue = False
+
+        if self._reference is None or small.shape != self._reference.shape:
+            infer = True
+        elif now - self._last_inference_time >= self.max_skip_interval:
+            infer = True
+            self.overdue = True
+            self.forced_inferences += 1
+        else:
+            self.last_motion_mask = cv2.absdiff(small, self._reference) > self.pixel_threshold
+            self.last_changed_ratio = float(np.count_nonzero(self.last_motion_mask)) / self.last_motion_mask.size
+            infer = bool(self.last_changed_ratio >= self.min_changed_ratio)
+
+        if not infer:
+            self.frames_skipped += 1
+        return infer
+
+    def mark_inferred(self, frame: np.ndarray, now: Optional[float] = None):
+        """모델을 실제로 실행한 프레임을 새 비교 기준으로 삼고 최대 간격 시계를 다시 시작합니다."""
+        now = time.monotonic() if now is None else now
+        if self._candidate is not None and self._candidate[0] is frame:
+            self._reference = self._candidate[1]
+        else:
+            self._reference = self._to_small_gray(frame)
+        self._candidate = None
+        self._last_inference_time = now
+
+    def motion_in_rects(self, rects: List[Tuple[int, int, int, int]], frame_size: Tuple[int, int], margin: int = 0) -> bool:
+        """
+        마지막 should_infer()에서 변화한 픽셀이 주어진 영역 (x, y, w, h, 프레임 픽셀 좌표, +margin) 안에 있는지 확인합니다.
+        (위험 구역 주변에 새로 나타난 사람처럼 아직 추적되지 않은 움직임을 찾는 데 사용)
+        """
+        mask = self.last_motion_mask
+        if mask is None or not rects:
+            return False
+        scale_x, scale_y = mask.shape[1] / frame_size[0], mask.shape[0] / frame_size[1]
+        for x, y, w, h in rects:
+            x1, y1 = int((x - margin) * scale_x), int((y - margin) * scale_y)
+            x2, y2 = int(np.ceil((x + w + margin) * scale_x)), int(np.ceil((y + h + margin) * scale_y))
+            if mask[max(0, y1):max(0, y2), max(0, x1):max(0, x2)].any():
+                return True
+        return False
+
+    def reset(self):
+        """비교 기준을 초기화하여 다음 프레임에서 반드시 추론하도록 합니다."""
+        self._reference = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """건너뛰기 비율 등 게이트 통계를 반환합니다."""
+        return {
+            "frames_total": self.frames_total,
+            "frames_skipped": self.frames_skipped,
+            "forced_inferences": self.forced_inferences,
+            "skip_rate": self.frames_skipped / self.frames_total if self.frames_total else 0.0,
+            "last_changed_ratio": round(self.last_changed_ratio, 4),
+            "seconds_since_inference": round(time.monotonic() - self._last_inference_time, 3) if self._reference is not None else None,
+        }
@@ -0,0 +1,274 @@
+import ast
+import importlib
+import cv2
+import numpy as np
+import torch
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Union
+from loguru import logger
+
+BACKENDS = ("torch", "onnx")
+PRECISIONS = ("fp32", "int8")
+
+
+def require_optional(module: str, purpose: str):
+    """
+    선택 의존성(requirements.txt 하단 참고)이 설치되어 있는지 확인하고, 없으면 설치 방법을 안내하는 ImportError를 발생시킵니다.
+    (ultralytics가 내보내기 중 패키지를 자동 설치하려 하므로, 오프라인 현장 PC에서는 미리 확인합니다)
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(f"{purpose}에는 '{module}' 패키지가 필요합니다. "
+                          f"requirements.txt 하단의 선택 의존성을 설치하세요.") from e
+
+
+def quantized_model_path(model_path: Union[str, Path], variant: Optional[str] = None) -> Path:
+    """
+    INT8 모델 경로를 반환합니다. 탐지기는 '<이름>.int8.onnx'를 로드하고,
+    양자화 작업(benchmarks/quantize_models.py)은 후보를 '<이름>.int8-<variant>.onnx'로 저장합니다.
+    """
+    model_path = Path(model_path)
+    stem = model_path.name.split(".")[0]
+    suffix = f".int8-{variant}.onnx" if variant else ".int8.onnx"
+    return model_path.with_name(stem + suffix)
+
+
+def ensure_onnx_model(model_path: Union[str, Path]) -> Path:
+    """
+    YOLO .pt 가중치를 ONNX로 한 번만 내보내고, 모델 옆에 캐시된 .onnx 경로를 반환합니다.
+    .onnx가 이미 있고 .pt보다 최신이면 그대로 재사용합니다. (입력 크기가 가변인 dynamic 모델로 내보냄)
+    """
+    model_path = Path(model_path)
+    if model_path.suffix == ".onnx":
+        return model_path
+
+    onnx_path = model_path.with_suffix(".onnx")
+    if onnx_path.exists() and (not model_path.exists() or onnx_path.stat().st_mtime >= model_path.stat().st_mtime):
+        return onnx_path
+
+    require_optional("onnx", "ONNX 내보내기")
+    from ultralytics import YOLO
+    logger.info(f"ONNX 모델이 없어 내보내기를 시작합니다: {model_path} -> {onnx_path}")
+    exported = Path(YOLO(str(model_path)).export(format="onnx", dynamic=True))
+    if exported.resolve() != onnx_path.resolve():
+        exported.replace(onnx_path)
+    logger.info(f"ONNX 모델 내보내기 완료: {onnx_path}")
+    return onnx_path
+
+
+def letterbox(image: np.ndarray, new_shape: Tuple[int, int], auto: bool = False, stride: int = 32) -> Tuple[np.ndarray, float, Tuple[float, float]]:
+    """
+    종횡비를 유지하며 new_shape(h, w)에 맞게 축소하고 회색(114)으로 여백을 채웁니다. (ultralytics LetterBox와 동일)
+    auto=True이면 stride 배수가 되는 최소 여백만 채웁니다. (가변 입력 모델의 단일 이미지용)
+    :return: (변환된 이미지, 배율, (좌우 여백, 상하 여백))
+    """
+    h, w = image.shape[:2]
+    ratio = min(new_shape[0] / h, new_shape[1] / w)
+    resized_w, resized_h = int(round(w * ratio)), int(round(h * ratio))
+    pad_w, pad_h = new_shape[1] - resized_w, new_shape[0] - resized_h
+    if auto:
+        pad_w, pad_h = pad_w % stride, pad_h % stride
+    pad_w, pad_h = pad_w / 2, pad_h / 2
+
+    if (w, h) != (resized_w, resized_h):
+        image = cv2.resize(image, (resized_w, resized_h), interpolation=cv2.INTER_LINEAR)
+    top, bottom = int(round(pad_h - 0.1)), int(round(pad_h + 0.1))
+    left, right = int(round(pad_w - 0.1)), int(round(pad_w + 0.1))
+    image = cv2.copyMakeBorder(image, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114))
+    return image, ratio, (pad_w, pad_h)
+
+
+def preprocess_batch(images: List[np.ndarray], shape: Tuple[int, int], auto: bool = False, stride: int = 32):
+    """
+    BGR 이미지 목록을 레터박스 후 NCHW float32 배치(RGB, 0~1)로 변환합니다.
+    :return: (배치, [(배율, 여백), ...])
+    """
+    boxed, transforms = [], []
+    for image in images:
+        img, ratio, pad = letterbox(image, shape, auto=auto, stride=stride)
+        boxed.append(img)
+        transforms.append((ratio, pad))
+    batch = np.stack(boxed)[..., ::-1].transpose(0, 3, 1, 2)  # BGR→RGB, NHWC→NCHW
+    batch = np.ascontiguousarray(batch, dtype=np.float32) / 255.0
+    return batch, transforms
+
+
+class OnnxBoxes:
+    """
+    ultralytics Boxes와 같은 방식으로 접근할 수 있는 탐지 박스 묶음.
+    data는 (N, 6) 텐서 [x1, y1, x2, y2, conf, cls]이며, 기존 detect()의 결과 처리 코드를 그대로 사용할 수 있습니다.
+    """
+
+    def __init__(self, data: torch.Tensor):
+        self.data = data
+
+    @property
+    def xyxy(self) -> torch.Tensor:
+        return self.data[:, :4]
+
+    @property
+    def conf(self) -> torch.Tensor:
+        return self.data[:, 4]
+
+    @property
+    def cls(self) -> torch.Tensor:
+        return self.data[:, 5]
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield OnnxBoxes(self.data[i:i + 1])
+
+
+class OnnxResults:
+    """ultralytics Results 중 탐지기에서 사용하는 부분(boxes, names, orig_shape)만 제공하는 결과 객체."""
+
+    def __init__(self, boxes: OnnxBoxes, names: Dict[int, str], orig_shape: Tuple[int, int]):
+        self.boxes = boxes
+        self.names = names
+        self.orig_shape = orig_shape
+
+
+class OnnxYoloModel:
+    """
+    ONNX Runtime(CPU)으로 YOLOv8 탐지 모델을 실행합니다.
+    predict()는 ultralytics YOLO.predict()와 같은 인자와 결과 형식을 사용하므로,
+    PersonDetector/PoseDetector는 백엔드와 관계없이 같은 결과 처리 코드를 사용합니다.
+    """
+
+    def __init__(self, onnx_path: Union[str, Path], intra_op_threads: Optional[int] = None, default_imgsz: int = 640):
+        """
+        :param onnx_path: ONNX 모델 경로
+        :param intra_op_threads: 연산자 내부 병렬 스레드 수 (None이면 ONNX Runtime 기본값 = 물리 코어 수)
+        :param default_imgsz: imgsz를 지정하지 않았을 때의 입력 크기 (가변 입력 모델에만 적용)
+        """
+        ort = require_optional("onnxruntime", "ONNX 백엔드")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.inter_op_num_threads = 1
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+
+        self.path = Path(onnx_path)
+        self.session = ort.InferenceSession(str(self.path), sess_options=options, providers=["CPUExecutionProvider"])
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+
+        # 입력 형태가 고정이면 (1, 3, H, W), 가변이면 문자열 차원
+        _, _, in_h, in_w = model_input.shape
+        self.fixed_shape = (in_h, in_w) if isinstance(in_h, int) and isinstance(in_w, int) else None
+        self.fixed_batch = model_input.shape[0] if isinstance(model_input.shape[0], int) else None
+        self.default_imgsz = default_imgsz
+
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.names: Dict[int, str] = ast.literal_eval(metadata["names"]) if "names" in metadata else {}
+        self.stride = int(metadata.get("stride", 32))
+        logger.info(f"ONNX Runtime 모델 로드 완료: {self.path}, intra-op 스레드: {intra_op_threads or '기본값'}, "
+                    f"입력: {'고정 ' + str(self.fixed_shape) if self.fixed_shape else '가변'}")
+
+    def _input_shape(self, imgsz: Optional[int]) -> Tuple[int, int]:
+        if self.fixed_shape is not None:
+            return self.fixed_shape
+        size = imgsz or self.default_imgsz
+        size = int(np.ceil(size / self.stride) * self.stride)
+        return size, size
+
+    def _preprocess(self, images: List[np.ndarray], imgsz: Optional[int]):
+        """BGR 이미지 목록을 레터박스 후 NCHW float32 배치로 변환합니다."""
+        # 가변 입력 모델의 단일 이미지는 최소 여백(rect)으로 추론하여 연산량을 줄임 (ultralytics와 동일)
+        auto = self.fixed_shape is None and len(images) == 1
+        return preprocess_batch(images, self._input_shape(imgsz), auto=auto, stride=self.stride)
+
+    def _postprocess(self, output: np.ndarray, conf: float, iou: float, classes: Optional[List[int]],
+                     ratio: float, pad: Tuple[float, float], orig_shape: Tuple[int, int]) -> np.ndarray:
+        """
+        YOLOv8 출력 (4 + 클래스 수, 앵커 수)을 [x1, y1, x2, y2, conf, cls] 배열로 변환합니다.
+        신뢰도 필터 → 클래스별 NMS → 레터박스 역변환 순서로 처리합니다.
+        """
+        predictions = output.T  # (앵커, 4 + nc)
+        scores = predictions[:, 4:]
+        class_ids = scores.argmax(axis=1)
+        confidences = scores[np.arange(scores.shape[0]), class_ids]
+
+        keep = confidences >= conf
+        if classes is not None:
+            keep &= np.isin(class_ids, classes)
+        if not keep.any():
+            return np.zeros((0, 6), dtype=np.float32)
+        predictions, class_ids, confidences = predictions[keep], class_ids[keep], confidences[keep]
+
+        cx, cy, w, h = predictions[:, 0], predictions[:, 1], predictions[:, 2], predictions[:, 3]
+        boxes = np.stack([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2], axis=1)
+
+        # 클래스가 다른 박스끼리는 억제하지 않도록 클래스별로 좌표를 멀리 떨어뜨린 뒤 한 번에 NMS
+        offset_boxes = boxes + (class_ids[:, None] * 7680.0)
+        nms_input = np.column_stack([offset_boxes[:, :2], offset_boxes[:, 2:] - offset_boxes[:, :2]])
+        indices = cv2.dnn.NMSBoxes(nms_input.tolist(), confidences.tolist(), conf, iou)
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        boxes, class_ids, confidences = boxes[indices], class_ids[indices], confidences[indices]
+
+        # 레터박스 역변환 후 원본 이미지 범위로 자르기
+        boxes[:, [0, 2]] = (boxes[:, [0, 2]] - pad[0]) / ratio
+        boxes[:, [1, 3]] = (boxes[:, [1, 3]] - pad[1]) / ratio
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, orig_shape[1])
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, orig_shape[0])
+        return np.column_stack([boxes, confidences, class_ids]).astype(np.float32)
+
+    def predict(self, source, conf: float = 0.25, iou: float = 0.7, classes: Optional[List[int]] = None,
+                imgsz: Optional[int] = None, **kwargs) -> List[OnnxResults]:
+        """
+        ultralytics YOLO.predict()와 같은 형식으로 추론합니다. (device, verbose 등 나머지 인자는 무시)
+        :param source: BGR 이미지 또는 이미지 목록 (목록은 한 번의 배치로 추론)
+        """
+        images = source if isinstance(source, (list, tuple)) else [source]
+        if not images:
+            return []
+
+        batch, transforms = self._preprocess(images, imgsz)
+        if self.fixed_batch == 1 and len(images) > 1:
+            # 배치 크기가 1로 고정된 모델은 이미지별로 나누어 실행
+            outputs = np.concatenate([self.session.run(None, {self.input_name: batch[i:i + 1]})[0] for i in range(len(images))])
+        else:
+            outputs = self.session.run(None, {self.input_name: batch})[0]
+
+        results = []
+        for output, image, (ratio, pad) in zip(outputs, images, transforms):
+            detections = self._postprocess(output, conf, iou, classes, ratio, pad, image.shape[:2])
+            results.append(OnnxResults(OnnxBoxes(torch.from_numpy(detections)), self.names, image.shape[:2]))
+        return results
+
+
+def load_yolo_model(model_path: Union[str, Path], backend: str = "torch", device=None,
+                    intra_op_threads: Optional[int] = None, precision: str = "fp32"):
+    """
+    설정된 백엔드로 YOLO 모델을 로드합니다.
+    'torch'는 ultralytics YOLO를 장치로 옮겨 반환하고, 'onnx'는 캐시된 ONNX 모델(없으면 내보내기)을
+    ONNX Runtime CPU 세션으로 로드합니다. 두 모델 모두 predict()/names를 같은 방식으로 사용합니다.
+    precision='int8'이면 양자화 작업으로 미리 만들어 둔 '<이름>.int8.onnx'를 ONNX Runtime으로 로드합니다.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 추론 백엔드입니다: {backend} (사용 가능: {BACKENDS})")
+    if precision not in PRECISIONS:
+        raise ValueError(f"알 수 없는 모델 정밀도입니다: {precision} (사용 가능: {PRECISIONS})")
+
+    if precision == "int8":
+        if backend != "onnx":
+            raise ValueError("INT8 모델은 'onnx' 백엔드에서만 사용할 수 있습니다.")
+        int8_path = quantized_model_path(model_path)
+        if not int8_path.exists():
+            raise FileNotFoundError(f"INT8 모델이 없습니다: {int8_path} "
+                                    f"(benchmarks/quantize_models.py로 먼저 생성하세요)")
+        return OnnxYoloModel(int8_path, intra_op_threads=intra_op_threads)
+    if backend == "onnx":
+        return OnnxYoloModel(ensure_onnx_model(model_path), intra_op_threads=intra_op_threads)
+
+    from ultralytics import YOLO
+    model = YOLO(str(model_path))
+    if device is not None:
+        model.to(device)
+    return model
@@ -1,19 +1,26 @@
 import numpy as np
 from typing import List, Dict, Any
-from ultralytics import YOLO
 from loguru import logger
 import torch
 
+from .box_utils import boxes_to_array
+from .onnx_backend import load_yolo_model
+
 class PersonDetector:
     """사람 감지 (YOLOv8 사용, 핵심 기능만)"""
 
-    def __init__(self, model_path='yolov8n.pt', conf_threshold=0.3):
+    def __init__(self, model_path='yolov8n.pt', conf_threshold=0.3, backend: str = "torch", intra_op_threads: int = None,
+                 precision: str = "fp32"):
         """
         사람 감지기 초기화
 
         Args:
             model_path: YOLO 모델 경로
             conf_threshold: 신뢰도 임계값
+            backend: 추론 백엔드 ('torch' 또는 'onnx'). 'onnx'는 .pt를 한 번 ONNX로 내보내 모델 옆에 캐시하고
+                     ONNX Runtime(CPU)으로 추론합니다.
+            intra_op_threads: 'onnx' 백엔드의 연산자 내부 스레드 수 (None이면 ONNX Runtime 기본값)
+            precision: 'fp32' 또는 'int8'. 'int8'은 양자화 작업으로 만든 '<이름>.int8.onnx'를 로드합니다. ('onnx' 백엔드 전용)
         """
         try:
             # 1. 하드웨어 장치 자동 감지 (CUDA > MPS > CPU 순)
@@ -27,8 +34,10 @@ class PersonDetector:
                 self.device = torch.device("cpu")
                 logger.warning("PersonDetector: 사용 가능한 GPU가 없어 CPU를 사용합니다.")
 
-            self.model = YOLO(model_path)
-            self.model.to(self.device) # 모델을 지정된 장치로 이동
+            # 모델을 지정된 백엔드로 로드 ('torch'는 지정된 장치로 이동)
+            self.backend = backend
+            self.model = load_yolo_model(model_path, backend=backend, device=self.device,
+                                         intra_op_threads=intra_op_threads, precision=precision)
             self.conf_threshold = conf_threshold
             
             # 'person' 클래스 ID를 모델로부터 동적으로 찾아오도록 개선
@@ -36,7 +45,7 @@ class PersonDetector:
             if self.person_class_id is None:
                 raise ValueError(f"모델 '{model_path}'에서 'person' 클래스를 찾을 수 없습니다.")
 
-            logger.info(f"PersonDetector 초기화 완료: {model_path}, 임계값: {conf_threshold}")
+            logger.info(f"PersonDetector 초기화 완료: {model_path}, 임계값: {conf_threshold}, 백엔드: {backend}/{precision}")
             logger.info(f"'person' 클래스 ID는 {self.person_class_id} 입니다.")
 
         except Exception as e:
@@ -54,12 +63,14 @@ class PersonDetector:
             logger.error(f"클래스 ID를 찾는 중 오류 발생: {e}")
             return None
 
-    def detect(self, frame: np.ndarray) -> List[Dict[str, Any]]:
+    def detect(self, frame: np.ndarray, imgsz: int = None) -> List[Dict[str, Any]]:
         """
         프레임에서 사람을 감지합니다. 오류 발생 시 빈 리스트를 반환하여 시스템 안정성을 확보합니다.
 
         Args:
             frame: BGR 이미지 (numpy.ndarray)
+            imgsz: 모델 입력 크기 (긴 변 기준). 작은 ROI 크롭을 원본 크기 그대로 추론할 때 사용합니다.
+                   None이면 모델 기본값(640)을 사용합니다.
 
         Returns:
             감지된 사람 리스트 [{"bbox": [x1, y1, x2, y2], "confidence": conf}, ...]
@@ -70,18 +81,14 @@ class PersonDetector:
 
         try:
             # 예측 시에도 장치 지정
-            results = self.model.predict(source=frame, conf=self.conf_threshold, classes=[self.person_class_id], device=self.device, verbose=False)
+            predict_kwargs = {"imgsz": imgsz} if imgsz else {}
+            results = self.model.predict(source=frame, conf=self.conf_threshold, classes=[self.person_class_id], device=self.device, verbose=False, **predict_kwargs)
             
-            persons = []
-            if results and results[0].boxes is not None:
-                for box in results[0].boxes:
-                    conf = float(box.conf[0].item())
-                    x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
-
-                    persons.append({
-                        "bbox": [x1, y1, x2, y2],
-                        "confidence": conf
-                    })
+            # 박스 전체를 한 번에 NumPy로 옮긴 뒤 사람 레코드를 구성 (박스별 텐서 접근 비용 제거)
+            detections = boxes_to_array(results[0].boxes if results else None)
+            bboxes = detections[:, :4].astype(int).tolist()
+            confidences = detections[:, 4].tolist()
+            persons = [{"bbox": bbox, "confidence": conf} for bbox, conf in zip(bboxes, confidences)]
             return persons
 
         except Exception as e:
@@ -0,0 +1,245 @@
+import time
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+from loguru import logger
+
+from .box_utils import assign_boxes, box_iou
+
+
+class _KalmanBoxFilter:
+    """
+    bbox 중심/크기 [cx, cy, w, h]와 그 속도를 상태로 갖는 등속 칼만 필터.
+    프레임 간격이 일정하지 않으므로 실제 경과 시간(dt, 초)으로 예측합니다.
+    """
+
+    # 잡음 표준편차는 bbox 높이에 비례 (가까운/큰 사람일수록 픽셀 단위 움직임이 큼)
+    POSITION_STD = 0.05
+    VELOCITY_STD = 0.2
+    MEASUREMENT_STD = 0.02
+
+    def __init__(self, box: np.ndarray):
+        self.mean = np.concatenate([self._to_cxcywh(box), np.zeros(4)])
+        h = max(self.mean[3], 1.0)
+        std = np.array([self.POSITION_STD * h] * 4 + [self.VELOCITY_STD * h] * 4)
+        self.covariance = np.diag(std ** 2)
+
+    @staticmethod
+    def _to_cxcywh(box: np.ndarray) -> np.ndarray:
+        x1, y1, x2, y2 = box
+        return np.array([(x1 + x2) / 2, (y1 + y2) / 2, x2 - x1, y2 - y1], dtype=np.float64)
+
+    def predict(self, dt: float):
+        transition = np.eye(8)
+        transition[:4, 4:] = np.eye(4) * dt
+        h = max(self.mean[3], 1.0)
+        std = np.array([self.POSITION_STD * h] * 4 + [self.VELOCITY_STD * h] * 4) * max(dt, 1e-3)
+        self.mean = transition @ self.mean
+        self.mean[2:4] = np.maximum(self.mean[2:4], 1.0)
+        self.covariance = transition @ self.covariance @ transition.T + np.diag(std ** 2)
+
+    def update(self, box: np.ndarray):
+        measurement = self._to_cxcywh(box)
+        projection = np.eye(4, 8)
+        noise = np.diag((np.full(4, self.MEASUREMENT_STD * max(measurement[3], 1.0))) ** 2)
+        innovation_cov = projection @ self.covariance @ projection.T + noise
+        gain = self.covariance @ projection.T @ np.linalg.inv(innovation_cov)
+        self.mean = self.mean + gain @ (measurement - projection @ self.mean)
+        self.covariance = (np.eye(8) - gain @ projection) @ self.covariance
+
+    def box(self, lookahead: float = 0.0) -> np.ndarray:
+        """현재(또는 lookahead초 뒤) 상태의 xyxy bbox."""
+        cx, cy, w, h = self.mean[:4] + self.mean[4:] * lookahead
+        return np.array([cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2])
+
+
+class _Track:
+    """추적 중인 사람 한 명. 마지막 탐지 결과(신뢰도, 자세 분석 등)를 함께 보관합니다."""
+
+    def __init__(self, track_id: int, person: Dict[str, Any], now: float):
+        self.track_id = track_id
+        self.filter = _KalmanBoxFilter(np.asarray(person["bbox"], dtype=np.float64))
+        self.person = person
+        self.last_time = now
+        self.missed = 0  # 연속으로 탐지와 매칭되지 않은 탐지 횟수
+
+    def predict(self, now: float):
+        self.filter.predict(now - self.last_time)
+        self.last_time = now
+
+
+class PersonTracker:
+    """
+    IoU 매칭 + 칼만 필터 기반의 사람 추적기 (카메라별로 생성).
+    탐지 결과에 유지되는 track_id를 부여하고, 탐지를 매 detect_interval 프레임마다만 수행하도록
+    그 사이 프레임에서는 등속 운동 예측으로 bbox를 전파합니다.
+    추적 중인 사람이 위험 구역에 접근하거나 넘어짐 상태이면 즉시 탐지를 강제하여 구역 주변의 공백을 막습니다.
+    """
+
+    def __init__(self, detect_interval: int = 3, iou_threshold: float = 0.3, max_missed: int = 2,
+                 zone_margin: int = 60, max_detection_gap: float = 0.5):
+        """
+        Args:
+            detect_interval: 전체 탐지 주기 (프레임). 1이면 매 프레임 탐지 (추적 ID만 부여)
+            iou_threshold: 예측 bbox와 탐지 bbox를 같은 사람으로 매칭할 최소 IoU
+            max_missed: 연속으로 이 횟수를 초과해 탐지되지 않으면 추적을 종료
+            zone_margin: 예측 bbox가 위험 구역 bounding_rect에서 이 거리(픽셀) 이내면 탐지를 강제
+            max_detection_gap: 예측만으로 전파할 수 있는 최대 시간 (초). 넘으면 탐지를 강제
+        """
+        self.detect_interval = max(1, int(detect_interval))
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed
+        self.zone_margin = zone_margin
+        self.max_detection_gap = max_detection_gap
+
+        self.tracks: List[_Track] = []
+        self._next_id = 1
+        self._frames_since_detection = 0
+        self._last_detection_time: Optional[float] = None
+        self._last_frame_time: Optional[float] = None
+
+        # 통계
+        self.frames_total = 0
+        self.frames_detected = 0
+        self.forced_by_zone = 0
+        self.forced_by_posture = 0
+        self.forced_by_caller = 0
+
+        logger.info(f"PersonTracker 초기화 완료: 탐지 주기={self.detect_interval}프레임, IoU 임계값={iou_threshold}, "
+                    f"구역 여유={zone_margin}px, 최대 예측 시간={max_detection_gap}s")
+
+    def should_detect(self, zone_rects: List[Tuple[int, int, int, int]], now: Optional[float] = None,
+                      force: bool = False) -> bool:
+        """
+        이번 프레임에서 전체 탐지를 수행해야 하는지 판단합니다.
+        False를 반환하면 호출자는 predict()로 추적 결과를 사용합니다.
+
+        Args:
+            zone_rects: 이 카메라의 위험 구역 bounding_rect (x, y, w, h) 목록 (사람 bbox와 같은 좌표계)
+            force: 호출자가 탐지를 강제하는 경우 True (예: 모션 게이트가 구역 주변의 움직임을 감지.
+                   아직 추적되지 않은 사람이 구역 근처에 처음 나타난 경우는 추적만으로 알 수 없음)
+        """
+        now = time.monotonic() if now is None else now
+        self.frames_total += 1
+        if force:
+            self.forced_by_caller += 1
+            return True
+        if self._last_detection_time is None or self._frames_since_detection + 1 >= self.detect_interval:
+            return True
+        if now - self._last_detection_time >= self.max_detection_gap:
+            return True
+
+        visible = [track for track in self.tracks if track.missed == 0]
+        if any(track.person.get("pose_analysis", {}).get("is_falling") for track in visible):
+            # 넘어짐 상태는 매 프레임 확인 (해제/지속 여부가 곧바로 제어에 반영되어야 함)
+            self.forced_by_posture += 1
+            return True
+        if zone_rects and visible and self._near_zone(visible, zone_rects, now):
+            self.forced_by_zone += 1
+            return True
+        return False
+
+    def _near_zone(self, tracks: List[_Track], zone_rects, now: float) -> bool:
+        """예측 bbox(또는 다음 탐지 시점까지 이동할 bbox)가 구역 bounding_rect(+여유)에 닿는지 검사합니다."""
+        rects = np.asarray(zone_rects, dtype=np.float64)
+        zones = np.column_stack([rects[:, 0] - self.zone_margin, rects[:, 1] - self.zone_margin,
+                                 rects[:, 0] + rects[:, 2] + self.zone_margin, rects[:, 1] + rects[:, 3] + self.zone_margin])
+        lookahead = self.detect_interval * (now - self._last_frame_time if self._last_frame_time is not None else 0.0)
+        boxes = []
+        for track in tracks:
+            track.predict(now)
+            boxes.append(track.filter.box())
+            boxes.append(track.filter.box(lookahead))
+        boxes = np.array(boxes)
+        overlap = ((boxes[:, None, 0] <= zones[None, :, 2]) & (boxes[:, None, 2] >= zones[None, :, 0]) &
+                   (boxes[:, None, 1] <= zones[None, :, 3]) & (boxes[:, None, 3] >= zones[None, :, 1]))
+        return bool(overlap.any())
+
+    def update(self, persons: List[Dict[str, Any]], now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        전체 탐지 결과로 추적을 갱신하고, 각 사람에게 'track_id'를 부여하여 반환합니다. (제자리 수정)
+        예측 bbox와의 IoU가 큰 쌍부터 탐욕적으로 매칭하며, 매칭되지 않은 탐지는 새 추적이 됩니다.
+        """
+        now = time.monotonic() if now is None else now
+        self.frames_detected += 1
+        self._frames_since_detection = 0
+        self._last_detection_time = now
+        self._last_frame_time = now
+
+        for track in self.tracks:
+            track.predict(now)
+
+        matched_tracks, matched_persons = set(), set()
+        if self.tracks and persons:
+            ious = box_iou(np.array([track.filter.box() for track in self.tracks]),
+                           np.array([person["bbox"] for person in persons]))
+            for t, p in assign_boxes(ious, self.iou_threshold, strategy="greedy"):
+                matched_tracks.add(t)
+                matched_persons.add(p)
+                track = self.tracks[t]
+                track.filter.update(np.asarray(persons[p]["bbox"], dtype=np.float64))
+                track.person = persons[p]
+                track.missed = 0
+                persons[p]["track_id"] = track.track_id
+
+        for t, track in enumerate(self.tracks):
+            if t not in matched_tracks:
+                track.missed += 1
+        self.tracks = [track for track in self.tracks if track.missed <= self.max_missed]
+
+        for p, person in enumerate(persons):
+            if p not in matched_persons:
+                track = _Track(self._next_id, person, now)
+                self._next_id += 1
+                self.tracks.append(track)
+                person["track_id"] = track.track_id
+        return persons
+
+    def predict(self, frame_size: Tuple[int, int], now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        탐지를 건너뛴 프레임에서 마지막 탐지와 매칭된 추적들의 bbox를 운동 예측으로 전파하여 반환합니다.
+        신뢰도/자세 분석은 마지막 탐지 결과를 유지하며, 'predicted': True로 표시됩니다.
+        """
+        now = time.monotonic() if now is None else now
+        self._frames_since_detection += 1
+        self._last_frame_time = now
+        frame_w, frame_h = frame_size
+
+        persons = []
+        for track in self.tracks:
+            if track.missed > 0:
+                continue
+            track.predict(now)
+            x1, y1, x2, y2 = track.filter.box()
+            bbox = [int(round(np.clip(x1, 0, frame_w))), int(round(np.clip(y1, 0, frame_h))),
+                    int(round(np.clip(x2, 0, frame_w))), int(round(np.clip(y2, 0, frame_h)))]
+            if bbox[2] <= bbox[0] or bbox[3] <= bbox[1]:
+                continue
+            persons.append({**track.person, "bbox": bbox, "track_id": track.track_id, "predicted": True})
+        return persons
+
+    def skip_frame(self, now: Optional[float] = None):
+        """
+        탐지도 예측도 하지 않고 직전 결과를 그대로 재사용한 프레임(모션 게이트 건너뛰기, 중복 프레임)을 기록합니다.
+        탐지 주기(detect_interval) 계산에 포함되어, 다음 움직임 프레임에서 탐지가 밀리지 않습니다.
+        """
+        now = time.monotonic() if now is None else now
+        self.frames_total += 1
+        self._frames_since_detection += 1
+        self._last_frame_time = now
+
+    def reset(self):
+        """모든 추적을 종료하여 다음 프레임에서 반드시 탐지하도록 합니다."""
+        self.tracks = []
+        self._last_detection_time = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """탐지 비율, 강제 탐지 횟수, 현재 추적 수 등 통계를 반환합니다."""
+        return {
+            "frames_total": self.frames_total,
+            "frames_detected": self.frames_detected,
+            "detection_rate": self.frames_detected / self.frames_total if self.frames_total else 0.0,
+            "forced_by_zone": self.forced_by_zone,
+            "forced_by_posture": self.forced_by_posture,
+            "forced_by_caller": self.forced_by_caller,
+            "active_tracks": sum(1 for track in self.tracks if track.missed == 0),
+        }
@@ -1,20 +1,76 @@
 import cv2
 import numpy as np
-from typing import List, Dict, Any
-from ultralytics import YOLO
+from typing import List, Dict, Any, Tuple
 from loguru import logger
 import torch
 
+from .box_utils import assign_boxes, box_iou, boxes_to_array, suppress_duplicates
+from .onnx_backend import load_yolo_model, require_optional
+
+
+def crop_person_regions(frame: np.ndarray, bboxes, padding: float) -> Tuple[List[np.ndarray], List[Tuple[int, int]]]:
+    """
+    각 bbox에 여백(bbox 크기 대비 padding 비율)을 더해 잘라낸 크롭 목록과 크롭의 좌상단 좌표 목록을 반환합니다.
+    ('crops' 추론 모드와 INT8 양자화 보정 데이터 생성에서 함께 사용)
+    """
+    frame_h, frame_w = frame.shape[:2]
+    crops, offsets = [], []
+    for x1, y1, x2, y2 in bboxes:
+        pad_x = int((x2 - x1) * padding)
+        pad_y = int((y2 - y1) * padding)
+        cx1, cy1 = max(0, x1 - pad_x), max(0, y1 - pad_y)
+        cx2, cy2 = min(frame_w, x2 + pad_x), min(frame_h, y2 + pad_y)
+        if cx2 <= cx1 or cy2 <= cy1:
+            continue
+        crops.append(frame[cy1:cy2, cx1:cx2])
+        offsets.append((cx1, cy1))
+    return crops, offsets
+
+
 class PoseDetector:
     """
     fall_det_1.pt 모델을 사용하여 넘어짐 상태를 탐지합니다.
     PersonDetector로부터 받은 사람 BBox 정보를 활용하여 연산을 최적화합니다.
     """
 
-    def __init__(self, fall_model_path='fall_det_1.pt', conf_threshold=0.4):
+    INFERENCE_MODES = ("full_frame", "crops")
+    MATCH_STRATEGIES = ("greedy", "hungarian", "any")
+    # 'crops' 모드에서 여백이 겹친 크롭들이 같은 넘어짐을 각각 감지한 bbox를 하나로 합치는 IoU 기준
+    CROP_NMS_IOU = 0.5
+
+    def __init__(self, fall_model_path='fall_det_1.pt', conf_threshold=0.4,
+                 inference_mode: str = "full_frame", crop_padding: float = 0.15, crop_imgsz: int = 320,
+                 backend: str = "torch", intra_op_threads: int = None,
+                 precision: str = "fp32", match_strategy: str = "greedy", fall_iou_threshold: float = 0.5):
         """
         자세 탐지기 초기화. fall_det_1.pt 모델만 로드합니다.
+
+        Args:
+            inference_mode: 'full_frame'은 프레임 전체에 넘어짐 모델을 다시 실행하고,
+                            'crops'는 탐지된 사람 영역만 잘라 한 번의 배치 추론으로 분류합니다.
+                            (연산량이 프레임 크기가 아닌 사람 수에 비례)
+            crop_padding: 'crops' 모드에서 사람 bbox 주변에 덧붙일 여백 (bbox 크기 대비 비율)
+            crop_imgsz: 'crops' 모드의 모델 입력 크기 (긴 변 기준 픽셀)
+            backend: 추론 백엔드 ('torch' 또는 'onnx', PersonDetector와 동일)
+            intra_op_threads: 'onnx' 백엔드의 연산자 내부 스레드 수
+            precision: 'fp32' 또는 'int8' (PersonDetector와 동일)
+            match_strategy: 사람과 넘어짐 bbox의 연결 방식. 'greedy'/'hungarian'은 넘어짐 bbox 하나를 한 사람에게만
+                            배정하고 (겹쳐 선 여러 사람이 같은 넘어짐으로 판정되지 않도록), 'any'는 IoU가 임계값을 넘는
+                            넘어짐 bbox가 하나라도 있으면 넘어짐으로 봅니다. (기존 방식)
+            fall_iou_threshold: 사람과 넘어짐 bbox를 같은 대상으로 볼 최소 IoU
         """
+        if inference_mode not in self.INFERENCE_MODES:
+            raise ValueError(f"알 수 없는 추론 모드입니다: {inference_mode} (사용 가능: {self.INFERENCE_MODES})")
+        self.inference_mode = inference_mode
+        if match_strategy not in self.MATCH_STRATEGIES:
+            raise ValueError(f"알 수 없는 매칭 방식입니다: {match_strategy} (사용 가능: {self.MATCH_STRATEGIES})")
+        if match_strategy == "hungarian":
+            require_optional("scipy", "'hungarian' 매칭")
+        self.match_strategy = match_strategy
+        self.fall_iou_threshold = fall_iou_threshold
+        self.crop_padding = crop_padding
+        self.crop_imgsz = crop_imgsz
+
         try:
             # 1. 하드웨어 장치 자동 감지 (CUDA > MPS > CPU 순)
             if torch.cuda.is_available():
@@ -27,68 +83,105 @@ class PoseDetector:
                 self.device = torch.device("cpu")
                 logger.warning("PoseDetector: 사용 가능한 GPU가 없어 CPU를 사용합니다.")
             
-            self.fall_model = YOLO(fall_model_path)
-            self.fall_model.to(self.device)
+            self.backend = backend
+            self.fall_model = load_yolo_model(fall_model_path, backend=backend, device=self.device,
+                                              intra_op_threads=intra_op_threads, precision=precision)
             self.conf_threshold = conf_threshold
-            logger.info(f"PoseDetector 초기화 완료: fall_model({fall_model_path}) 로드 완료")
+            # 'Fall-Detected' 클래스 ID를 미리 찾아 두어 결과 처리 시 박스별 이름 조회를 피함
+            self.fall_class_ids = [class_id for class_id, name in self.fall_model.names.items() if name == 'Fall-Detected']
+            logger.info(f"PoseDetector 초기화 완료: fall_model({fall_model_path}) 로드 완료, 추론 모드: {inference_mode}, 백엔드: {backend}/{precision}")
         except Exception as e:
             logger.error(f"PoseDetector 초기화 중 모델 로드 실패: {e}")
             raise
 
-    def _calculate_iou(self, boxA: np.ndarray, boxB: np.ndarray) -> float:
-        """두 바운딩 박스 간의 Intersection over Union (IoU)을 계산합니다."""
-        xA = max(boxA[0], boxB[0])
-        yA = max(boxA[1], boxB[1])
-        xB = min(boxA[2], boxB[2])
-        yB = min(boxA[3], boxB[3])
-
-        interArea = max(0, xB - xA) * max(0, yB - yA)
-        boxAArea = (boxA[2] - boxA[0]) * (boxA[3] - boxA[1])
-        boxBArea = (boxB[2] - boxB[0]) * (boxB[3] - boxB[1])
-        
-        # ZeroDivisionError 방지
-        denominator = float(boxAArea + boxBArea - interArea)
-        if denominator == 0:
-            return 0.0
-            
-        iou = interArea / denominator
-        return iou
-
-    def detect(self, frame: np.ndarray, detected_persons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def detect(self, frame: np.ndarray, detected_persons: List[Dict[str, Any]], imgsz: int = None) -> List[Dict[str, Any]]:
         """
         미리 감지된 사람(detected_persons)을 대상으로 넘어짐을 분석합니다.
+        imgsz를 지정하면 모델 입력 크기(긴 변 기준)를 해당 값으로 사용합니다. (ROI 크롭 추론용)
         """
         # 사람이 없으면 분석할 필요 없음
         if not detected_persons:
             return []
             
         try:
-            # 1. 넘어짐 감지 모델 실행
-            fall_results = self.fall_model.predict(source=frame, conf=self.conf_threshold, device=self.device, verbose=False)
+            # 1~2. 넘어짐 감지 모델을 실행하고 'Fall-Detected' 바운딩 박스 목록(프레임 좌표)을 추출
+            if self.inference_mode == "crops":
+                fall_bboxes = self._detect_falls_in_crops(frame, detected_persons)
+            else:
+                predict_kwargs = {"imgsz": imgsz} if imgsz else {}
+                fall_results = self.fall_model.predict(source=frame, conf=self.conf_threshold, device=self.device, verbose=False, **predict_kwargs)
+                fall_bboxes = self._extract_fall_bboxes(fall_results[0]) if fall_results else []
         except Exception as e:
             logger.error(f"넘어짐 감지 모델 예측 중 오류 발생: {e}")
             return detected_persons # 오류 발생 시 원본 반환
 
-        # 2. 넘어짐 모델에서 'Fall-Detected'로 감지된 바운딩 박스 목록 추출
-        fall_bboxes = []
-        if fall_results and fall_results[0].boxes:
-            for box in fall_results[0].boxes:
-                # 모델의 클래스 이름 목록에서 'Fall-Detected'를 찾아 ID를 비교
-                if self.fall_model.names[int(box.cls)] == 'Fall-Detected':
-                    fall_bboxes.append(box.xyxy[0].cpu().numpy().astype(int))
-
-        # 3. 각 사람에 대해 넘어짐 분석 수행
-        for person in detected_persons:
-            person_bbox = np.array(person['bbox'])
-            analysis = self._analyze_pose(person_bbox, fall_bboxes)
+        # 3. 사람×넘어짐 bbox IoU 행렬로 연결한 뒤 각 사람에 대해 넘어짐 분석 수행
+        person_bboxes = np.array([person['bbox'] for person in detected_persons])
+        model_falling = self._match_fall_bboxes(person_bboxes, fall_bboxes)
+        for person, person_bbox, is_model_falling in zip(detected_persons, person_bboxes, model_falling):
             # person 딕셔너리에 분석 결과 추가
-            person['pose_analysis'] = analysis
+            person['pose_analysis'] = self._analyze_pose(person_bbox, bool(is_model_falling))
         
         return detected_persons
 
-    def _analyze_pose(self, person_bbox: np.ndarray, fall_bboxes: List[np.ndarray]) -> Dict[str, Any]:
+    def _extract_fall_bboxes(self, result, offset: Tuple[int, int] = (0, 0)) -> List[np.ndarray]:
+        """
+        모델 결과 하나에서 'Fall-Detected'로 감지된 바운딩 박스를 추출합니다.
+        offset은 크롭 좌표를 프레임 좌표로 되돌리기 위한 (x, y) 이동량입니다.
+        """
+        fall_bboxes, _ = self._extract_fall_detections(result, offset)
+        return list(fall_bboxes)
+
+    def _extract_fall_detections(self, result, offset: Tuple[int, int] = (0, 0)) -> Tuple[np.ndarray, np.ndarray]:
+        """모델 결과 하나의 'Fall-Detected' bbox (K, 4) (프레임 좌표, 정수)와 신뢰도 (K,)를 반환합니다."""
+        detections = boxes_to_array(result.boxes)
+        is_fall = np.isin(detections[:, 5].astype(int), self.fall_class_ids)
+        ox, oy = offset
+        fall_bboxes = detections[is_fall, :4].astype(int) + np.array([ox, oy, ox, oy])
+        return fall_bboxes, detections[is_fall, 4]
+
+    def _crop_person_regions(self, frame: np.ndarray, detected_persons: List[Dict[str, Any]]) -> Tuple[List[np.ndarray], List[Tuple[int, int]]]:
+        """각 사람의 bbox에 여백을 더해 잘라낸 크롭 목록과 크롭의 좌상단 좌표 목록을 반환합니다."""
+        return crop_person_regions(frame, [person['bbox'] for person in detected_persons], self.crop_padding)
+
+    def _detect_falls_in_crops(self, frame: np.ndarray, detected_persons: List[Dict[str, Any]]) -> List[np.ndarray]:
         """
-        단일 사람의 자세를 분석합니다. BBox 비율과 넘어짐 모델 결과를 결합합니다.
+        사람 영역 크롭들을 한 번의 배치 추론으로 분류하고, 감지된 넘어짐 bbox를 프레임 좌표로 반환합니다.
+        여백 때문에 이웃한 사람의 크롭이 겹치면 같은 넘어짐이 여러 크롭에서 감지되므로, 프레임 좌표로 되돌린 뒤
+        NMS로 중복을 제거합니다. 반환된 bbox는 전체 프레임 모드와 같은 방식(_match_fall_bboxes의 IoU 매칭)으로
+        각 사람과 연결됩니다. (중복이 남아 있으면 일대일 배정에서 넘어진 사람 옆 사람까지 넘어짐으로 판정될 수 있음)
+        """
+        crops, offsets = self._crop_person_regions(frame, detected_persons)
+        if not crops:
+            return []
+        fall_results = self.fall_model.predict(source=crops, imgsz=self.crop_imgsz, conf=self.conf_threshold,
+                                               device=self.device, verbose=False)
+        detections = [self._extract_fall_detections(result, offset) for result, offset in zip(fall_results, offsets)]
+        fall_bboxes = np.concatenate([bboxes for bboxes, _ in detections])
+        scores = np.concatenate([scores for _, scores in detections])
+        keep = suppress_duplicates(fall_bboxes, scores, self.CROP_NMS_IOU)
+        return list(fall_bboxes[keep])
+
+    def _match_fall_bboxes(self, person_bboxes: np.ndarray, fall_bboxes: List[np.ndarray]) -> np.ndarray:
+        """
+        사람 N명 × 넘어짐 bbox M개의 IoU 행렬을 한 번에 계산하여, 넘어짐 모델이 탐지한 사람 여부 (N,) 배열을 반환합니다.
+        """
+        model_falling = np.zeros(len(person_bboxes), dtype=bool)
+        if not len(person_bboxes) or not len(fall_bboxes):
+            return model_falling
+
+        ious = box_iou(person_bboxes, np.asarray(fall_bboxes))
+        if self.match_strategy == "any":
+            return (ious > self.fall_iou_threshold).any(axis=1)
+        # 기존과 같이 IoU가 임계값을 '초과'하는 쌍만 인정
+        threshold = np.nextafter(self.fall_iou_threshold, np.inf)
+        for person_index, _ in assign_boxes(ious, threshold, self.match_strategy):
+            model_falling[person_index] = True
+        return model_falling
+
+    def _analyze_pose(self, person_bbox: np.ndarray, is_model_falling: bool) -> Dict[str, Any]:
+        """
+        단일 사람의 자세를 분석합니다. BBox 비율과 넘어짐 모델 결과(IoU 매칭 여부)를 결합합니다.
         """
         analysis = {
             'is_falling': False,
@@ -107,13 +200,7 @@ class PoseDetector:
 
         # --- 넘어짐 탐지 ---
 
-        # 조건 1 (필수): 넘어짐 감지 모델이 이 사람을 탐지했는가?
-        is_model_falling = False
-        for fall_box in fall_bboxes:
-            if self._calculate_iou(person_bbox, fall_box) > 0.5:
-                is_model_falling = True
-                break
-        
+        # 조건 1 (필수): 넘어짐 감지 모델이 이 사람을 탐지했는가? (_match_fall_bboxes의 결과)
         # 필수 조건(is_model_falling)이 충족되었을 때만 추가 분석 수행
         if is_model_falling:
             # 조건 2 (선택): 바운딩 박스의 너비가 높이보다 1.4배 이상인가?
@@ -152,6 +239,8 @@ class PoseDetector:
 
             cv2.rectangle(result_frame, (bbox[0], bbox[1]), (bbox[2], bbox[3]), color, 2)
             label = f"Risk: {analysis.get('description', 'N/A')}"
+            if person.get('track_id') is not None:
+                label = f"#{person['track_id']} {label}"
             cv2.putText(result_frame, label, (bbox[0], bbox[1] - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
 
         return result_frame
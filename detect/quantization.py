@@ -0,0 +1,214 @@
+"""
+YOLO 모델 INT8 양자화 도구.
+녹화된 프레임으로 보정(calibration)하여 ONNX Runtime 정적 양자화 모델을 만들고,
+FP32 모델 대비 mAP와 프레임당 지연 시간을 측정합니다. (benchmarks/quantize_models.py에서 사용)
+"""
+import shutil
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Union
+
+import cv2
+import numpy as np
+from loguru import logger
+from onnxruntime.quantization import (CalibrationDataReader, CalibrationMethod, QuantFormat, QuantType,
+                                      quantize_static)
+
+from .box_utils import box_iou
+from .onnx_backend import OnnxYoloModel, preprocess_batch, quantized_model_path, require_optional
+
+# 양자화 후보 설정. 탐지 헤드(마지막 Detect 블록)는 박스 좌표 정밀도를 위해 FP32로 유지합니다.
+QUANTIZATION_VARIANTS: Dict[str, Dict[str, Any]] = {
+    "qdq_minmax": {"calibrate_method": CalibrationMethod.MinMax, "per_channel": False},
+    "qdq_minmax_pc": {"calibrate_method": CalibrationMethod.MinMax, "per_channel": True},
+    "qdq_entropy": {"calibrate_method": CalibrationMethod.Entropy, "per_channel": False},
+    "qdq_percentile_pc": {"calibrate_method": CalibrationMethod.Percentile, "per_channel": True},
+}
+
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+def _iter_source_frames(source: Path) -> Iterable[np.ndarray]:
+    """세션 파일(.session), 이미지 디렉터리, 영상 파일에서 프레임을 차례로 읽습니다."""
+    if source.is_dir():
+        for image_path in sorted(p for p in source.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES):
+            image = cv2.imread(str(image_path))
+            if image is not None:
+                yield image
+    elif source.suffix == ".session":
+        from input_adapter.session import SessionPlayer
+        with SessionPlayer(source, pacing="fast") as player:
+            for camera_key in player.camera_keys:
+                stream = player.stream(camera_key)
+                while (frame := stream.get_frame()) is not None:
+                    yield frame
+    else:
+        cap = cv2.VideoCapture(str(source))
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                yield frame
+        finally:
+            cap.release()
+
+
+def collect_frames(sources: List[Union[str, Path]], every: int = 15, max_frames: int = 400) -> List[np.ndarray]:
+    """
+    녹화 자료에서 every 프레임마다 하나씩, 최대 max_frames장을 뽑아 반환합니다.
+    (연속 프레임은 거의 같으므로 간격을 두고 뽑아 장면 다양성을 확보)
+    """
+    frames = []
+    for source in sources:
+        if len(frames) >= max_frames:
+            break
+        for index, frame in enumerate(_iter_source_frames(Path(source))):
+            if len(frames) >= max_frames:
+                break
+            if index % every == 0:
+                frames.append(frame)
+    logger.info(f"보정/평가용 프레임 {len(frames)}장 수집 완료 (소스 {len(sources)}개, {every}프레임 간격)")
+    return frames
+
+
+class FrameCalibrationReader(CalibrationDataReader):
+    """보정 이미지를 추론 때와 같은 레터박스 전처리로 하나씩 양자화기에 전달합니다."""
+
+    def __init__(self, input_name: str, images: List[np.ndarray], imgsz: int):
+        self.input_name = input_name
+        self.images = images
+        self.shape = (imgsz, imgsz)
+        self._index = 0
+
+    def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+        if self._index >= len(self.images):
+            return None
+        batch, _ = preprocess_batch([self.images[self._index]], self.shape)
+        self._index += 1
+        return {self.input_name: batch}
+
+    def rewind(self):
+        self._index = 0
+
+
+def detection_head_nodes(onnx_path: Union[str, Path]) -> List[str]:
+    """ultralytics가 내보낸 그래프에서 마지막 모듈(Detect 헤드, '/model.N/...')에 속한 노드 이름을 반환합니다."""
+    onnx = require_optional("onnx", "INT8 양자화")
+    graph = onnx.load(str(onnx_path), load_external_data=False).graph
+    module_ids = {}
+    for node in graph.node:
+        parts = node.name.split("/")
+        if len(parts) > 2 and parts[1].startswith("model.") and parts[1][6:].isdigit():
+            module_ids.setdefault(int(parts[1][6:]), []).append(node.name)
+    return module_ids[max(module_ids)] if module_ids else []
+
+
+def quantize_variant(fp32_path: Union[str, Path], variant: str, images: List[np.ndarray], imgsz: int) -> Path:
+    """
+    FP32 ONNX 모델을 보정 이미지로 정적 양자화(QDQ, 가중치 INT8 / 활성값 UINT8)하여
+    '<이름>.int8-<variant>.onnx'로 저장하고 경로를 반환합니다.
+    """
+    options = QUANTIZATION_VARIANTS[variant]
+    fp32_path = Path(fp32_path)
+    output_path = quantized_model_path(fp32_path, variant)
+    input_name = OnnxYoloModel(fp32_path).input_name
+
+    start = time.perf_counter()
+    quantize_static(
+        str(fp32_path), str(output_path),
+        FrameCalibrationReader(input_name, images, imgsz),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=options["per_channel"],
+        calibrate_method=options["calibrate_method"],
+        nodes_to_exclude=detection_head_nodes(fp32_path),
+    )
+    logger.info(f"양자화 완료: {output_path} ({variant}, 보정 이미지 {len(images)}장, {time.perf_counter() - start:.1f}초)")
+    return output_path
+
+
+def install_variant(fp32_path: Union[str, Path], variant: str) -> Path:
+    """선택한 후보를 탐지기가 로드하는 '<이름>.int8.onnx'로 복사합니다."""
+    installed = quantized_model_path(fp32_path)
+    shutil.copy2(quantized_model_path(fp32_path, variant), installed)
+    logger.info(f"INT8 모델 설치: {variant} -> {installed}")
+    return installed
+
+
+def run_model(model: OnnxYoloModel, inputs: List[List[np.ndarray]], conf: float,
+              classes: Optional[List[int]] = None, imgsz: Optional[int] = None, warmup: int = 3):
+    """
+    inputs의 각 항목(한 번의 predict 호출에 넘길 이미지 목록)을 추론하여
+    이미지별 탐지 결과 [x1, y1, x2, y2, conf, cls] 배열 목록과 호출당 지연 시간 통계(ms)를 반환합니다.
+    """
+    for images in inputs[:warmup]:
+        model.predict(images, conf=conf, classes=classes, imgsz=imgsz)
+
+    predictions, latencies = [], []
+    for images in inputs:
+        start = time.perf_counter()
+        results = model.predict(images, conf=conf, classes=classes, imgsz=imgsz)
+        latencies.append((time.perf_counter() - start) * 1000)
+        predictions.extend(result.boxes.data.numpy() for result in results)
+
+    latencies = np.array(latencies) if latencies else np.zeros(1)
+    return predictions, {"mean_ms": float(latencies.mean()), "p95_ms": float(np.percentile(latencies, 95))}
+
+
+def _average_precision(recall: np.ndarray, precision: np.ndarray) -> float:
+    """COCO 방식 101점 보간 AP."""
+    envelope = np.maximum.accumulate(np.concatenate([[0.0], precision, [0.0]])[::-1])[::-1]
+    recall = np.concatenate([[0.0], recall, [1.0]])
+    points = np.linspace(0, 1, 101)
+    # 각 재현율 지점에서 그 이상의 재현율로 얻을 수 있는 최대 정밀도 (도달하지 못한 지점은 끝의 0)
+    return float(np.mean(envelope[np.searchsorted(recall, points, side="left")]))
+
+
+def mean_average_precision(predictions: List[np.ndarray], references: List[np.ndarray],
+                           iou_thresholds: np.ndarray = np.linspace(0.5, 0.95, 10)) -> Dict[str, float]:
+    """
+    이미지별 예측과 기준 박스([x1, y1, x2, y2, conf, cls])로 mAP50, mAP50-95를 계산합니다.
+    기준 박스가 하나도 없으면 nan을 반환합니다.
+    """
+    classes = sorted({int(c) for ref in references for c in ref[:, 5]})
+    if not classes:
+        return {"map50": float("nan"), "map50_95": float("nan")}
+
+    aps = np.zeros((len(classes), len(iou_thresholds)))
+    for class_index, class_id in enumerate(classes):
+        scores, hits, total_refs = [], [], 0
+        for pred, ref in zip(predictions, references):
+            pred = pred[pred[:, 5] == class_id]
+            ref = ref[ref[:, 5] == class_id]
+            total_refs += len(ref)
+            if not len(pred):
+                continue
+            pred = pred[np.argsort(-pred[:, 4])]
+            image_hits = np.zeros((len(pred), len(iou_thresholds)), dtype=bool)
+            if len(ref):
+                ious = box_iou(pred[:, :4], ref[:, :4])
+                for t, threshold in enumerate(iou_thresholds):
+                    matched = np.zeros(len(ref), dtype=bool)
+                    for k in range(len(pred)):
+                        candidates = np.where(matched, 0.0, ious[k])
+                        j = int(candidates.argmax())
+                        if candidates[j] >= threshold:
+                            matched[j] = True
+                            image_hits[k, t] = True
+            scores.append(pred[:, 4])
+            hits.append(image_hits)
+
+        if not scores:
+            continue
+        order = np.argsort(-np.concatenate(scores))
+        hits = np.concatenate(hits)[order]
+        true_positives = np.cumsum(hits, axis=0)
+        false_positives = np.cumsum(~hits, axis=0)
+        for t in range(len(iou_thresholds)):
+            recall = true_positives[:, t] / total_refs
+            precision = true_positives[:, t] / (true_positives[:, t] + false_positives[:, t])
+            aps[class_index, t] = _average_precision(recall, precision)
+
+    return {"map50": float(aps[:, 0].mean()), "map50_95": float(aps.mean())}
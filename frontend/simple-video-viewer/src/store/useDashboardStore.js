@@ -305,24 +305,23 @@ const useDashboardStore = create((set, get) => ({
 
   // --- 위험 구역 CRUD 액션 ---
   handleCreateZone: async (ratioPoints) => {
-    const { newZoneName, imageSize } = get();
+    const { newZoneName } = get();
     // 사용자가 이름을 입력하지 않으면 기본 이름 사용
     const name = newZoneName.trim() || `새 구역 ${new Date().toLocaleTimeString()}`;
     
     // 프론트엔드에서 고유 ID 생성 (백엔드 API가 ID를 받도록 설계됨)
     const newZoneId = `zone_${Date.now()}`;
 
-    // 백엔드 모델에 맞게 좌표를 절대값으로 변환
-    const points = ratioPoints.map(r => ({
-      x: Math.round(r.x * (imageSize?.naturalWidth || 1)),
-      y: Math.round(r.y * (imageSize?.naturalHeight || 1)),
-    }));
+    // 좌표는 영상 크기에 대한 0~1 비율로 보내고 normalized로 명시합니다.
+    // (백엔드가 카메라 해상도와 관계없이 같은 영역으로 변환)
+    const points = ratioPoints.map(r => ({ x: r.x, y: r.y }));
 
     // 백엔드 API(POST /api/zones)로 보낼 데이터 객체
     const newZoneData = {
       id: newZoneId,
       name,
       points,
+      normalized: true,
     };
 
     try {
@@ -340,19 +339,16 @@ const useDashboardStore = create((set, get) => ({
   },
 
   handleUpdateZone: async (ratioPoints) => {
-    const { selectedZoneId, imageSize, zones } = get();
+    const { selectedZoneId, zones } = get();
     if (!selectedZoneId) return;
 
     const existingZone = zones.find(z => z.id === selectedZoneId);
     if (!existingZone) return;
 
-    const points = ratioPoints.map(r => ({
-      x: Math.round(r.x * (imageSize?.naturalWidth || 1)),
-      y: Math.round(r.y * (imageSize?.naturalHeight || 1)),
-    }));
+    const points = ratioPoints.map(r => ({ x: r.x, y: r.y }));
 
     try {
-      await zoneAPI.updateZone(selectedZoneId, { name: existingZone.name, points });
+      await zoneAPI.updateZone(selectedZoneId, { name: existingZone.name, points, normalized: true });
       await get().fetchZones();
       get().exitDangerMode();
     } catch (err) {
@@ -0,0 +1,105 @@
+import time
+import zlib
+import numpy as np
+from typing import Dict, Any, Optional
+from loguru import logger
+
+def frame_fingerprint(frame: np.ndarray, sample_step: int = 8) -> int:
+    """
+    프레임을 sample_step 간격으로 솎아낸 픽셀의 CRC32 값을 반환합니다.
+    1280x720 프레임, sample_step=8 기준 약 150~200마이크로초입니다.
+    값이 다르면 프레임이 확실히 다르지만, 같다고 해서 동일 프레임은 아니므로 (솎아낸 픽셀 밖의 변화는 놓침)
+    동일 여부는 full_frame_hash()로 확정합니다.
+    """
+    sample = np.ascontiguousarray(frame[::sample_step, ::sample_step])
+    return zlib.crc32(sample) ^ hash(frame.shape)
+
+
+def full_frame_hash(frame: np.ndarray) -> int:
+    """
+    프레임 전체 픽셀의 CRC32 값을 반환합니다. (1280x720 기준 약 1.5ms)
+    솎아낸 지문이 같을 때만 계산하며, 실제 카메라 영상은 센서 노이즈 때문에 정지 장면이라도 솎아낸 지문부터 달라집니다.
+    """
+    return zlib.crc32(np.ascontiguousarray(frame)) ^ hash(frame.shape)
+
+
+class FrozenFeedDetector:
+    """
+    카메라별 프레임 지문을 비교하여 동일 프레임(중복)을 표시하고,
+    지문이 stale_after초 이상 바뀌지 않으면 영상이 멈춘(stale) 것으로 판단합니다.
+
+    중복 판정은 정확해야 하므로 (탐지기가 중복 프레임의 추론을 건너뛰고 직전 결과를 재사용함)
+    봉투 순번(seq)이 직전과 같으면 같은 캡처를 다시 읽은 것으로 보고, 순번이 바뀌었으면 솎아낸 지문으로 빠르게 걸러낸 뒤
+    지문이 같을 때만 전체 프레임 해시로 확정합니다.
+    """
+
+    def __init__(self, sample_step: int = 8, stale_after: float = 3.0):
+        """
+        Args:
+            sample_step: 지문 계산 시 픽셀을 솎아내는 간격 (클수록 빠르지만 작은 변화를 놓칠 수 있음)
+            stale_after: 동일 프레임이 이 시간(초) 이상 이어지면 영상 정지로 판단
+        """
+        self.sample_step = sample_step
+        self.stale_after = stale_after
+        self._cameras: Dict[Any, Dict[str, Any]] = {}
+        logger.info(f"FrozenFeedDetector 초기화 완료: 샘플 간격={sample_step}, 정지 판단 시간={stale_after}s")
+
+    def update(self, camera_id, frame: np.ndarray, now: Optional[float] = None, seq: Optional[int] = None) -> Dict[str, Any]:
+        """
+        새 프레임의 지문을 기록하고 중복/정지 여부를 반환합니다.
+        :param seq: 프레임 봉투의 카메라별 순번 (없으면 픽셀로만 비교)
+        :return: {"duplicate": 직전 프레임과 동일 여부, "frozen_for": 지문이 바뀌지 않은 시간(초), "stale": 영상 정지 여부}
+        """
+        now = time.monotonic() if now is None else now
+        state = self._cameras.get(camera_id)
+
+        if state is not None and seq is not None and seq == state["seq"]:
+            same = True
+        else:
+            fingerprint = frame_fingerprint(frame, self.sample_step)
+            same = state is not None and state["fingerprint"] == fingerprint
+            if same:
+                # 솎아낸 지문이 같을 때만 전체 해시로 확정 (직전 프레임의 해시는 필요할 때 한 번만 계산)
+                if state["full_hash"] is None:
+                    state["full_hash"] = full_frame_hash(state["frame"])
+                full_hash = full_frame_hash(frame)
+                same = full_hash == state["full_hash"]
+            else:
+                full_hash = None
+
+        if not same:
+            if state is not None and state["stale"]:
+                logger.info(f"카메라 '{camera_id}' 영상이 다시 갱신됩니다. (정지 {now - state['changed_at']:.1f}초)")
+            self._cameras[camera_id] = {
+                "fingerprint": fingerprint,
+                "full_hash": full_hash,
+                "frame": frame,  # 다음 프레임의 지문이 같을 때 전체 해시를 계산하기 위해 참조만 보관
+                "seq": seq,
+                "changed_at": now,
+                "stale": False,
+                "duplicates": state["duplicates"] if state else 0,
+            }
+            return {"duplicate": False, "frozen_for": 0.0, "stale": False}
+
+        state["seq"] = seq
+        state["duplicates"] += 1
+        frozen_for = now - state["changed_at"]
+        stale = frozen_for >= self.stale_after
+        if stale and not state["stale"]:
+            logger.warning(f"카메라 '{camera_id}' 영상이 {frozen_for:.1f}초 동안 동일 프레임을 반복합니다. (영상 정지 의심)")
+        state["stale"] = stale
+        return {"duplicate": True, "frozen_for": frozen_for, "stale": stale}
+
+    def reset(self, camera_id=None):
+        """카메라(또는 전체)의 지문 기록을 초기화합니다. (재연결 직후 등)"""
+        if camera_id is None:
+            self._cameras.clear()
+        else:
+            self._cameras.pop(camera_id, None)
+
+    def get_stats(self) -> Dict[Any, Dict[str, Any]]:
+        """카메라별 누적 중복 프레임 수와 정지 여부를 반환합니다."""
+        return {
+            camera_id: {"duplicates": state["duplicates"], "stale": state["stale"]}
+            for camera_id, state in self._cameras.items()
+        }
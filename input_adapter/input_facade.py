@@ -1,8 +1,73 @@
 from .stream import VideoStream
+from .replay import ReplayStream
+from .session import SessionPlayer
 from .preprocess import VideoPreprocessor
 from .sensor import SensorReader
+from .frame_fingerprint import FrozenFeedDetector
+import time
 import numpy as np
+from typing import Dict, Any, List, Optional
 from loguru import logger
+from core.frame_envelope import FrameEnvelope
+
+
+def _reconnect_options(config: dict) -> Dict[str, Any]:
+    """입력 설정의 'reconnect' 항목을 VideoStream 재연결 인자로 변환합니다."""
+    reconnect_config = config.get('reconnect', {})
+    return {
+        'reconnect': reconnect_config.get('enabled', False),
+        'max_read_failures': reconnect_config.get('max_read_failures', 30),
+        'backoff_initial': reconnect_config.get('backoff_initial', 0.5),
+        'backoff_max': reconnect_config.get('backoff_max', 10.0),
+    }
+
+
+def _create_frozen_feed_detector(config: dict) -> Optional[FrozenFeedDetector]:
+    """입력 설정의 'frozen_feed' 항목이 활성화되어 있으면 FrozenFeedDetector를 생성합니다."""
+    frozen_config = config.get('frozen_feed', {})
+    if not frozen_config.get('enabled', False):
+        return None
+    return FrozenFeedDetector(
+        sample_step=frozen_config.get('sample_step', 8),
+        stale_after=frozen_config.get('stale_after', 3.0)
+    )
+
+
+def configured_camera_ids(config: dict) -> List[str]:
+    """입력 설정의 'cameras' 목록에서 카메라 ID를 설정 순서대로 반환합니다. (단일 카메라 구성이면 빈 목록)"""
+    return [str(camera_config.get('camera_id', f"cam{i}")) for i, camera_config in enumerate(config.get('cameras', []))]
+
+
+def _create_sensor_reader(config: dict) -> SensorReader:
+    """
+    입력 설정의 센서 모드('sensor_mock_mode'), GPIO 핀('sensor_pin'), 센서 종류('sensor_types')로 SensorReader를 생성합니다.
+    실제 모드인데 핀이 없으면 읽을 하드웨어가 없으므로 모의 모드로 실행합니다.
+    """
+    mock_mode = config.get('sensor_mock_mode', True)
+    sensor_pin = config.get('sensor_pin')
+    if not mock_mode and sensor_pin is None:
+        logger.warning("sensor_pin이 설정되지 않아 센서를 모의 모드로 실행합니다.")
+        mock_mode = True
+    return SensorReader(sensor_pin=sensor_pin, sensor_types=config.get('sensor_types'), mock_mode=mock_mode,
+                        history_seconds=config.get('sensor_history_seconds', 60.0),
+                        sample_interval=config.get('sensor_sample_interval', 0.02))
+
+
+def _create_preprocessor(config: dict) -> VideoPreprocessor:
+    """
+    입력 설정의 'fused_preprocess' 항목에 따라 VideoPreprocessor를 생성합니다.
+    활성화 시 전처리 결과는 다음 프레임 처리 시 덮어써지는 내부 버퍼입니다.
+    """
+    return VideoPreprocessor(fused=config.get('fused_preprocess', False))
+
+
+def _create_session_player(config: dict) -> Optional[SessionPlayer]:
+    """입력 설정의 'session_replay' 항목이 있으면 SessionPlayer를 생성합니다."""
+    session_config = config.get('session_replay')
+    if not session_config:
+        return None
+    return SessionPlayer(**session_config)
+
 
 class InputAdapter:
     def __init__(self, config: dict):
@@ -10,28 +75,118 @@ class InputAdapter:
         InputAdapter는 카메라와 센서로부터 입력을 받아 전처리된 데이터를 반환하는 역할을 합니다.
         :param config: 입력 장치 관련 설정을 담은 딕셔너리
         """
+        self.is_multi_camera = False
         self.mock_mode = config.get('mock_mode', False)
+        self.camera_id = config.get('camera_id')  # 프레임 봉투에 기록될 카메라 ID (단일 카메라는 None 허용)
+        self._frame_seq: Dict[Any, int] = {}
+        # 프레임 지문으로 인코더가 반복 송출한 동일 프레임과 멈춘 영상을 판별 (비활성 시 None)
+        self.frozen_feed_detector = _create_frozen_feed_detector(config)
         camera_index = config.get('camera_index', 0)
-        sensor_pin = config.get('sensor_pin') # 없으면 None
+        # True일 경우 백그라운드 스레드가 카메라를 계속 읽고, get_frame()은 최신 프레임을 즉시 반환
+        threaded_capture = config.get('threaded_capture', False)
 
-        if not self.mock_mode:
+        # 'replay' 설정이 있으면 카메라 대신 녹화 영상/이미지 시퀀스를 재생합니다. (mock_mode보다 우선)
+        replay_config = config.get('replay')
+        # 'session_replay' 설정이 있으면 녹화 세션의 영상/센서/명령을 재생합니다. (가장 우선)
+        self.session_player = _create_session_player(config)
+
+        if self.session_player is not None:
+            self.stream = self.session_player.stream(self.camera_id)
+        elif replay_config:
+            self.stream = ReplayStream(**replay_config)
+        elif not self.mock_mode:
             # VideoStream 초기화 시 camera_index를 source로 전달
-            self.stream = VideoStream(source=camera_index)
+            self.stream = VideoStream(source=camera_index, threaded=threaded_capture, **_reconnect_options(config))
         else:
             self.stream = None
-        self.preprocessor = VideoPreprocessor()
-        # SensorReader 초기화
-        self.sensor = SensorReader(sensor_pin=sensor_pin if sensor_pin is not None else 0)
+        self.preprocessor = _create_preprocessor(config)
+        # SensorReader 초기화 (설정의 실제/모의 모드와 센서 종류를 그대로 전달)
+        self.sensor = _create_sensor_reader(config)
+        self._configure_session_sensor()
+        self._configure_sensor_events(config)
         logger.info("InputAdapter 초기화 완료.")
 
     def get_frame(self):
-        """카메라로부터 원본 프레임을 가져옵니다."""
-        if self.mock_mode or self.stream is None:
+        """
+        카메라로부터 원본 프레임을 가져옵니다.
+        threaded_capture 모드에서는 캡처 스레드가 게시한 최신 프레임을 블로킹 없이 반환합니다.
+        """
+        if self.stream is None:
             # 모의 모드에서는 더미 프레임 반환
             return np.zeros((480, 640, 3), dtype=np.uint8)
         
         return self.stream.get_frame()
 
+    def get_frame_envelope(self) -> Optional[FrameEnvelope]:
+        """원본 프레임을 캡처 시각/순번/카메라 ID와 함께 FrameEnvelope로 반환합니다."""
+        return self._read_envelope(self.stream, self.camera_id)
+
+    def _read_envelope(self, stream, camera_id) -> Optional[FrameEnvelope]:
+        """
+        스트림에서 프레임을 읽어 봉투로 감쌉니다.
+        캡처 스레드 모드에서는 스레드가 기록한 캡처 시각과 순번을 그대로 사용합니다.
+        """
+        envelope = self._capture_envelope(stream, camera_id)
+        if envelope is not None and self.frozen_feed_detector is not None and stream is not None:
+            # 모의 모드의 더미 프레임은 항상 동일하므로 지문 검사 대상에서 제외
+            feed = self.frozen_feed_detector.update(camera_id, envelope.frame, seq=envelope.seq)
+            envelope.duplicate = feed["duplicate"]
+            envelope.frozen_for = feed["frozen_for"]
+            envelope.stale = feed["stale"]
+        return envelope
+
+    def _capture_envelope(self, stream, camera_id) -> Optional[FrameEnvelope]:
+        """스트림에서 프레임 하나를 읽어 캡처 시각/순번과 함께 봉투로 감쌉니다."""
+        if stream is not None and getattr(stream, 'threaded', False):
+            latest = stream.get_latest()
+            if latest is None:
+                return None
+            frame, capture_ts, seq = latest
+            return FrameEnvelope(frame=frame, capture_ts=capture_ts, seq=seq, camera_id=camera_id)
+
+        if stream is None:
+            # 모의 모드에서는 더미 프레임 반환
+            frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        else:
+            frame = stream.get_frame()
+        capture_ts = time.monotonic()
+        if frame is None:
+            return None
+
+        seq = self._frame_seq.get(camera_id, 0) + 1
+        self._frame_seq[camera_id] = seq
+        return FrameEnvelope(frame=frame, capture_ts=capture_ts, seq=seq, camera_id=camera_id)
+
+    def get_camera_status(self) -> Dict[Any, bool]:
+        """
+        카메라별 연결 상태를 반환합니다.
+        재연결을 지원하지 않는 소스(녹화 재생, 모의 모드)는 항상 연결된 것으로 봅니다.
+        :return: {camera_id: 연결 여부}
+        """
+        return {self.camera_id: getattr(self.stream, 'connected', True)}
+
+    def _configure_session_sensor(self):
+        """세션 재생 중에는 센서가 재생 시각 기준의 녹화 값을 반환하도록 연결합니다."""
+        if self.session_player is not None:
+            self.sensor.set_replay_source(self.session_player.sensor_at)
+
+    def _configure_sensor_events(self, config: dict):
+        """
+        'sensor_event_driven' 설정 시 센서를 이벤트 구동 모드로 전환합니다.
+        이후 get_sensor_data()는 프레임마다 센서를 읽지 않고 최신 스냅샷을 반환하며,
+        경보 전환은 set_sensor_alert_callback()으로 등록한 콜백에 즉시 전달됩니다.
+        """
+        if config.get('sensor_event_driven', False):
+            self.sensor.start_event_driven(sample_interval=config.get('sensor_sample_interval', 0.02))
+            logger.info("센서 이벤트 구동 모드를 시작했습니다.")
+
+    def set_sensor_alert_callback(self, callback):
+        """
+        센서 경보 상태 전환 시 호출될 콜백을 등록합니다.
+        콜백은 (sensor_type, is_alert, data) 인자로 센서 스레드에서 호출됩니다.
+        """
+        self.sensor.add_alert_listener(callback)
+
     def get_sensor_data(self):
         """센서 데이터를 읽어옵니다."""
         return self.sensor.read()
@@ -49,6 +204,7 @@ class InputAdapter:
     def get_input(self):
         """
         [기존 호환성 유지] 카메라 프레임과 센서 데이터를 함께 가져와서 반환합니다.
+        fused_preprocess 설정 시 'frame'은 다음 호출에서 덮어써지므로 보관하려면 copy() 하십시오.
         """
         raw_frame = self.get_frame()
         if raw_frame is not None:
@@ -63,6 +219,108 @@ class InputAdapter:
 
     def release(self):
         """리소스(카메라 등)를 해제합니다."""
+        self.sensor.stop_event_driven()
         if self.stream is not None:
             self.stream.release()
             logger.info("카메라 리소스를 해제했습니다.")
+        if self.session_player is not None:
+            self.session_player.release()
+
+
+class MultiCameraInputAdapter(InputAdapter):
+    """
+    여러 대의 카메라를 하나의 입력 계층으로 묶는 어댑터.
+    한 워커 프로세스가 컨베이어 라인 전체(여러 CCTV 각도)를 동일한 모델로 처리할 수 있도록,
+    모든 프레임에 카메라 ID를 붙여 반환합니다.
+    """
+
+    def __init__(self, config: dict):
+        """
+        :param config: 입력 장치 관련 설정. 'cameras' 키에 카메라 목록을 담습니다.
+                       예: {"cameras": [{"camera_id": "line1_left", "camera_index": 0}, ...]}
+        """
+        self.is_multi_camera = True
+        self.mock_mode = config.get('mock_mode', False)
+        self._frame_seq: Dict[Any, int] = {}
+        self.frozen_feed_detector = _create_frozen_feed_detector(config)
+        self.session_player = _create_session_player(config)
+        threaded_capture = config.get('threaded_capture', False)
+
+        self.camera_ids: List[str] = []
+        self.streams: Dict[str, VideoStream] = {}
+        for i, (camera_id, camera_config) in enumerate(zip(configured_camera_ids(config), config.get('cameras', []))):
+            if camera_id in self.camera_ids:
+                raise ValueError(f"중복된 카메라 ID입니다: {camera_id}")
+            self.camera_ids.append(camera_id)
+
+            if self.session_player is not None:
+                self.streams[camera_id] = self.session_player.stream(camera_id)
+            elif camera_config.get('replay'):
+                self.streams[camera_id] = ReplayStream(**camera_config['replay'])
+            elif not self.mock_mode:
+                self.streams[camera_id] = VideoStream(
+                    source=camera_config.get('camera_index', i),
+                    threaded=camera_config.get('threaded_capture', threaded_capture),
+                    **_reconnect_options(config)
+                )
+
+        if not self.camera_ids:
+            raise ValueError("MultiCameraInputAdapter에는 최소 한 대의 카메라 설정이 필요합니다.")
+
+        # 단일 카메라 인터페이스(get_frame 등)와의 호환을 위해 첫 번째 카메라를 기본 스트림으로 사용
+        self.stream = self.streams.get(self.camera_ids[0])
+        self.camera_id = self.camera_ids[0]
+        self.preprocessor = _create_preprocessor(config)
+        self.sensor = _create_sensor_reader(config)
+        self._configure_session_sensor()
+        self._configure_sensor_events(config)
+        logger.info(f"MultiCameraInputAdapter 초기화 완료. 카메라: {self.camera_ids}")
+
+    def get_frames(self) -> Dict[str, np.ndarray]:
+        """
+        모든 카메라에서 프레임을 가져옵니다.
+        :return: {camera_id: frame} 딕셔너리. 프레임을 얻지 못한 카메라는 제외됩니다.
+        """
+        frames = {}
+        for camera_id in self.camera_ids:
+            stream = self.streams.get(camera_id)
+            if stream is None:
+                # 모의 모드에서는 더미 프레임 반환
+                frames[camera_id] = np.zeros((480, 640, 3), dtype=np.uint8)
+                continue
+            frame = stream.get_frame()
+            if frame is not None:
+                frames[camera_id] = frame
+        return frames
+
+    def get_camera_status(self) -> Dict[Any, bool]:
+        """카메라별 연결 상태를 반환합니다. (모의 모드 카메라는 항상 연결된 것으로 봅니다)"""
+        return {camera_id: getattr(self.streams.get(camera_id), 'connected', True) for camera_id in self.camera_ids}
+
+    def get_frame_envelopes(self) -> Dict[str, FrameEnvelope]:
+        """
+        모든 카메라에서 프레임을 가져와 FrameEnvelope로 반환합니다.
+        :return: {camera_id: FrameEnvelope} 딕셔너리. 프레임을 얻지 못한 카메라는 제외됩니다.
+        """
+        envelopes = {}
+        for camera_id in self.camera_ids:
+            envelope = self._read_envelope(self.streams.get(camera_id), camera_id)
+            if envelope is not None:
+                envelopes[camera_id] = envelope
+        return envelopes
+
+    def release(self):
+        """모든 카메라 리소스를 해제합니다."""
+        self.sensor.stop_event_driven()
+        for camera_id, stream in self.streams.items():
+            stream.release()
+            logger.info(f"카메라 '{camera_id}' 리소스를 해제했습니다.")
+        if self.session_player is not None:
+            self.session_player.release()
+
+
+def create_input_adapter(config: Dict[str, Any]) -> InputAdapter:
+    """입력 설정에 'cameras' 목록이 있으면 다중 카메라 어댑터를, 없으면 단일 카메라 어댑터를 생성합니다."""
+    if config.get('cameras'):
+        return MultiCameraInputAdapter(config)
+    return InputAdapter(config)
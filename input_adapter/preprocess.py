@@ -3,26 +3,89 @@ import numpy as np
 from typing import Tuple, Optional, Callable
 from loguru import logger
 
+class FusedPreprocessPipeline:
+    """
+    노이즈 감소(블러) -> 크기 조정 -> 정규화를 미리 할당된 버퍼 위에서 수행하는 전처리 파이프라인.
+    입력 프레임 크기별로 중간/출력 버퍼를 한 번만 할당하고, 이후에는 dst=/out= 인자로 제자리 연산합니다.
+
+    주의: 반환되는 배열은 내부 버퍼이므로 다음 호출 시 덮어써집니다.
+          프레임 간에 결과를 보관해야 한다면 호출 측에서 copy() 하십시오.
+    """
+
+    def __init__(self, target_size: Tuple[int, int], normalize: bool = True, apply_noise_reduction: bool = True):
+        """
+        :param target_size: 목표 이미지 크기 (width, height)
+        :param normalize: 정규화(float32, 0~1) 적용 여부
+        :param apply_noise_reduction: 가우시안 블러 적용 여부
+        """
+        self.target_size = target_size
+        self.normalize = normalize
+        self.apply_noise_reduction = apply_noise_reduction
+        self._input_shape = None
+        self._blur_buffer: Optional[np.ndarray] = None
+        self._resize_buffer: Optional[np.ndarray] = None
+        self._output_buffer: Optional[np.ndarray] = None
+
+    def _allocate(self, frame: np.ndarray):
+        """입력 프레임 형태에 맞는 버퍼를 할당합니다. (형태가 바뀔 때만 호출)"""
+        width, height = self.target_size
+        out_shape = (height, width) + frame.shape[2:]
+        self._blur_buffer = np.empty_like(frame) if self.apply_noise_reduction else None
+        self._resize_buffer = np.empty(out_shape, dtype=frame.dtype)
+        self._output_buffer = np.empty(out_shape, dtype=np.float32) if self.normalize and frame.dtype == np.uint8 else None
+        self._input_shape = (frame.shape, frame.dtype)
+        logger.debug(f"전처리 버퍼 할당: 입력={frame.shape}, 출력={out_shape}")
+
+    def __call__(self, frame: np.ndarray) -> np.ndarray:
+        if (frame.shape, frame.dtype) != self._input_shape:
+            self._allocate(frame)
+
+        source = frame
+        # 1. 노이즈 감소
+        if self._blur_buffer is not None:
+            cv2.GaussianBlur(frame, (5, 5), 0, dst=self._blur_buffer)
+            source = self._blur_buffer
+
+        # 2. 크기 조정
+        cv2.resize(source, self.target_size, dst=self._resize_buffer, interpolation=cv2.INTER_AREA)
+
+        # 3. 정규화
+        if self._output_buffer is None:
+            return self._resize_buffer
+        np.multiply(self._resize_buffer, np.float32(1.0 / 255.0), out=self._output_buffer, dtype=np.float32)
+        return self._output_buffer
+
+
 class VideoPreprocessor:
     """비디오 프레임 전처리 클래스"""
     
     def __init__(self, target_size: Tuple[int, int] = (640, 640), 
                  normalize: bool = True, 
-                 apply_noise_reduction: bool = True):
+                 apply_noise_reduction: bool = True,
+                 fused: bool = False):
         """
         전처리기를 초기화합니다.
         :param target_size: 목표 이미지 크기 (width, height)
         :param normalize: 정규화 적용 여부
         :param apply_noise_reduction: 노이즈 감소 적용 여부
+        :param fused: True일 경우 process_frame이 버퍼를 재사용하는 FusedPreprocessPipeline을 사용합니다.
+                      반환 배열은 내부 버퍼이므로 다음 process_frame 호출 시 덮어써집니다.
+                      호출 측은 반환 배열을 다음 호출 이후까지 보관하지 말고, 필요하면 copy() 하십시오.
         """
         self.target_size = target_size
         self.normalize = normalize
         self.apply_noise_reduction = apply_noise_reduction
+        self.fused = fused
+        self._fused_pipeline = self.compile_pipeline() if fused else None
         
         # 노이즈 감소를 위한 커널
         self.noise_kernel = np.ones((3, 3), np.uint8)
         
-        logger.info(f"전처리기 초기화: 크기={target_size}, 정규화={normalize}, 노이즈감소={apply_noise_reduction}")
+        logger.info(f"전처리기 초기화: 크기={target_size}, 정규화={normalize}, 노이즈감소={apply_noise_reduction}, 버퍼재사용={fused}")
+
+    def compile_pipeline(self) -> FusedPreprocessPipeline:
+        """현재 설정(크기/정규화/노이즈 감소)으로 버퍼를 재사용하는 전처리 파이프라인을 생성합니다."""
+        return FusedPreprocessPipeline(self.target_size, self.normalize, self.apply_noise_reduction)
 
     def process_frame(self, frame: np.ndarray) -> np.ndarray:
         """
@@ -35,6 +98,9 @@ class VideoPreprocessor:
             return None
         
         try:
+            if self._fused_pipeline is not None:
+                return self._fused_pipeline(frame)
+
             # 1. 노이즈 감소
             if self.apply_noise_reduction:
                 frame = self._reduce_noise(frame)
@@ -137,12 +203,27 @@ class VideoPreprocessor:
         
         return stats
 
-    def create_processing_pipeline(self, steps: list) -> Callable:
+    # 버퍼 재사용 파이프라인으로 합쳐질 수 있는 단계 (이 순서대로 적용되어야 함)
+    FUSABLE_STEPS = ("_reduce_noise", "_resize_frame", "_normalize_frame")
+
+    def create_processing_pipeline(self, steps: list, fused: bool = False) -> Callable:
         """
         전처리 파이프라인을 생성합니다.
         :param steps: 전처리 단계 리스트
+        :param fused: True이고 steps가 노이즈 감소/크기 조정/정규화로만 이루어진 경우,
+                      단계별 배열 할당 없이 버퍼를 재사용하는 파이프라인을 반환합니다.
         :return: 파이프라인 함수
         """
+        if fused:
+            order = [self.FUSABLE_STEPS.index(step) for step in steps if step in self.FUSABLE_STEPS]
+            if len(order) == len(steps) and order == sorted(order) and "_resize_frame" in steps:
+                return FusedPreprocessPipeline(
+                    self.target_size,
+                    normalize="_normalize_frame" in steps,
+                    apply_noise_reduction="_reduce_noise" in steps
+                )
+            logger.warning(f"버퍼 재사용 파이프라인으로 합칠 수 없는 단계 구성입니다: {steps}. 일반 파이프라인을 사용합니다.")
+
         def pipeline(frame):
             result = frame
             for step in steps:
@@ -0,0 +1,162 @@
+import cv2
+import numpy as np
+from pathlib import Path
+from typing import Optional, Tuple, List
+import time
+from loguru import logger
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp"}
+
+class ReplayStream:
+    """
+    녹화된 비디오 파일 또는 이미지 시퀀스 디렉토리를 재생하는 스트림 클래스.
+    VideoStream과 같은 인터페이스를 제공하여, 카메라 없이도 전체 파이프라인을
+    실제 영상으로 벤치마크하고 회귀 테스트할 수 있게 합니다.
+    """
+
+    PACING_MODES = ("realtime", "fast")
+
+    def __init__(self, path, pacing: str = "realtime", loop: bool = False, fps: Optional[float] = None):
+        """
+        재생 스트림을 초기화합니다.
+        :param path: 비디오 파일 경로 또는 프레임 이미지가 들어있는 디렉토리 경로
+        :param pacing: 'realtime'은 원본 FPS에 맞춰 프레임을 내보내고, 'fast'는 대기 없이 최대한 빠르게 내보냅니다.
+        :param loop: True일 경우 끝에 도달하면 처음부터 다시 재생합니다.
+        :param fps: 재생 FPS. 지정하지 않으면 비디오의 FPS(이미지 시퀀스는 30)를 사용합니다.
+        """
+        if pacing not in self.PACING_MODES:
+            raise ValueError(f"알 수 없는 재생 속도 모드입니다: {pacing} (사용 가능: {self.PACING_MODES})")
+
+        self.source = Path(path)
+        self.pacing = pacing
+        self.loop = loop
+        self.cap = None
+        self.image_paths: List[Path] = []
+        self.is_finished = False
+
+        self.frame_index = 0      # 현재 재생 위치 (루프 시 0으로 되돌아감)
+        self.frames_served = 0    # 시작 이후 반환한 전체 프레임 수
+        self.frames_skipped = 0   # 읽을 수 없어 건너뛴 이미지 수
+        self.loop_count = 0
+
+        self._open_source()
+        self.fps = fps or self._source_fps() or 30.0
+        self._frame_interval = 1.0 / self.fps
+        self._start_time: Optional[float] = None
+
+        logger.info(f"재생 스트림 초기화 완료: {self.source}, 모드: {pacing}, 루프: {loop}, FPS: {self.fps:.2f}")
+
+    def _open_source(self):
+        """비디오 파일 또는 이미지 디렉토리를 엽니다."""
+        if self.source.is_dir():
+            self.image_paths = sorted(p for p in self.source.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+            if not self.image_paths:
+                raise RuntimeError(f"재생할 이미지가 없습니다: {self.source}")
+        else:
+            self.cap = cv2.VideoCapture(str(self.source))
+            if not self.cap.isOpened():
+                raise RuntimeError(f"재생할 비디오를 열 수 없습니다: {self.source}")
+
+    def _source_fps(self) -> Optional[float]:
+        """비디오 파일에 기록된 FPS를 반환합니다."""
+        if self.cap is None:
+            return None
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        return fps if fps and fps > 0 else None
+
+    def _read_next(self) -> Optional[np.ndarray]:
+        """
+        재생 위치의 다음 프레임을 읽습니다. 끝에 도달하면 None을 반환합니다.
+        이미지 시퀀스에서 읽을 수 없는 이미지는 재생 끝으로 보지 않고 기록한 뒤 다음 이미지로 건너뜁니다.
+        """
+        if self.cap is not None:
+            ret, frame = self.cap.read()
+            return frame if ret else None
+
+        while self.frame_index < len(self.image_paths):
+            path = self.image_paths[self.frame_index]
+            frame = cv2.imread(str(path))
+            if frame is not None:
+                return frame
+            logger.warning(f"이미지를 읽을 수 없어 건너뜁니다: {path}")
+            self.frames_skipped += 1
+            self.frame_index += 1
+        return None
+
+    def _rewind(self):
+        """재생 위치를 처음으로 되돌립니다."""
+        self.frame_index = 0
+        self.loop_count += 1
+        if self.cap is not None:
+            # 코덱에 따라 위치 이동이 부정확할 수 있으므로 다시 열어서 결정적인 재생을 보장
+            self.cap.release()
+            self._open_source()
+
+    def get_frame(self) -> Optional[np.ndarray]:
+        """다음 프레임을 가져옵니다. 'realtime' 모드에서는 해당 프레임의 재생 시각까지 대기합니다."""
+        if self.is_finished:
+            return None
+
+        frame = self._read_next()
+        if frame is None and self.loop and self.frame_index > 0:
+            self._rewind()
+            frame = self._read_next()
+
+        if frame is None:
+            self.is_finished = True
+            logger.info(f"재생 완료: {self.source} (총 {self.frames_served} 프레임)")
+            return None
+
+        if self.pacing == "realtime":
+            now = time.monotonic()
+            if self._start_time is None:
+                self._start_time = now
+            due = self._start_time + self.frames_served * self._frame_interval
+            if due > now:
+                time.sleep(due - now)
+        elif self._start_time is None:
+            self._start_time = time.monotonic()
+
+        self.frame_index += 1
+        self.frames_served += 1
+        return frame
+
+    def get_frame_with_timestamp(self) -> Optional[Tuple[np.ndarray, float]]:
+        """타임스탬프와 함께 프레임을 가져옵니다."""
+        frame = self.get_frame()
+        if frame is not None:
+            return frame, time.time()
+        return None
+
+    def get_camera_info(self) -> dict:
+        """재생 상태 정보를 반환합니다."""
+        elapsed = time.monotonic() - self._start_time if self._start_time is not None else 0.0
+        return {
+            "source": str(self.source),
+            "pacing": self.pacing,
+            "loop": self.loop,
+            "fps": self.fps,
+            "frame_index": self.frame_index,
+            "frames_served": self.frames_served,
+            "frames_skipped": self.frames_skipped,
+            "loop_count": self.loop_count,
+            "is_finished": self.is_finished,
+            "actual_fps": self.frames_served / elapsed if elapsed > 0 else 0.0
+        }
+
+    def stop(self):
+        """스트림을 중지합니다."""
+        self.is_finished = True
+
+    def release(self):
+        """비디오 파일 핸들을 해제합니다."""
+        self.stop()
+        if self.cap is not None and self.cap.isOpened():
+            self.cap.release()
+            logger.info("재생 스트림 해제 완료")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
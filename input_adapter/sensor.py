@@ -2,7 +2,10 @@
 import random
 import time
 import threading
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
+from loguru import logger
+
+from .sensor_history import SensorRingBuffer
 
 
 class SensorReader:
@@ -10,19 +13,38 @@ class SensorReader:
     
     def __init__(self, sensor_pin: Optional[int] = None, 
                  sensor_types = None,
-                 mock_mode: bool = True):
+                 mock_mode: bool = True,
+                 history_seconds: float = 60.0,
+                 sample_interval: float = 0.02):
         """
         센서 리더를 초기화합니다.
         :param sensor_pin: 센서 핀 번호 (Raspberry Pi GPIO)
         :param sensor_types: 센서 타입 리스트
         :param mock_mode: 모의 모드 여부
+        :param history_seconds: 센서별 이력을 보관할 시간 (초). get_window_stats()로 조회할 수 있는 최대 구간
+        :param sample_interval: 샘플 추가 주기 (초). 이력 버퍼 크기를 history_seconds / sample_interval로 정함
         """
         self.sensor_pin = sensor_pin
         self.mock_mode = mock_mode
         self.sensor_types = sensor_types or ["touch", "distance", "temperature", "humidity"]
         self.is_running = False
-        self.data_buffer = []
-        self.max_buffer_size = 100
+        self.max_buffer_size = SensorRingBuffer.capacity_for(history_seconds, sample_interval)
+        # 센서 타입별 고정 크기 링 버퍼 (타임스탬프/값/경보 여부를 NumPy 배열로 보관)
+        self.history: Dict[str, SensorRingBuffer] = {
+            sensor_type: SensorRingBuffer(self.max_buffer_size) for sensor_type in self.sensor_types
+        }
+
+        # 이벤트 구동 모드: 에지 콜백/백그라운드 샘플러가 최신 상태 스냅샷을 교체하고,
+        # read()는 하드웨어를 읽지 않고 스냅샷을 그대로 반환합니다.
+        self.event_driven = False
+        self._snapshot: Optional[Dict[str, Any]] = None  # 참조 교체만 하므로 잠금 없이 읽을 수 있음
+        self._alert_listeners: List[Callable[[str, bool, Dict[str, Any]], None]] = []
+        self._sampler_running = False
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._edge_detect_registered = False
+
+        # 세션 재생 시 실제/모의 센서 대신 녹화된 센서 값을 반환하는 함수 (없으면 None)
+        self._replay_source: Optional[Callable[[], Optional[Dict[str, Any]]]] = None
         
         # 센서별 임계값 설정
         self.thresholds = {
@@ -56,8 +78,27 @@ class SensorReader:
     def read(self) -> Dict[str, Any]:
         """
         센서 데이터를 읽습니다.
+        이벤트 구동 모드에서는 하드웨어를 읽지 않고 마지막 스냅샷을 반환합니다.
         :return: 센서 데이터 딕셔너리
         """
+        snapshot = self._snapshot
+        if self.event_driven and snapshot is not None:
+            return snapshot
+        return self._read_now()
+
+    def set_replay_source(self, source: Optional[Callable[[], Optional[Dict[str, Any]]]]):
+        """
+        녹화 세션 재생용 센서 값 공급 함수를 설정합니다. (None이면 해제)
+        함수가 None을 반환하는 동안(첫 녹화 값 이전)에는 기존 방식으로 센서를 읽습니다.
+        """
+        self._replay_source = source
+
+    def _read_now(self) -> Dict[str, Any]:
+        """센서(또는 모의 데이터)를 즉시 읽습니다."""
+        if self._replay_source is not None:
+            replayed = self._replay_source()
+            if replayed is not None:
+                return replayed
         if self.mock_mode:
             return self._read_mock_data()
         else:
@@ -144,10 +185,13 @@ class SensorReader:
         return units.get(sensor_type, "unknown")
     
     def _add_to_buffer(self, data: Dict):
-        """데이터를 버퍼에 추가합니다."""
-        self.data_buffer.append(data)
-        if len(self.data_buffer) > self.max_buffer_size:
-            self.data_buffer.pop(0)
+        """데이터를 센서별 링 버퍼에 추가합니다. (O(1))"""
+        timestamp = data["timestamp"]
+        for sensor_type, sensor_data in data["sensors"].items():
+            buffer = self.history.get(sensor_type)
+            if buffer is None:
+                buffer = self.history[sensor_type] = SensorRingBuffer(self.max_buffer_size)
+            buffer.append(timestamp, sensor_data["value"], sensor_data["is_alert"])
     
     def get_alert_status(self) -> Dict[str, bool]:
         """각 센서의 알림 상태를 반환합니다."""
@@ -161,17 +205,22 @@ class SensorReader:
     
     def get_sensor_history(self, sensor_type: str, limit: int = 10) -> List[Dict]:
         """특정 센서의 히스토리를 반환합니다."""
-        history = []
-        
-        for data in self.data_buffer[-limit:]:
-            if sensor_type in data["sensors"]:
-                history.append({
-                    "timestamp": data["timestamp"],
-                    "value": data["sensors"][sensor_type]["value"],
-                    "is_alert": data["sensors"][sensor_type]["is_alert"]
-                })
-        
-        return history
+        buffer = self.history.get(sensor_type)
+        if buffer is None:
+            return []
+        return buffer.to_records(limit)
+
+    def get_window_stats(self, sensor_type: str, seconds: float, threshold: Optional[float] = None) -> Dict[str, Any]:
+        """
+        특정 센서의 최근 seconds초 구간 통계(min, max, mean, 경보 횟수, 임계값 초과 시간)를 반환합니다.
+        threshold를 지정하지 않으면 센서에 설정된 임계값을 사용합니다.
+        """
+        buffer = self.history.get(sensor_type)
+        if buffer is None:
+            return {"count": 0, "min": None, "max": None, "mean": None, "alert_count": 0, "time_above_threshold": 0.0}
+        if threshold is None:
+            threshold = self.thresholds.get(sensor_type)
+        return buffer.window_stats(seconds, threshold=threshold)
     
     def set_threshold(self, sensor_type: str, threshold: float):
         """센서 임계값을 설정합니다."""
@@ -181,6 +230,80 @@ class SensorReader:
         else:
             print(f"알 수 없는 센서 타입: {sensor_type}")
     
+    def add_alert_listener(self, listener: Callable[[str, bool, Dict[str, Any]], None]):
+        """
+        센서 경보 상태가 바뀔 때(정상→경보, 경보→정상) 호출될 리스너를 등록합니다.
+        리스너는 (sensor_type, is_alert, data) 인자로 에지 콜백/샘플러 스레드에서 호출됩니다.
+        """
+        self._alert_listeners.append(listener)
+
+    def _publish(self, data: Dict[str, Any]):
+        """새 센서 데이터를 스냅샷으로 교체하고, 경보 상태가 바뀐 센서를 리스너에 알립니다."""
+        previous = self._snapshot
+        self._snapshot = data
+
+        previous_sensors = previous["sensors"] if previous else {}
+        for sensor_type, sensor_data in data["sensors"].items():
+            was_alert = previous_sensors.get(sensor_type, {}).get("is_alert", False)
+            is_alert = bool(sensor_data.get("is_alert", False))
+            if is_alert != was_alert:
+                for listener in self._alert_listeners:
+                    try:
+                        listener(sensor_type, is_alert, data)
+                    except Exception as e:
+                        logger.error(f"센서 경보 리스너 실행 중 오류: {e}")
+
+    def _on_gpio_edge(self, channel):
+        """GPIO 에지 인터럽트 콜백. 핀 상태가 바뀌는 즉시 새 스냅샷을 게시합니다."""
+        self._publish(self._read_now())
+
+    def start_event_driven(self, sample_interval: float = 0.02, bouncetime_ms: int = 20):
+        """
+        이벤트 구동 모드를 시작합니다.
+        실제 GPIO 터치 센서는 에지 콜백으로, 그 외(모의 모드 포함)는 sample_interval 주기의 백그라운드 샘플러로 갱신합니다.
+        :param sample_interval: 샘플러 주기 (초). 경보는 이 간격 안에 리스너로 전달됩니다.
+        :param bouncetime_ms: GPIO 에지 디바운스 시간 (ms)
+        """
+        if self.event_driven:
+            return
+        self._publish(self._read_now())
+        self.event_driven = True
+
+        # 실제 하드웨어에서는 읽는 센서가 터치(GPIO) 하나뿐이므로 에지 콜백만으로 충분합니다.
+        if not self.mock_mode and self.sensor_pin is not None and self.sensor_types == ["touch"]:
+            try:
+                import RPi.GPIO as GPIO
+                GPIO.add_event_detect(self.sensor_pin, GPIO.BOTH, callback=self._on_gpio_edge, bouncetime=bouncetime_ms)
+                self._edge_detect_registered = True
+                logger.info(f"GPIO 핀 {self.sensor_pin} 에지 콜백 등록 완료")
+                return
+            except Exception as e:
+                logger.warning(f"GPIO 에지 콜백 등록 실패, 샘플러로 대체합니다: {e}")
+
+        def sampler():
+            while self._sampler_running:
+                self._publish(self._read_now())
+                time.sleep(sample_interval)
+
+        self._sampler_running = True
+        self._sampler_thread = threading.Thread(target=sampler, name="SensorSampler", daemon=True)
+        self._sampler_thread.start()
+
+    def stop_event_driven(self):
+        """이벤트 구동 모드를 중지하고 폴링 방식으로 되돌립니다."""
+        self.event_driven = False
+        self._sampler_running = False
+        if self._sampler_thread is not None:
+            self._sampler_thread.join(timeout=1.0)
+            self._sampler_thread = None
+        if self._edge_detect_registered:
+            try:
+                import RPi.GPIO as GPIO
+                GPIO.remove_event_detect(self.sensor_pin)
+            except Exception as e:
+                logger.warning(f"GPIO 에지 콜백 해제 실패: {e}")
+            self._edge_detect_registered = False
+
     def start_continuous_monitoring(self, callback=None, interval: float = 1.0):
         """연속 모니터링을 시작합니다."""
         self.is_running = True
@@ -208,6 +331,7 @@ class SensorReader:
             "sensor_pin": self.sensor_pin,
             "sensor_types": self.sensor_types,
             "is_running": self.is_running,
-            "buffer_size": len(self.data_buffer),
+            "event_driven": self.event_driven,
+            "buffer_size": max((len(buffer) for buffer in self.history.values()), default=0),
             "thresholds": self.thresholds
         }
@@ -0,0 +1,105 @@
+import math
+import threading
+import time
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+class SensorRingBuffer:
+    """
+    단일 센서의 (타임스탬프, 값, 경보 여부) 이력을 고정 크기 NumPy 배열에 저장하는 링 버퍼.
+    추가는 O(1)이며, 최근 N초 구간에 대한 통계를 Python 루프 없이 벡터 연산으로 계산합니다.
+    샘플러 스레드의 추가와 다른 스레드의 조회가 겹쳐도 되도록, 추가와 조회 대상 샘플 복사는 잠금 안에서 수행하고
+    통계 계산은 복사본으로 잠금 밖에서 수행합니다.
+    """
+
+    @staticmethod
+    def capacity_for(seconds: float, sample_interval: float) -> int:
+        """sample_interval(초) 주기로 추가되는 샘플을 최근 seconds초만큼 보관하는 데 필요한 용량."""
+        if seconds <= 0 or sample_interval <= 0:
+            raise ValueError("seconds와 sample_interval은 0보다 커야 합니다.")
+        return math.ceil(seconds / sample_interval) + 1
+
+    def __init__(self, capacity: int = 100):
+        """
+        :param capacity: 보관할 최대 샘플 수. 가득 차면 가장 오래된 샘플을 덮어씁니다.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.alerts = np.zeros(capacity, dtype=bool)
+        self._head = 0   # 다음에 쓸 위치
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, value: float, is_alert: bool):
+        """샘플을 추가합니다. (O(1))"""
+        with self._lock:
+            i = self._head
+            self.timestamps[i] = timestamp
+            self.values[i] = value
+            self.alerts[i] = is_alert
+            self._head = (i + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def _ordered_indices(self) -> np.ndarray:
+        """저장된 샘플의 인덱스를 오래된 순서로 반환합니다."""
+        start = (self._head - self._count) % self.capacity
+        return (start + np.arange(self._count)) % self.capacity
+
+    def last(self, limit: int) -> Dict[str, np.ndarray]:
+        """가장 최근 limit개 샘플을 오래된 순서로 반환합니다. (복사본)"""
+        with self._lock:
+            idx = self._ordered_indices()[-limit:] if limit > 0 else np.empty(0, dtype=np.int64)
+            return {"timestamps": self.timestamps[idx], "values": self.values[idx], "alerts": self.alerts[idx]}
+
+    def window(self, seconds: float, now: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """최근 seconds초 이내의 샘플을 오래된 순서로 반환합니다. (복사본)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            idx = self._ordered_indices()
+            ts = self.timestamps[idx]
+            mask = ts >= now - seconds
+            idx = idx[mask]
+            return {"timestamps": ts[mask], "values": self.values[idx], "alerts": self.alerts[idx]}
+
+    def window_stats(self, seconds: float, threshold: Optional[float] = None, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        최근 seconds초 구간의 통계를 계산합니다.
+        time_above_threshold는 각 샘플 값이 다음 샘플(마지막 샘플은 now)까지 유지된다고 보고 합산한 시간(초)입니다.
+
+        :param seconds: 조회 구간 (초)
+        :param threshold: time_above_threshold 계산 기준값. None이면 경보(is_alert) 상태였던 시간을 계산합니다.
+        :param now: 기준 시각 (기본값: time.time())
+        """
+        now = time.time() if now is None else now
+        w = self.window(seconds, now)
+        ts, values = w["timestamps"], w["values"]
+        if ts.size == 0:
+            return {"count": 0, "min": None, "max": None, "mean": None, "alert_count": 0, "time_above_threshold": 0.0}
+
+        # 샘플 유지 시간: 다음 샘플까지의 간격, 마지막 샘플은 현재 시각까지
+        durations = np.diff(ts, append=now)
+        above = values > threshold if threshold is not None else w["alerts"]
+
+        return {
+            "count": int(ts.size),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "mean": float(values.mean()),
+            "alert_count": int(np.count_nonzero(w["alerts"])),
+            "time_above_threshold": float(durations[above].sum()),
+        }
+
+    def to_records(self, limit: int) -> List[Dict[str, Any]]:
+        """최근 limit개 샘플을 딕셔너리 리스트로 변환합니다. (기존 get_sensor_history 형식)"""
+        last = self.last(limit)
+        return [
+            {"timestamp": float(t), "value": float(v), "is_alert": bool(a)}
+            for t, v, a in zip(last["timestamps"], last["values"], last["alerts"])
+        ]
@@ -0,0 +1,431 @@
+import bisect
+import json
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+import cv2
+import numpy as np
+from pathlib import Path
+from typing import Optional, Tuple, List, Dict, Any
+from loguru import logger
+
+from core.frame_envelope import FrameEnvelope
+
+SESSION_FORMAT_VERSION = 1
+SESSION_SUFFIX = ".session"
+
+
+def _camera_key(camera_id) -> str:
+    """단일 카메라 구성(camera_id=None)도 파일 이름으로 쓸 수 있도록 키를 정규화합니다."""
+    return str(camera_id) if camera_id is not None else "default"
+
+
+def _to_json(value):
+    """numpy 값 등 JSON으로 바로 직렬화되지 않는 값을 변환합니다."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+class SessionRecorder:
+    """
+    워커 루프의 원본 프레임, 센서 값, 서버 명령, 상태 업데이트 메시지를 같은 monotonic 시계로 기록하는 세션 녹화기.
+
+    세션 파일(.session)은 하나의 zip 아카이브입니다.
+      - manifest.json: 형식 버전, 카메라별 영상 정보, 기록 구간
+      - events.jsonl: 시간순 이벤트 ({"t", "type": frame|sensor|command|status, ...})
+      - video_<camera>.mp4: 카메라별 압축 영상 (frame 이벤트의 index가 영상 내 프레임 번호)
+    max_duration을 지정하면 해당 시간마다 세션 파일을 나누어, 프로세스가 비정상 종료되어도 이전 구간은 보존됩니다.
+
+    영상 인코딩과 파일 쓰기는 전용 기록 스레드에서 호출 순서대로 처리하므로, record_*()는 워커 루프를 막지 않습니다.
+    같은 프레임(봉투 seq가 직전과 같음)은 다시 기록하지 않고, 기록 스레드가 밀리면 새 프레임을 버립니다. (이벤트는 버리지 않음)
+    """
+
+    def __init__(self, directory, codec: str = "mp4v", fps: float = 15.0,
+                 max_duration: Optional[float] = 300.0, prefix: str = "session", max_pending_frames: int = 30):
+        """
+        :param directory: 세션 파일을 저장할 디렉토리
+        :param codec: 영상 압축 FourCC 코드 (기본 mp4v)
+        :param fps: 영상 파일에 기록할 FPS (재생 시각은 이벤트 타임스탬프를 따르므로 표시용)
+        :param max_duration: 세션 파일 하나의 최대 길이 (초). None이면 close()까지 하나의 파일로 기록
+        :param prefix: 세션 파일 이름 접두사
+        :param max_pending_frames: 기록 스레드가 아직 인코딩하지 못한 프레임의 최대 개수. 넘으면 새 프레임을 버림
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.codec = codec
+        self.fps = fps
+        self.max_duration = max_duration
+        self.prefix = prefix
+        self.saved_sessions: List[Path] = []
+        self.max_pending_frames = max_pending_frames
+        self.frames_dropped = 0
+
+        self._lock = threading.Lock()
+        self._work_dir: Optional[Path] = None
+        self._start_session()
+
+        self._last_seq: Dict[str, int] = {}
+        self._pending_lock = threading.Lock()  # 기록 스레드가 인코딩 중에도 대기 프레임 수는 바로 확인할 수 있도록 분리
+        self._pending_frames = 0
+        self._closed = False
+        self._tasks: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="SessionRecorder", daemon=True)
+        self._thread.start()
+
+    def _start_session(self):
+        """새 세션 작업 디렉토리를 준비합니다."""
+        self._work_dir = Path(tempfile.mkdtemp(prefix=f"{self.prefix}_", dir=self.directory))
+        self._events_file = open(self._work_dir / "events.jsonl", "w", encoding="utf-8")
+        self._writers: Dict[str, cv2.VideoWriter] = {}
+        self._cameras: Dict[str, Dict[str, Any]] = {}
+        self._first_t: Optional[float] = None
+        self._last_t: Optional[float] = None
+        self._wall_started_at = time.time()
+        self._event_count = 0
+
+    def _write_event(self, event: Dict[str, Any]):
+        t = event["t"]
+        if self._first_t is None:
+            self._first_t = t
+        self._last_t = t if self._last_t is None else max(self._last_t, t)
+        self._events_file.write(json.dumps(event, ensure_ascii=False, default=_to_json) + "\n")
+        self._event_count += 1
+
+    def _rotate_if_needed(self, t: float):
+        if self.max_duration is not None and self._first_t is not None and t - self._first_t >= self.max_duration:
+            self._finalize_session()
+            self._start_session()
+
+    def _run(self):
+        """기록 스레드: 큐에 들어온 기록 작업을 순서대로 실행합니다. (None을 받으면 종료)"""
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            func, args = task
+            try:
+                with self._lock:
+                    func(*args)
+            except Exception as e:
+                logger.error(f"세션 기록 중 오류 발생: {e}")
+            finally:
+                if func == self._write_frame:
+                    with self._pending_lock:
+                        self._pending_frames -= 1
+
+    def record_frame(self, envelope: FrameEnvelope) -> bool:
+        """
+        원본 프레임을 카메라별 영상에 추가하고 frame 이벤트를 기록하도록 기록 스레드에 넘깁니다.
+        시각은 봉투의 캡처 시각을 사용합니다. 기록하지 않은 경우(직전과 같은 seq, 기록 대기 초과) False를 반환합니다.
+        """
+        key = _camera_key(envelope.camera_id)
+        if self._closed or self._last_seq.get(key) == envelope.seq:
+            # 워커 루프가 새 프레임이 오기 전에 같은 최신 프레임을 다시 읽은 경우
+            return False
+        self._last_seq[key] = envelope.seq
+        with self._pending_lock:
+            if self._pending_frames >= self.max_pending_frames:
+                self.frames_dropped += 1
+                if self.frames_dropped % 100 == 1:
+                    logger.warning(f"세션 기록이 밀려 프레임을 버렸습니다. (누적 {self.frames_dropped}개)")
+                return False
+            self._pending_frames += 1
+        self._tasks.put((self._write_frame, (envelope,)))
+        return True
+
+    def _write_frame(self, envelope: FrameEnvelope):
+        """(기록 스레드) 프레임을 인코딩하여 영상에 추가합니다."""
+        self._rotate_if_needed(envelope.capture_ts)
+        key = _camera_key(envelope.camera_id)
+        h, w = envelope.frame.shape[:2]
+        writer = self._writers.get(key)
+        if writer is None:
+            file_name = f"video_{key}.mp4"
+            writer = cv2.VideoWriter(str(self._work_dir / file_name), cv2.VideoWriter_fourcc(*self.codec), self.fps, (w, h))
+            if not writer.isOpened():
+                raise RuntimeError(f"세션 영상 파일을 열 수 없습니다: {file_name} (코덱: {self.codec})")
+            self._writers[key] = writer
+            self._cameras[key] = {"camera_id": envelope.camera_id, "file": file_name, "width": w, "height": h, "frames": 0}
+
+        camera = self._cameras[key]
+        if (w, h) != (camera["width"], camera["height"]):
+            # 영상 파일은 해상도가 고정이므로 첫 프레임 크기에 맞춰 기록
+            frame = cv2.resize(envelope.frame, (camera["width"], camera["height"]))
+        else:
+            frame = envelope.frame
+        writer.write(frame)
+        self._write_event({"t": envelope.capture_ts, "type": "frame", "camera": key,
+                           "seq": envelope.seq, "index": camera["frames"]})
+        camera["frames"] += 1
+
+    def record_sensor(self, sensor_data: Dict[str, Any], t: Optional[float] = None):
+        """SensorReader.read() 결과를 기록합니다."""
+        self._record("sensor", sensor_data, t)
+
+    def record_command(self, command: Dict[str, Any], t: Optional[float] = None):
+        """command_queue에서 꺼낸 서버 명령을 기록합니다."""
+        self._record("command", command, t)
+
+    def record_status(self, status: Dict[str, Any], t: Optional[float] = None):
+        """UI로 보낸 StatusUpdateMessage 데이터를 기록합니다."""
+        self._record("status", status, t)
+
+    def _record(self, event_type: str, data: Dict[str, Any], t: Optional[float]):
+        t = time.monotonic() if t is None else t
+        if not self._closed:
+            self._tasks.put((self._write_record, (event_type, data, t)))
+
+    def _write_record(self, event_type: str, data: Dict[str, Any], t: float):
+        """(기록 스레드) 이벤트를 기록합니다."""
+        self._rotate_if_needed(t)
+        self._write_event({"t": t, "type": event_type, "data": data})
+
+    def _finalize_session(self) -> Optional[Path]:
+        """현재 세션의 영상/이벤트 파일을 하나의 세션 파일로 묶습니다."""
+        for writer in self._writers.values():
+            writer.release()
+        self._events_file.close()
+
+        if self._event_count == 0:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            return None
+
+        manifest = {
+            "version": SESSION_FORMAT_VERSION,
+            "started_at": self._wall_started_at,
+            "t_start": self._first_t,
+            "t_end": self._last_t,
+            "event_count": self._event_count,
+            "cameras": self._cameras,
+        }
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(self._wall_started_at))
+        session_path = self.directory / f"{self.prefix}_{stamp}{SESSION_SUFFIX}"
+        suffix = 1
+        while session_path.exists():
+            session_path = self.directory / f"{self.prefix}_{stamp}_{suffix}{SESSION_SUFFIX}"
+            suffix += 1
+
+        with zipfile.ZipFile(session_path, "w") as archive:
+            archive.writestr("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2), compress_type=zipfile.ZIP_DEFLATED)
+            archive.write(self._work_dir / "events.jsonl", "events.jsonl", compress_type=zipfile.ZIP_DEFLATED)
+            for camera in self._cameras.values():
+                # 영상은 이미 압축되어 있으므로 그대로 저장
+                archive.write(self._work_dir / camera["file"], camera["file"], compress_type=zipfile.ZIP_STORED)
+        shutil.rmtree(self._work_dir, ignore_errors=True)
+
+        self.saved_sessions.append(session_path)
+        logger.info(f"세션 파일 저장 완료: {session_path} (이벤트 {self._event_count}개, "
+                    f"{(self._last_t - self._first_t):.1f}초)")
+        return session_path
+
+    def close(self) -> Optional[Path]:
+        """
+        기록 스레드에 남은 작업을 모두 처리한 뒤 녹화를 마치고 마지막 세션 파일 경로를 반환합니다.
+        (기록된 이벤트가 없거나 이미 닫혔으면 None)
+        """
+        if self._closed:
+            return None
+        self._closed = True
+        self._tasks.put(None)
+        self._thread.join()
+        with self._lock:
+            return self._finalize_session()
+
+
+class SessionPlayer:
+    """
+    SessionRecorder가 만든 세션 파일을 재생합니다.
+    카메라별 SessionReplayStream(InputAdapter용), 재생 시각 기준 센서 값(SensorReader용),
+    명령 재주입(command_queue용)을 하나의 재생 시계로 맞춰 제공합니다.
+
+    재생 시계: 'realtime'은 녹화 당시의 간격을 그대로 따르고,
+    'fast'는 대기 없이 마지막으로 내보낸 프레임의 녹화 시각을 현재 시각으로 봅니다.
+    """
+
+    PACING_MODES = ("realtime", "fast")
+
+    def __init__(self, path, pacing: str = "realtime"):
+        """
+        :param path: 세션 파일 경로 (.session)
+        :param pacing: 'realtime' 또는 'fast'
+        """
+        if pacing not in self.PACING_MODES:
+            raise ValueError(f"알 수 없는 재생 속도 모드입니다: {pacing} (사용 가능: {self.PACING_MODES})")
+        self.path = Path(path)
+        self.pacing = pacing
+
+        self._extract_dir = Path(tempfile.mkdtemp(prefix="session_replay_"))
+        with zipfile.ZipFile(self.path) as archive:
+            archive.extractall(self._extract_dir)
+        self.manifest = json.loads((self._extract_dir / "manifest.json").read_text(encoding="utf-8"))
+        if self.manifest.get("version") != SESSION_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 세션 형식 버전입니다: {self.manifest.get('version')}")
+
+        self.frame_events: Dict[str, List[Dict[str, Any]]] = {key: [] for key in self.manifest["cameras"]}
+        self.sensor_events: List[Dict[str, Any]] = []
+        self.command_events: List[Dict[str, Any]] = []
+        self.status_events: List[Dict[str, Any]] = []
+        with open(self._extract_dir / "events.jsonl", encoding="utf-8") as f:
+            for line in f:
+                event = json.loads(line)
+                if event["type"] == "frame":
+                    self.frame_events[event["camera"]].append(event)
+                elif event["type"] == "sensor":
+                    self.sensor_events.append(event)
+                elif event["type"] == "command":
+                    self.command_events.append(event)
+                elif event["type"] == "status":
+                    self.status_events.append(event)
+        for events in (self.sensor_events, self.command_events, self.status_events):
+            events.sort(key=lambda e: e["t"])
+        self._sensor_times = [e["t"] for e in self.sensor_events]
+        self._status_times = [e["t"] for e in self.status_events]
+
+        self.t_start = self.manifest["t_start"]
+        self._start_time: Optional[float] = None
+        self._fast_clock = self.t_start
+        self._commands_sent = 0
+        self._streams: Dict[str, "SessionReplayStream"] = {}
+        logger.info(f"세션 재생 준비 완료: {self.path}, 모드: {pacing}, 카메라: {list(self.frame_events)}, "
+                    f"명령 {len(self.command_events)}개, 센서 {len(self.sensor_events)}개")
+
+    @property
+    def camera_keys(self) -> List[str]:
+        return list(self.frame_events)
+
+    def clock(self) -> float:
+        """현재 재생 시각을 녹화 당시의 monotonic 시각으로 반환합니다."""
+        if self.pacing == "fast" or self._start_time is None:
+            return self._fast_clock
+        return self.t_start + (time.monotonic() - self._start_time)
+
+    def _wait_until(self, t: float):
+        """'realtime' 모드에서 녹화 시각 t에 해당하는 시점까지 대기합니다."""
+        if self._start_time is None:
+            self._start_time = time.monotonic() - (t - self.t_start)
+        if self.pacing == "realtime":
+            delay = self._start_time + (t - self.t_start) - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        self._fast_clock = max(self._fast_clock, t)
+
+    def stream(self, camera_id=None) -> "SessionReplayStream":
+        """카메라의 재생 스트림을 반환합니다. (InputAdapter의 stream으로 사용)"""
+        key = _camera_key(camera_id)
+        if key not in self.frame_events:
+            raise KeyError(f"세션에 카메라 '{key}'의 영상이 없습니다. (기록된 카메라: {self.camera_keys})")
+        if key not in self._streams:
+            video_path = self._extract_dir / self.manifest["cameras"][key]["file"]
+            self._streams[key] = SessionReplayStream(self, key, video_path, self.frame_events[key])
+        return self._streams[key]
+
+    def sensor_at(self, t: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """재생 시각(기본: 현재 재생 시계) 이전의 마지막 센서 기록을 반환합니다. 없으면 None."""
+        t = self.clock() if t is None else t
+        i = bisect.bisect_right(self._sensor_times, t)
+        return self.sensor_events[i - 1]["data"] if i > 0 else None
+
+    def pump_commands(self, command_queue) -> int:
+        """재생 시계까지 도달한 녹화 명령을 command_queue에 넣고, 넣은 개수를 반환합니다."""
+        now = self.clock()
+        sent = 0
+        while self._commands_sent < len(self.command_events) and self.command_events[self._commands_sent]["t"] <= now:
+            command_queue.put(self.command_events[self._commands_sent]["data"])
+            self._commands_sent += 1
+            sent += 1
+        return sent
+
+    def status_at(self, t: float) -> Optional[Dict[str, Any]]:
+        """녹화 시각 t 시점에 UI에 표시되고 있던 상태 메시지를 반환합니다. (판단 결과 비교용)"""
+        i = bisect.bisect_right(self._status_times, t)
+        return self.status_events[i - 1]["data"] if i > 0 else None
+
+    @property
+    def is_finished(self) -> bool:
+        return bool(self._streams) and all(s.is_finished for s in self._streams.values())
+
+    def release(self):
+        """재생 스트림을 닫고 임시로 풀어둔 파일을 삭제합니다."""
+        for stream in self._streams.values():
+            stream.release()
+        shutil.rmtree(self._extract_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class SessionReplayStream:
+    """
+    세션의 카메라 영상 하나를 VideoStream과 같은 인터페이스로 재생하는 스트림.
+    프레임은 녹화된 캡처 시각에 맞춰(또는 'fast' 모드에서는 대기 없이) 내보내며, 재생 시계를 함께 진행시킵니다.
+    """
+
+    threaded = False
+
+    def __init__(self, player: SessionPlayer, camera_key: str, video_path: Path, events: List[Dict[str, Any]]):
+        self.player = player
+        self.camera_key = camera_key
+        self.source = video_path
+        self.events = events
+        self.cap = cv2.VideoCapture(str(video_path))
+        if not self.cap.isOpened():
+            raise RuntimeError(f"세션 영상을 열 수 없습니다: {video_path}")
+        self.frames_served = 0
+        self.is_finished = False
+
+    def get_frame(self) -> Optional[np.ndarray]:
+        """다음 프레임을 녹화 시각에 맞춰 반환합니다. 끝에 도달하면 None."""
+        if self.is_finished:
+            return None
+        if self.frames_served >= len(self.events):
+            self._finish()
+            return None
+
+        ret, frame = self.cap.read()
+        if not ret:
+            self._finish()
+            return None
+
+        self.player._wait_until(self.events[self.frames_served]["t"])
+        self.frames_served += 1
+        return frame
+
+    def _finish(self):
+        self.is_finished = True
+        logger.info(f"세션 재생 완료: 카메라 '{self.camera_key}' (총 {self.frames_served} 프레임)")
+
+    def get_frame_with_timestamp(self) -> Optional[Tuple[np.ndarray, float]]:
+        """타임스탬프와 함께 프레임을 가져옵니다."""
+        frame = self.get_frame()
+        if frame is not None:
+            return frame, time.time()
+        return None
+
+    def get_camera_info(self) -> dict:
+        """재생 상태 정보를 반환합니다."""
+        return {
+            "source": str(self.player.path),
+            "camera": self.camera_key,
+            "pacing": self.player.pacing,
+            "frames_served": self.frames_served,
+            "total_frames": len(self.events),
+            "is_finished": self.is_finished,
+        }
+
+    def stop(self):
+        self.is_finished = True
+
+    def release(self):
+        """영상 파일 핸들을 해제합니다."""
+        self.stop()
+        if self.cap is not None and self.cap.isOpened():
+            self.cap.release()
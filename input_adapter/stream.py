@@ -1,56 +1,226 @@
 import cv2
 import numpy as np
 from typing import Optional, Tuple, Generator
+import threading
 import time
 from loguru import logger
 
 class VideoStream:
     """다양한 비디오 소스를 처리하는 스트림 클래스"""
 
-    def __init__(self, source=0, resolution=(1280, 720), fps=30):
+    def __init__(self, source=0, resolution=(1280, 720), fps=30, threaded: bool = False,
+                 reconnect: bool = False, max_read_failures: int = 30,
+                 backoff_initial: float = 0.5, backoff_max: float = 10.0):
         """
         비디오 스트림을 초기화합니다.
         :param source: 카메라 인덱스 또는 비디오 파일 경로
         :param resolution: (width, height)
         :param fps: 초당 프레임
+        :param threaded: True일 경우 전용 캡처 스레드가 장치를 계속 비우고 최신 프레임만 보관합니다.
+        :param reconnect: True일 경우 연속 읽기 실패 시 백그라운드에서 소스를 다시 엽니다.
+        :param max_read_failures: 카메라 연결이 끊긴 것으로 판단하는 연속 읽기 실패 횟수
+        :param backoff_initial: 첫 재연결 시도 실패 후 대기 시간 (초). 실패할 때마다 두 배씩 늘어납니다.
+        :param backoff_max: 재연결 대기 시간의 상한 (초)
         """
         self.source = source
         self.resolution = resolution
         self.fps = fps
         self.cap = None
         self.is_running = False
+        self.threaded = threaded
+
+        # 백그라운드 캡처 모드에서 공유되는 최신 프레임 정보
+        self._latest_frame: Optional[np.ndarray] = None
+        self._latest_timestamp: float = 0.0  # time.monotonic() 기준 캡처 시각
+        self._latest_seq: int = 0            # 캡처된 프레임 순번 (1부터 증가)
+        self._frame_lock = threading.Lock()
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_running = False
+
+        # 재연결 감독 상태. 연결이 끊기면 self.cap을 None으로 비워 읽기가 즉시 None을 반환하게 하고,
+        # 장치 재개방(수 초간 블로킹될 수 있음)은 감독 스레드에서만 수행합니다.
+        self.reconnect = reconnect
+        self.max_read_failures = max_read_failures
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.connected = True
+        self.reconnect_attempts = 0
+        self._read_failures = 0
+        self._lost_since: Optional[float] = None
+        self._reconnect_thread: Optional[threading.Thread] = None
+        self._reconnect_running = False
         
         self._initialize_camera()
+
+        if self.threaded:
+            self.start_capture_thread()
     
+    def _open_capture(self) -> cv2.VideoCapture:
+        """비디오 소스를 열고 설정을 적용한 캡처 객체를 반환합니다. 열 수 없으면 RuntimeError."""
+        cap = cv2.VideoCapture(self.source)
+        if not cap.isOpened():
+            cap.release()
+            raise RuntimeError(f"비디오 소스를 열 수 없습니다: {self.source}")
+
+        # 카메라 설정
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
+        cap.set(cv2.CAP_PROP_FPS, self.fps)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 버퍼 크기 최소화
+        return cap
+
     def _initialize_camera(self):
-        """카메라를 초기화합니다."""
+        """
+        카메라를 초기화합니다.
+        재연결이 켜져 있으면 시작 시 열리지 않는 카메라도 예외 없이 '연결 끊김' 상태로 시작하고,
+        감독 스레드가 백오프로 다시 열도록 합니다. (한 카메라가 없어도 워커와 다른 카메라는 동작)
+        """
         try:
-            self.cap = cv2.VideoCapture(self.source)
-            if not self.cap.isOpened():
-                raise RuntimeError(f"비디오 소스를 열 수 없습니다: {self.source}")
-                
-            # 카메라 설정
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
-            self.cap.set(cv2.CAP_PROP_FPS, self.fps)
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 버퍼 크기 최소화
-
+            self.cap = self._open_capture()
             logger.info(f"카메라 초기화 완료: {self.source}, 해상도: {self.resolution}, FPS: {self.fps}")
                 
         except Exception as e:
             logger.error(f"카메라 초기화 실패: {e}")
-            raise
+            if not self.reconnect:
+                raise
+            self._mark_lost(reason="시작 시 열 수 없음")
+
+    def _on_read_failure(self):
+        """읽기 실패를 기록하고, 연속 실패가 임계값에 도달하면 연결 끊김으로 처리합니다."""
+        self._read_failures += 1
+        if self.reconnect and self.connected and self._read_failures >= self.max_read_failures:
+            self._mark_lost()
+
+    def _mark_lost(self, reason: Optional[str] = None):
+        """
+        카메라 연결 끊김을 기록하고 재연결 감독 스레드를 시작합니다.
+        프레임을 읽는 스레드(캡처 스레드 또는 호출자)에서만 호출되므로, self.cap을 비운 뒤에는
+        이전 캡처 객체를 읽는 곳이 없어 감독 스레드가 안전하게 해제할 수 있습니다.
+        """
+        stale_cap = self.cap
+        self.cap = None
+        self.connected = False
+        self._lost_since = time.monotonic()
+        with self._frame_lock:
+            self._latest_frame = None
+        reason = reason or f"연속 읽기 실패 {self._read_failures}회"
+        logger.error(f"카메라 연결이 끊겼습니다: {self.source} ({reason}). 재연결을 시작합니다.")
+
+        self._reconnect_running = True
+        self._reconnect_thread = threading.Thread(target=self._reconnect_loop, args=(stale_cap,),
+                                                  name="VideoStreamReconnect", daemon=True)
+        self._reconnect_thread.start()
+
+    def _reconnect_loop(self, stale_cap):
+        """지수 백오프로 소스를 다시 엽니다. (감독 스레드에서 실행)"""
+        if stale_cap is not None:
+            try:
+                stale_cap.release()
+            except Exception as e:
+                logger.warning(f"끊긴 캡처 객체 해제 중 오류: {e}")
+
+        delay = self.backoff_initial
+        while self._reconnect_running:
+            self.reconnect_attempts += 1
+            try:
+                cap = self._open_capture()
+            except Exception as e:
+                logger.warning(f"카메라 재연결 실패 ({self.reconnect_attempts}회): {e}. {delay:.1f}초 후 재시도합니다.")
+                # release()가 빨리 끝날 수 있도록 짧게 나누어 대기
+                wait_until = time.monotonic() + delay
+                while self._reconnect_running and time.monotonic() < wait_until:
+                    time.sleep(0.05)
+                delay = min(delay * 2, self.backoff_max)
+                continue
+
+            if not self._reconnect_running:
+                cap.release()
+                break
+            self._read_failures = 0
+            self.cap = cap
+            self.connected = True
+            lost_for = time.monotonic() - self._lost_since if self._lost_since is not None else 0.0
+            self._lost_since = None
+            logger.info(f"카메라 재연결 성공: {self.source} (끊김 {lost_for:.1f}초, 시도 {self.reconnect_attempts}회)")
+            break
+
+    def get_connection_status(self) -> dict:
+        """카메라 연결 상태를 반환합니다."""
+        return {
+            "connected": self.connected,
+            "reconnect_attempts": self.reconnect_attempts,
+            "lost_for": round(time.monotonic() - self._lost_since, 3) if self._lost_since is not None else 0.0,
+        }
+
+    def start_capture_thread(self):
+        """최신 프레임만 유지하는 백그라운드 캡처 스레드를 시작합니다."""
+        if self._capture_thread is not None and self._capture_thread.is_alive():
+            return
+
+        self._capture_running = True
+        self._capture_thread = threading.Thread(target=self._capture_loop, name="VideoStreamCapture", daemon=True)
+        self._capture_thread.start()
+        logger.info(f"백그라운드 캡처 스레드 시작: {self.source}")
+
+    def stop_capture_thread(self):
+        """백그라운드 캡처 스레드를 중지합니다."""
+        self._capture_running = False
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=2.0)
+            self._capture_thread = None
+
+    def _capture_loop(self):
+        """장치를 계속 읽어 가장 최근 프레임만 게시합니다. (캡처 스레드에서 실행)"""
+        while self._capture_running:
+            cap = self.cap
+            if not cap or not cap.isOpened():
+                if cap is not None and self.reconnect and self.connected:
+                    self._mark_lost()
+                time.sleep(0.1)
+                continue
+
+            ret, frame = cap.read()
+            captured_at = time.monotonic()
+            if not ret:
+                self._on_read_failure()
+                time.sleep(0.01)  # 장치가 일시적으로 프레임을 주지 못하는 경우 과도한 반복 방지
+                continue
+
+            self._read_failures = 0
+            with self._frame_lock:
+                self._latest_frame = frame
+                self._latest_timestamp = captured_at
+                self._latest_seq += 1
+
+    def get_latest(self) -> Optional[Tuple[np.ndarray, float, int]]:
+        """
+        캡처 스레드가 게시한 최신 프레임을 블로킹 없이 반환합니다.
+        :return: (프레임, 캡처 시각(monotonic), 순번) 또는 아직 프레임이 없으면 None
+        """
+        with self._frame_lock:
+            if self._latest_frame is None:
+                return None
+            return self._latest_frame, self._latest_timestamp, self._latest_seq
 
     def get_frame(self) -> Optional[np.ndarray]:
         """단일 프레임을 가져옵니다."""
-        if not self.cap or not self.cap.isOpened():
+        if self.threaded:
+            latest = self.get_latest()
+            return latest[0] if latest is not None else None
+
+        cap = self.cap
+        if not cap or not cap.isOpened():
+            if cap is not None and self.reconnect and self.connected:
+                self._mark_lost()
             return None
         
-        ret, frame = self.cap.read()
+        ret, frame = cap.read()
         if not ret:
             logger.warning("프레임을 읽을 수 없습니다.")
+            self._on_read_failure()
             return None
         
+        self._read_failures = 0
         return frame
 
     def get_frames(self) -> Generator[np.ndarray, None, None]:
@@ -83,6 +253,10 @@ class VideoStream:
 
     def get_frame_with_timestamp(self) -> Optional[Tuple[np.ndarray, float]]:
         """타임스탬프와 함께 프레임을 가져옵니다."""
+        if self.threaded:
+            latest = self.get_latest()
+            return (latest[0], latest[1]) if latest is not None else None
+
         frame = self.get_frame()
         if frame is not None:
             return frame, time.time()
@@ -106,6 +280,9 @@ class VideoStream:
             "resolution": self.resolution,
             "fps": self.fps,
             "is_opened": self.cap.isOpened(),
+            "threaded": self.threaded,
+            "connected": self.connected,
+            "last_seq": self._latest_seq,
             "frame_width": self.cap.get(cv2.CAP_PROP_FRAME_WIDTH),
             "frame_height": self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT),
             "actual_fps": self.cap.get(cv2.CAP_PROP_FPS)
@@ -118,6 +295,11 @@ class VideoStream:
     def release(self):
         """비디오 캡처 객체를 해제합니다."""
         self.stop()
+        self.stop_capture_thread()
+        self._reconnect_running = False
+        if self._reconnect_thread is not None:
+            self._reconnect_thread.join(timeout=2.0)
+            self._reconnect_thread = None
         if self.cap and self.cap.isOpened():
             self.cap.release()
             logger.info("비디오 캡처 객체 해제 완료")
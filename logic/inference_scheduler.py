@@ -0,0 +1,92 @@
+import time
+from typing import Dict, Any, Optional
+from loguru import logger
+
+
+class InferenceRateScheduler:
+    """
+    현재 위험 상황에 따라 비전 루프의 추론 속도(FPS)를 결정합니다.
+    - IDLE: 화면에 사람이 없음 → idle_fps
+    - PERSONS: 사람이 있지만 위험 구역과 떨어져 있음 → persons_fps
+    - ACTIVE: 사람이 위험 구역 안/근처에 있거나, 넘어짐 등 위험 등급이거나, MAINTENANCE 모드 → max_fps
+    속도는 즉시 올리고, 낮출 때는 hold_time초 동안 더 높은 단계가 다시 나타나지 않을 때만 내립니다.
+    (위험 직후 바로 느려져 보호가 약해지는 것을 방지)
+    """
+
+    LEVELS = ("IDLE", "PERSONS", "ACTIVE")
+    # 이 위험 등급에서는 사람/구역 여부와 관계없이 최대 속도로 동작
+    ACTIVE_RISK_LEVELS = ("CRITICAL", "STALE_FEED", "LOTO_RISK_DETECTED", "WARNING")
+
+    def __init__(self, idle_fps: float = 3.0, persons_fps: float = 8.0, max_fps: float = 15.0, hold_time: float = 2.0):
+        """
+        Args:
+            idle_fps: 사람이 없을 때의 추론 FPS
+            persons_fps: 사람이 위험 구역과 떨어져 있을 때의 추론 FPS
+            max_fps: 위험 구역 안/근처, 위험 등급, MAINTENANCE 모드일 때의 추론 FPS
+            hold_time: 더 낮은 단계로 내리기 전에 유지할 시간 (초)
+        """
+        self.fps_by_level = {"IDLE": idle_fps, "PERSONS": persons_fps, "ACTIVE": max_fps}
+        self.hold_time = hold_time
+
+        self.level = "ACTIVE"  # 시작 직후에는 최대 속도로 상황을 파악
+        self._level_seen_at = {level: time.monotonic() for level in self.LEVELS}
+        self.level_changes = 0
+
+        logger.info(f"InferenceRateScheduler 초기화 완료: IDLE={idle_fps}FPS, PERSONS={persons_fps}FPS, "
+                    f"ACTIVE={max_fps}FPS, 유지 시간={hold_time}s")
+
+    @property
+    def current_fps(self) -> float:
+        return self.fps_by_level[self.level]
+
+    @property
+    def frame_interval(self) -> float:
+        """현재 속도에서 루프 한 번에 할당된 시간 (초)."""
+        return 1.0 / self.current_fps
+
+    def _classify(self, detection_result: Dict[str, Any], mode: Optional[str], risk_level: Optional[str]) -> str:
+        """이번 프레임의 상황이 요구하는 단계를 판단합니다."""
+        if mode == "MAINTENANCE" or risk_level in self.ACTIVE_RISK_LEVELS:
+            return "ACTIVE"
+        if detection_result.get("danger_zone_alerts") or detection_result.get("near_zone"):
+            return "ACTIVE"
+        if detection_result.get("persons"):
+            return "PERSONS"
+        return "IDLE"
+
+    def update(self, detection_result: Dict[str, Any], mode: Optional[str] = None,
+               risk_level: Optional[str] = None, now: Optional[float] = None) -> float:
+        """
+        최신 탐지/판단 결과로 단계를 갱신하고, 적용할 추론 FPS를 반환합니다.
+
+        Args:
+            detection_result: Detector.detect()/detect_cameras()의 반환값
+            mode: 현재 작업 모드 ('AUTOMATIC', 'MAINTENANCE' 등)
+            risk_level: LogicFacade가 결정한 위험 등급
+        """
+        now = time.monotonic() if now is None else now
+        required = self._classify(detection_result, mode, risk_level)
+        required_rank = self.LEVELS.index(required)
+        # 각 단계가 마지막으로 필요했던 시각 (높은 단계가 필요했던 순간은 낮은 단계도 충족된 것으로 봄)
+        for level in self.LEVELS[:required_rank + 1]:
+            self._level_seen_at[level] = now
+
+        new_level = self.level
+        if required_rank > self.LEVELS.index(self.level):
+            new_level = required
+        else:
+            # 유지 시간 안에 필요했던 가장 높은 단계로 내림
+            for level in reversed(self.LEVELS[required_rank:self.LEVELS.index(self.level) + 1]):
+                if now - self._level_seen_at[level] < self.hold_time:
+                    new_level = level
+                    break
+
+        if new_level != self.level:
+            logger.info(f"추론 속도 변경: {self.level}({self.current_fps}FPS) → {new_level}({self.fps_by_level[new_level]}FPS)")
+            self.level = new_level
+            self.level_changes += 1
+        return self.current_fps
+
+    def get_status(self) -> Dict[str, Any]:
+        """상태 메시지에 포함할 현재 단계와 FPS."""
+        return {"inference_level": self.level, "inference_fps": self.current_fps}
@@ -68,9 +68,11 @@ class LogicFacade:
         risk_factors = self.last_risk_analysis.get("risk_factors", [])
         current_risk_level = "SAFE" # 기본값을 SAFE로 설정
         if risk_factors:
-            # 위험도 순서: CRITICAL > LOTO > WARNING > NOTICE
+            # 위험도 순서: CRITICAL > STALE_FEED > LOTO > WARNING > NOTICE
             if any(f["type"] == "POSTURE_FALLING" for f in risk_factors) or any(f["type"] == "SENSOR_ALERT" for f in risk_factors):
                 current_risk_level = "CRITICAL"
+            elif any(f["type"] == "STALE_FEED" for f in risk_factors):
+                current_risk_level = "STALE_FEED"
             elif current_mode == "MAINTENANCE" and any(f["type"] == "ZONE_INTRUSION" for f in risk_factors):
                 current_risk_level = "LOTO_RISK_DETECTED"
             elif any(f["type"] == "ZONE_INTRUSION" for f in risk_factors):
@@ -78,10 +80,17 @@ class LogicFacade:
             elif any(f["type"] == "POSTURE_CROUCHING" for f in risk_factors):
                 current_risk_level = "NOTICE"
 
-        # 4. 최종 결과 반환
+        # 4. 프레임 캡처 정보를 액션에 첨부 (제어 계층에서 캡처→명령 지연 시간을 측정할 수 있도록)
+        frame_meta = detection_result.get("frame_meta")
+        if frame_meta is not None:
+            for action in actions:
+                action["frame_meta"] = frame_meta
+
+        # 5. 최종 결과 반환
         return {
             "actions": actions,
             "status": {
                 "risk_level": current_risk_level
-            }
+            },
+            "frame_meta": frame_meta
         }
\ No newline at end of file
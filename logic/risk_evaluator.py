@@ -59,4 +59,15 @@ class RiskEvaluator:
                     "sensor_type": sensor_type
                 })
 
+        # 4. 영상 정지(동일 프레임 반복) 사실 식별
+        # 멈춘 영상에서는 사람이 보이지 않아 SAFE로 오판할 수 있으므로 별도 위험 요소로 보고합니다.
+        stale_cameras = detection_result.get("stale_cameras", [])
+        if stale_cameras:
+            frame_meta = detection_result.get("frame_meta") or {}
+            risk_factors.append({
+                "type": "STALE_FEED",
+                "cameras": stale_cameras,
+                "frozen_for": frame_meta.get("frozen_for", 0.0)
+            })
+
         return {"risk_factors": risk_factors}
\ No newline at end of file
@@ -44,6 +44,7 @@ class RuleEngine:
         is_falling = any(f["type"] == "POSTURE_FALLING" for f in risk_factors)
         is_crouching = any(f["type"] == "POSTURE_CROUCHING" for f in risk_factors)
         has_sensor_alert = any(f["type"] == "SENSOR_ALERT" for f in risk_factors)
+        has_stale_feed = any(f["type"] == "STALE_FEED" for f in risk_factors)
 
         # --- 규칙 정의 ---
         log_action = None
@@ -64,6 +65,13 @@ class RuleEngine:
             actions.append({"type": "LOCK_SYSTEM", "details": {"reason": reason}})
             log_action = {"type": log_type, "details": {}}
 
+        # 규칙 0.5: 영상 정지 (화면으로 안전을 확인할 수 없으므로 잠금 없이 정지하고 경고)
+        elif has_stale_feed:
+            if conveyor_is_on:
+                actions.append({"type": "POWER_OFF", "details": {"reason": "stale_camera_feed"}})
+            actions.append({"type": "TRIGGER_ALARM_HIGH", "details": {"reason": "stale_camera_feed"}})
+            log_action = {"type": "LOG_STALE_FEED", "details": {}}
+
         # 규칙 1: 정비(MAINTENANCE) 모드 - LOTO(Lock-Out, Tag-Out) 로직
         elif mode == "MAINTENANCE":
             # 정비 모드에서는 침입 여부와 관계없이 항상 전원을 차단합니다.
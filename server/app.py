@@ -23,6 +23,8 @@ from server.services.db_service import DBService
 from server.services.zone_service import ZoneService
 from server.services.websocket_service import WebSocketService
 from server.vision_worker import run_worker_process # 분리된 워커 프로세스 진입점
+from config.config import get_config
+from input_adapter.input_facade import configured_camera_ids
 
 # --- 라우터 임포트 ---
 from server.routes import log_api, streaming, alert_ws, zone_api, control_api, log_ws
@@ -81,6 +83,8 @@ async def lifespan(app: FastAPI):
     app.state.websocket_service = WebSocketService()
     app.state.db_service = DBService(loop=app.state.loop, websocket_service=app.state.websocket_service)
     app.state.zone_service = ZoneService()
+    # 대시보드의 다중 카메라 격자 영상에서 그린 구역을 카메라별 좌표로 변환할 때 사용 (격자는 이 순서로 배치됨)
+    app.state.camera_ids = configured_camera_ids(get_config()["input"])
     logger.success("핵심 서비스(DB, WS, Zone) 초기화 완료.")
 
     # 3. Vision Worker 프로세스 시작
@@ -1,6 +1,7 @@
 from fastapi import Request, WebSocket, HTTPException
 from loguru import logger
 from multiprocessing import Queue
+from typing import List
 
 from server.services.db_service import DBService
 from server.services.websocket_service import WebSocketService
@@ -38,6 +39,12 @@ def get_command_queue(request: Request) -> Queue:
         raise HTTPException(status_code=500, detail="Command Queue is not initialized.")
     return request.app.state.command_queue
 
+def get_camera_ids(request: Request) -> List[str]:
+    """
+    app.state에 저장된 다중 카메라 ID 목록(설정 순서)을 가져옵니다. 단일 카메라 구성이면 빈 목록입니다.
+    """
+    return getattr(request.app.state, 'camera_ids', [])
+
 def get_frame_queue(request: Request) -> Queue:
     """
     app.state에 저장된 Vision Worker로부터 프레임을 수신하는 frame_queue를 가져옵니다.
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 class AlertMessage(BaseModel):
     """실시간 위험 경보를 위한 웹소켓 메시지 모델"""
@@ -56,6 +56,10 @@ class StatusUpdateMessage(BaseModel):
     conveyor_speed: int = Field(..., description="컨베이어 속도 (%)", examples=[100, 50, 0])
     risk_level: str = Field(..., description="현재 감지된 위험 수준", examples=["SAFE", "WARNING", "CRITICAL", "LOTO_RISK_DETECTED"])
     is_locked: bool = Field(..., description="시스템 잠금 상태", examples=[False, True])
+    camera_status: str = Field("CONNECTED", description="카메라 연결 상태", examples=["CONNECTED", "LOST"])
+    lost_cameras: List[str] = Field(default_factory=list, description="연결이 끊긴 카메라 ID 목록", examples=[["line1_left"]])
+    inference_level: str = Field("ACTIVE", description="위험도에 따른 추론 속도 단계", examples=["IDLE", "PERSONS", "ACTIVE"])
+    inference_fps: float = Field(15.0, description="현재 추론 속도 (FPS)", examples=[3.0, 8.0, 15.0])
 
     class Config:
         json_schema_extra = {
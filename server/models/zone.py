@@ -3,13 +3,15 @@ from typing import List, Optional
 
 class Point(BaseModel):
     """x, y 좌표를 나타내는 단일 포인트 모델"""
-    x: int = Field(..., description="포인트의 x 좌표")
-    y: int = Field(..., description="포인트의 y 좌표")
+    x: float = Field(..., description="포인트의 x 좌표 (픽셀, normalized이면 0~1 비율 좌표)")
+    y: float = Field(..., description="포인트의 y 좌표 (픽셀, normalized이면 0~1 비율 좌표)")
 
 class DangerZoneBase(BaseModel):
     """위험 구역의 공통 속성을 정의하는 기본 모델"""
     name: str = Field(..., description="사람이 읽을 수 있는 구역의 이름", examples=["1번 컨베이어 벨트 구역"])
     points: List[Point] = Field(..., description="구역의 다각형을 정의하는 포인트의 리스트")
+    camera_id: Optional[str] = Field(None, description="구역이 속한 카메라 ID (없으면 모든 카메라에 적용)", examples=["line1_left"])
+    normalized: bool = Field(False, description="points가 영상 크기에 대한 0~1 비율 좌표인지 여부 (False면 픽셀 좌표)")
 
 class DangerZoneCreate(DangerZoneBase):
     """새로운 위험 구역을 생성할 때 사용하는 모델 (ID는 포함되지 않음)"""
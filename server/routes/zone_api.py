@@ -1,16 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException, Body, status
-from typing import List
+from typing import List, Dict, Any
 from loguru import logger
 from multiprocessing import Queue
 
+from core.drawing_utils import tile_points_to_camera
 from ..services.zone_service import ZoneService
-from ..dependencies import get_zone_service, get_command_queue
+from ..dependencies import get_zone_service, get_command_queue, get_camera_ids
 from ..models.zone import DangerZone, DangerZoneCreate, DangerZoneBase, ZoneResponse, Point
 
 router = APIRouter(
     tags=["위험 구역 (Danger Zones)"]
 )
 
+def _assign_tile_camera(zone_dict: Dict[str, Any], camera_ids: List[str]) -> Dict[str, Any]:
+    """
+    다중 카메라 격자 영상 위에 그린 구역(camera_id 없음, 비율 좌표)을 다각형 중심이 놓인 카메라의 구역으로 변환합니다.
+    대시보드 영상은 워커가 설정의 카메라 순서대로 tile_frames()로 합친 격자이므로, 같은 배치로 카메라와 타일 기준 좌표를 구합니다.
+    """
+    if len(camera_ids) < 2 or not zone_dict.get('normalized') or zone_dict.get('camera_id'):
+        return zone_dict
+    try:
+        index, points = tile_points_to_camera(zone_dict['points'], len(camera_ids))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    logger.info(f"격자 영상 좌표의 구역을 카메라 '{camera_ids[index]}' 기준 좌표로 변환했습니다.")
+    return {**zone_dict, 'camera_id': camera_ids[index], 'points': points}
+
 @router.get("", response_model=List[DangerZone], summary="모든 위험 구역 조회")
 def get_all_zones(zone_service: ZoneService = Depends(get_zone_service)):
     """설정된 모든 위험 구역의 목록을 조회합니다."""
@@ -22,7 +37,9 @@ def get_all_zones(zone_service: ZoneService = Depends(get_zone_service)):
             DangerZone(
                 id=zone['id'],
                 name=zone['name'],
-                points=[Point(**p) for p in zone.get('points', [])]
+                points=[Point(**p) for p in zone.get('points', [])],
+                camera_id=zone.get('camera_id'),
+                normalized=zone.get('normalized', False)
             ) for zone in zones_data
         ]
     except Exception as e:
@@ -39,20 +56,23 @@ def get_zone_by_id(zone_id: str, zone_service: ZoneService = Depends(get_zone_se
     return DangerZone(
         id=zone['id'],
         name=zone['name'],
-        points=[Point(**p) for p in zone.get('points', [])]
+        points=[Point(**p) for p in zone.get('points', [])],
+        camera_id=zone.get('camera_id'),
+        normalized=zone.get('normalized', False)
     )
 
 @router.post("", response_model=ZoneResponse, status_code=status.HTTP_201_CREATED, summary="새로운 위험 구역 생성")
 def create_zone(
     zone: DangerZone, 
     zone_service: ZoneService = Depends(get_zone_service),
-    command_queue: Queue = Depends(get_command_queue)
+    command_queue: Queue = Depends(get_command_queue),
+    camera_ids: List[str] = Depends(get_camera_ids)
 ):
     """새로운 위험 구역을 생성하고, Vision Worker에게 즉시 업데이트합니다."""
     if zone_service.get_zone(zone.id):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"ID가 '{zone.id}'인 구역이 이미 존재합니다.")
     
-    zone_dict = zone.model_dump()
+    zone_dict = _assign_tile_camera(zone.model_dump(), camera_ids)
     zone_service.add_or_update_zone(zone.id, zone_dict)
     
     # Worker에게 최신 Zone 정보 전송
@@ -67,13 +87,14 @@ def update_zone(
     zone_id: str,
     zone_data: DangerZoneBase,
     zone_service: ZoneService = Depends(get_zone_service),
-    command_queue: Queue = Depends(get_command_queue)
+    command_queue: Queue = Depends(get_command_queue),
+    camera_ids: List[str] = Depends(get_camera_ids)
 ):
     """기존 위험 구역의 이름과 좌표를 업데이트하고, Vision Worker에게 즉시 업데이트합니다."""
     if not zone_service.get_zone(zone_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID가 '{zone_id}'인 구역을 찾을 수 없습니다.")
     
-    zone_dict = zone_data.model_dump()
+    zone_dict = _assign_tile_camera(zone_data.model_dump(), camera_ids)
     zone_service.add_or_update_zone(zone_id, zone_dict)
 
     # Worker에게 최신 Zone 정보 전송
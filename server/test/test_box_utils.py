@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from detect.box_utils import assign_boxes, box_iou, boxes_to_array, suppress_duplicates
+
+
+def test_box_iou_matrix():
+    ious = box_iou([[0, 0, 10, 10], [5, 5, 15, 15]], [[0, 0, 10, 10], [20, 20, 30, 30], [0, 0, 5, 10]])
+    assert ious.shape == (2, 3)
+    np.testing.assert_allclose(ious[0], [1.0, 0.0, 0.5])
+    np.testing.assert_allclose(ious[1], [25 / 175, 0.0, 0.0])
+
+
+def test_greedy_assignment_is_one_to_one():
+    # 두 행이 같은 열 0을 가장 선호해도 IoU가 큰 행만 열 0을 받음
+    ious = np.array([[0.9, 0.6],
+                     [0.8, 0.1]])
+    assert assign_boxes(ious, 0.5, "greedy") == [(0, 0)]
+    assert sorted(assign_boxes(ious, 0.05, "greedy")) == [(0, 0), (1, 1)]
+
+
+def test_assignment_respects_threshold_and_empty_input():
+    assert assign_boxes(np.array([[0.4]]), 0.5) == []
+    assert assign_boxes(np.zeros((0, 3)), 0.5) == []
+
+
+def test_hungarian_maximizes_total_iou():
+    pytest.importorskip("scipy")
+    ious = np.array([[0.9, 0.8],
+                     [0.8, 0.1]])
+    assert sorted(assign_boxes(ious, 0.05, "hungarian")) == [(0, 1), (1, 0)]
+
+
+def test_unknown_strategy_raises():
+    with pytest.raises(ValueError):
+        assign_boxes(np.array([[0.9]]), 0.5, "nearest")
+
+
+def test_suppress_duplicates_keeps_best_of_each_cluster():
+    boxes = [[0, 0, 10, 10], [1, 0, 11, 10], [50, 50, 60, 60], [0, 0, 10, 10]]
+    keep = suppress_duplicates(boxes, [0.6, 0.9, 0.5, 0.7], 0.5)
+    assert keep.tolist() == [1, 2]
+    assert suppress_duplicates(np.zeros((0, 4)), [], 0.5).tolist() == []
+
+
+class _Data:
+    """torch 텐서처럼 .cpu().numpy()로 배열을 돌려주는 가짜 데이터."""
+
+    def __init__(self, rows, columns=6):
+        self._rows = np.asarray(rows, dtype=np.float32).reshape(-1, columns)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self._rows
+
+
+class _Boxes:
+    def __init__(self, rows, columns=6):
+        self.data = _Data(rows, columns)
+
+    def __len__(self):
+        return len(self.data.numpy())
+
+
+def test_boxes_to_array_converts_data_once():
+    rows = [[10.7, 20.2, 50.9, 80.5, 0.87, 0], [1, 2, 3, 4, 0.5, 2]]
+    detections = boxes_to_array(_Boxes(rows))
+    assert detections.dtype == np.float32 and detections.shape == (2, 6)
+    np.testing.assert_array_equal(detections, np.float32(rows))
+
+
+def test_boxes_to_array_empty_and_none():
+    for boxes in (None, _Boxes([])):
+        detections = boxes_to_array(boxes)
+        assert detections.shape == (0, 6) and detections.dtype == np.float32
+
+
+def test_boxes_to_array_takes_conf_and_cls_from_last_columns():
+    # 추적 결과는 [x1, y1, x2, y2, id, conf, cls] 7열
+    detections = boxes_to_array(_Boxes([[1, 2, 3, 4, 17, 0.6, 1]], columns=7))
+    np.testing.assert_allclose(detections, [[1, 2, 3, 4, 0.6, 1]])
@@ -0,0 +1,215 @@
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from detect.danger_zone_mapper import DangerZoneMapper
+
+
+def square_zone(zone_id, x, y, size, **extra):
+    """(x, y)에서 시작하는 정사각형 구역 데이터."""
+    points = [{"x": x, "y": y}, {"x": x + size, "y": y}, {"x": x + size, "y": y + size}, {"x": x, "y": y + size}]
+    return {"id": zone_id, "name": zone_id, "points": points, **extra}
+
+
+def zone_points(mapper, frame_size):
+    return mapper.get_zones_for_camera(None, frame_size)[0]["points"].tolist()
+
+
+# --- 좌표 정규화 ---
+
+def test_normalized_zone_follows_frame_size():
+    mapper = DangerZoneMapper()
+    mapper.update_zones_from_data([square_zone("z", 0.25, 0.25, 0.5, normalized=True)])
+    assert zone_points(mapper, (640, 480)) == [[160, 120], [480, 120], [480, 360], [160, 360]]
+    assert zone_points(mapper, (1920, 1080)) == [[480, 270], [1440, 270], [1440, 810], [480, 810]]
+
+
+def test_pixel_zone_is_used_as_is_without_reference_size():
+    mapper = DangerZoneMapper()
+    # 값이 1 이하여도 normalized가 없으면 픽셀 좌표로 취급 (값으로 추측하지 않음)
+    mapper.update_zones_from_data([square_zone("z", 0, 0, 1), square_zone("p", 100, 50, 200)])
+    zones = mapper.get_zones_for_camera(None, (640, 480))
+    assert zones[0]["points"].tolist() == [[0, 0], [1, 0], [1, 1], [0, 1]]
+    assert zones[1]["points"].tolist() == [[100, 50], [300, 50], [300, 250], [100, 250]]
+
+
+def test_pixel_zone_is_scaled_from_reference_size():
+    mapper = DangerZoneMapper(reference_size=(1280, 720))
+    mapper.update_zones_from_data([square_zone("z", 320, 180, 640)])
+    assert zone_points(mapper, (640, 360)) == [[160, 90], [480, 90], [480, 410], [160, 410]]
+
+
+# --- 겹침 면적 (raster) ---
+
+L_SHAPE = [(100, 100), (300, 100), (300, 160), (160, 160), (160, 300), (100, 300)]  # 오목 다각형
+
+
+def polygon_zone(zone_id, vertices, **extra):
+    return {"id": zone_id, "name": zone_id, "points": [{"x": x, "y": y} for x, y in vertices], **extra}
+
+
+def raster_reference_area(vertices, bbox, frame_size=(400, 400)):
+    """구역과 bbox를 각각 그려 AND한 픽셀 수 (누적합 테이블 도입 전 방식)."""
+    zone_mask = np.zeros(frame_size[::-1], dtype=np.uint8)
+    cv2.fillPoly(zone_mask, [np.array(vertices, dtype=np.int32)], 1)
+    box_mask = np.zeros_like(zone_mask)
+    x1, y1, x2, y2 = bbox
+    cv2.rectangle(box_mask, (x1, y1), (x2, y2), 1, thickness=-1)
+    return int(np.count_nonzero(zone_mask & box_mask))
+
+
+def test_raster_overlap_counts_shared_pixels():
+    mapper = DangerZoneMapper(overlap_method="raster")
+    mapper.update_zones_from_data([square_zone("z", 100, 100, 100)])
+    zone = mapper.danger_zones[0]
+    # 양 끝 픽셀을 포함하므로 150~200은 51픽셀
+    assert mapper._zone_overlap_areas(np.array([[150, 150, 250, 250]]), zone).tolist() == [51 * 51]
+    assert mapper._zone_overlap_areas(np.array([[0, 0, 50, 50]]), zone).tolist() == [0]
+
+
+def test_raster_overlap_matches_mask_reference():
+    mapper = DangerZoneMapper(overlap_method="raster")
+    mapper.update_zones_from_data([polygon_zone("l", L_SHAPE)])
+    zone = mapper.danger_zones[0]
+    rng = np.random.default_rng(0)
+    corners = rng.integers(-50, 380, size=(200, 2, 2))
+    bboxes = np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1)
+    expected = [raster_reference_area(L_SHAPE, bbox) for bbox in bboxes]
+    assert mapper._zone_overlap_areas(bboxes, zone).tolist() == expected
+
+
+# --- 겹침 면적 (polygon) ---
+
+def test_polygon_overlap_is_exact_area():
+    mapper = DangerZoneMapper(overlap_method="polygon")
+    mapper.update_zones_from_data([square_zone("z", 100, 100, 100), polygon_zone("l", L_SHAPE)])
+    square, l_shape = mapper.danger_zones
+    bboxes = np.array([[150, 150, 250, 250], [0, 0, 50, 50], [100, 100, 200, 200], [0, 0, 400, 400]])
+    np.testing.assert_allclose(mapper._zone_overlap_areas(bboxes, square), [2500, 0, 10000, 10000])
+    # L자 구역의 면적: 200x60 + 60x140 = 20400, 안쪽 모서리를 덮는 bbox는 두 팔의 일부만 겹침
+    np.testing.assert_allclose(mapper._zone_overlap_areas(bboxes, l_shape), [100 * 10 + 10 * 90, 0, 100 * 60 + 60 * 40, 20400])
+
+
+# --- 일괄 침입 검사 ---
+
+def per_pair_hits(mapper, persons, zones):
+    """check_person_in_zone을 사람×구역 쌍마다 호출한 결과 {(구역 ID, 사람 인덱스): IoU}."""
+    hits = {}
+    for zone in zones:
+        for i, person in enumerate(persons):
+            inside, iou = mapper.check_person_in_zone(person["bbox"], zone)
+            if inside:
+                hits[(zone["id"], i)] = iou
+    return hits
+
+
+def batched_hits(alerts):
+    return {(alert["zone_id"], p["person_index"]): p["intrusion_iou"] for alert in alerts for p in alert["persons"]}
+
+
+@pytest.mark.parametrize("method", DangerZoneMapper.OVERLAP_METHODS)
+def test_check_all_zones_matches_per_pair_check(method):
+    mapper = DangerZoneMapper(overlap_method=method)
+    mapper.update_zones_from_data([
+        square_zone("square", 40, 40, 120),
+        polygon_zone("l", L_SHAPE, iou_threshold=0.3),
+        polygon_zone("triangle", [(220, 220), (380, 240), (260, 390)], iou_threshold=0.05),
+        square_zone("small", 300, 40, 8, iou_threshold=0.01),
+    ])
+    rng = np.random.default_rng(1)
+    corners = rng.integers(0, 400, size=(300, 2, 2))
+    bboxes = np.concatenate([corners.min(axis=1), corners.max(axis=1)], axis=1).tolist()
+    bboxes.append([310, 0, 310, 100])  # 면적 0
+    bboxes.append([280, 20, 330, 70])  # 작은 구역을 완전히 덮음 (포인트 검사로 놓치는 경우)
+    persons = [{"bbox": bbox, "confidence": 0.9} for bbox in bboxes]
+
+    alerts = mapper.check_all_zones(persons)
+    expected = per_pair_hits(mapper, persons, mapper.get_zones_for_camera())
+    assert batched_hits(alerts) == expected
+    assert ("small", len(persons) - 1) in expected
+    assert [alert["zone_id"] for alert in alerts] == [z for z in ("square", "l", "triangle", "small")
+                                                      if any(key[0] == z for key in expected)]
+
+
+def test_check_all_zones_uses_camera_zones_at_frame_size():
+    mapper = DangerZoneMapper()
+    mapper.update_zones_from_data([
+        square_zone("left", 0.0, 0.0, 0.5, normalized=True, camera_id="cam0"),
+        square_zone("shared", 0.5, 0.5, 0.5, normalized=True),
+    ])
+    persons = [{"bbox": [100, 100, 200, 200], "confidence": 0.9}, {"bbox": [900, 500, 1000, 600], "confidence": 0.8}]
+    assert batched_hits(mapper.check_all_zones(persons, "cam0", (1280, 720))) == {("left", 0): 1.0, ("shared", 1): 1.0}
+    assert batched_hits(mapper.check_all_zones(persons, "cam1", (1280, 720))) == {("shared", 1): 1.0}
+    assert mapper.check_all_zones([], "cam0", (1280, 720)) == []
+
+
+# --- 구역 스냅샷 ---
+
+def zone_ids(mapper):
+    return [zone["id"] for zone in mapper.danger_zones]
+
+
+def test_unchanged_zone_list_keeps_snapshot_version():
+    mapper = DangerZoneMapper()
+    zones_data = [square_zone("a", 0, 0, 10), square_zone("b", 20, 20, 10)]
+    mapper.update_zones_from_data(zones_data)
+    snapshot = mapper.snapshot
+    mapper.update_zones_from_data([dict(zone) for zone in zones_data])
+    assert mapper.snapshot is snapshot
+    assert mapper.version == 1
+
+
+def test_update_reparses_only_changed_zones():
+    mapper = DangerZoneMapper()
+    mapper.update_zones_from_data([square_zone("a", 0, 0, 10), square_zone("b", 20, 20, 10), square_zone("c", 40, 40, 10)])
+    old = mapper.snapshot
+    mapper.update_zones_from_data([square_zone("a", 0, 0, 10), square_zone("b", 25, 20, 10), square_zone("d", 60, 60, 10)])
+
+    assert mapper.version == 2
+    assert zone_ids(mapper) == ["a", "b", "d"]
+    assert mapper.danger_zones[0] is old.zones[0]
+    assert mapper.danger_zones[1] is not old.zones[1]
+    assert mapper.danger_zones[1]["points"].tolist()[0] == [25, 20]
+    # 이전 스냅샷을 잡고 있던 쪽은 바뀌지 않은 목록을 계속 사용
+    assert [zone["id"] for zone in old.zones] == ["a", "b", "c"]
+    assert old.zones[1]["points"].tolist()[0] == [20, 20]
+
+
+def test_apply_zone_changes_replaces_in_place_appends_and_removes():
+    mapper = DangerZoneMapper()
+    mapper.update_zones_from_data([square_zone("a", 0, 0, 10), square_zone("b", 20, 20, 10)])
+    kept = mapper.danger_zones[1]
+    mapper.apply_zone_changes(upserts=[square_zone("a", 5, 5, 10), square_zone("c", 40, 40, 10)])
+    assert zone_ids(mapper) == ["a", "b", "c"]
+    assert mapper.danger_zones[0]["points"].tolist()[0] == [5, 5]
+    assert mapper.danger_zones[1] is kept
+
+    mapper.apply_zone_changes(removed_ids=["a"])
+    assert zone_ids(mapper) == ["b", "c"]
+    version = mapper.version
+    mapper.apply_zone_changes(removed_ids=["missing"], upserts=[{"id": "bad", "name": "bad"}])
+    assert mapper.version == version
+
+
+def test_scaled_zones_are_reused_across_snapshots():
+    mapper = DangerZoneMapper()
+    mapper.update_zones_from_data([square_zone("a", 0.0, 0.0, 0.5, normalized=True), square_zone("b", 0.5, 0.5, 0.5, normalized=True)])
+    scaled = mapper.get_zones_for_camera(None, (640, 480))
+    assert mapper.get_zones_for_camera(None, (640, 480))[0] is scaled[0]
+
+    mapper.apply_zone_changes(upserts=[square_zone("b", 0.25, 0.25, 0.5, normalized=True)])
+    rescaled = mapper.get_zones_for_camera(None, (640, 480))
+    assert rescaled[0] is scaled[0]
+    assert rescaled[1]["points"].tolist()[0] == [160, 120]
+
+
+def test_snapshot_geometry_is_read_only():
+    mapper = DangerZoneMapper()
+    mapper.update_zones_from_data([square_zone("a", 0, 0, 10)])
+    with pytest.raises(ValueError):
+        mapper.danger_zones[0]["points"][0, 0] = 99
@@ -0,0 +1,203 @@
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+pytest.importorskip("torch")
+
+from detect import detect_facade
+from detect.detect_facade import Detector
+from detect.danger_zone_mapper import DangerZoneMapper
+
+FPS = 15.0
+DT = 1.0 / FPS
+FRAME_W, FRAME_H = 640, 480
+# 오른쪽 아래 정사각형 위험 구역 (픽셀 420~620, 260~460)
+ZONE = {"id": "zone", "name": "zone", "normalized": True,
+        "points": [{"x": 420 / FRAME_W, "y": 260 / FRAME_H}, {"x": 620 / FRAME_W, "y": 260 / FRAME_H},
+                   {"x": 620 / FRAME_W, "y": 460 / FRAME_H}, {"x": 420 / FRAME_W, "y": 460 / FRAME_H}]}
+
+
+def make_detector(gate=None, tracker=None):
+    """모델 없이 추론 결정 로직만 검사하는 Detector. _run_models는 장면의 실제 사람을 돌려주고 호출 시각을 기록합니다."""
+    detector = Detector.__new__(Detector)
+    detector.danger_zone_mapper = DangerZoneMapper()
+    detector.danger_zone_mapper.update_zones_from_data([ZONE])
+    detector._motion_gate_config = gate
+    detector.motion_gates = {}
+    detector._tracker_config = tracker
+    detector.trackers = {}
+    detector._last_persons = {}
+    detector.near_zone_margin = 80
+    detector.model_runs = []
+    return detector
+
+
+def render(boxes):
+    frame = np.zeros((FRAME_H, FRAME_W, 3), dtype=np.uint8)
+    for x1, y1, x2, y2 in boxes:
+        frame[y1:y2, x1:x2] = 200
+    return frame
+
+
+def run_scene(detector, scene):
+    """scene[i] = i번째 프레임의 사람 bbox 목록. 모델이 실행된 프레임 번호 목록을 반환합니다."""
+    runs = []
+    for index, boxes in enumerate(scene):
+        now = index * DT
+        detector._run_models = lambda frame, camera_id=None, boxes=boxes: [
+            {"bbox": list(box), "confidence": 0.9, "pose_analysis": {"is_falling": False}} for box in boxes]
+        _, skipped = detector._infer_or_reuse(render(boxes), None, now=now)
+        if not skipped:
+            runs.append(index)
+    return runs
+
+
+def max_gap_seconds(runs):
+    return max(b - a for a, b in zip(runs, runs[1:])) * DT
+
+
+GATE = {"max_skip_interval": 0.5}
+TRACKER = {"detect_interval": 10, "max_detection_gap": 1.0}
+
+
+def test_static_scene_gap_is_bounded_by_gate_interval():
+    detector = make_detector(gate=GATE, tracker=TRACKER)
+    runs = run_scene(detector, [[(50, 50, 110, 210)]] * int(3 * FPS))
+    assert max_gap_seconds(runs) <= GATE["max_skip_interval"] + DT
+
+
+def test_moving_scene_gap_does_not_add_tracker_gap_to_gate_interval():
+    detector = make_detector(gate=GATE, tracker=TRACKER)
+    # 구역에서 먼 곳을 계속 움직이는 사람: 게이트는 매 프레임 변화를 보고, 추적기는 예측으로 탐지를 미룸
+    scene = [[(20 + 2 * (i % 40), 50, 80 + 2 * (i % 40), 210)] for i in range(int(4 * FPS))]
+    runs = run_scene(detector, scene)
+    assert max_gap_seconds(runs) <= GATE["max_skip_interval"] + DT
+
+
+def test_person_appearing_near_zone_is_detected_on_first_frame():
+    detector = make_detector(gate=GATE, tracker=TRACKER)
+    appear = int(1.2 * FPS)
+    scene = [[] for _ in range(appear)] + [[(440, 280, 500, 440)]] * 5
+    runs = run_scene(detector, scene)
+    assert appear in runs
+
+
+def test_tracked_person_far_from_zone_is_predicted_between_detections():
+    detector = make_detector(tracker={"detect_interval": 3, "max_detection_gap": 1.0})
+    scene = [[(20 + 2 * i, 50, 80 + 2 * i, 210)] for i in range(9)]
+    assert run_scene(detector, scene) == [0, 3, 6]
+
+
+# --- 위험 구역 ROI 크롭 추론 ---
+
+ROI_FRAME_W, ROI_FRAME_H = 1280, 720
+# 픽셀 800~1000, 400~600 정사각형 구역 → 여백 80을 더한 ROI는 (720, 320, 361, 361)
+ROI_ZONE = {"id": "roi", "name": "roi", "normalized": True,
+            "points": [{"x": 800 / ROI_FRAME_W, "y": 400 / ROI_FRAME_H}, {"x": 1000 / ROI_FRAME_W, "y": 400 / ROI_FRAME_H},
+                       {"x": 1000 / ROI_FRAME_W, "y": 600 / ROI_FRAME_H}, {"x": 800 / ROI_FRAME_W, "y": 600 / ROI_FRAME_H}]}
+PERSON = (850, 450, 900, 560)
+
+
+class BlobPersonDetector:
+    """입력 이미지(크롭/축소 여부와 무관)에서 밝은 사각형을 사람으로 찾아 입력 좌표 bbox로 돌려주는 가짜 탐지기."""
+
+    def __init__(self):
+        self.calls = []
+
+    def detect(self, frame, imgsz=None):
+        self.calls.append((frame.shape[:2], imgsz))
+        mask = (frame[:, :, 0] > 100).astype(np.uint8)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        persons = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            persons.append({"bbox": [x, y, x + w, y + h], "confidence": 0.9})
+        return persons
+
+
+class PassThroughPoseDetector:
+    def detect(self, frame, persons, imgsz=None):
+        for person in persons:
+            person["pose_analysis"] = {"is_falling": False}
+        return persons
+
+
+def make_roi_detector(inference_width=None, zones=(ROI_ZONE,), **roi_config):
+    detector = Detector.__new__(Detector)
+    detector.danger_zone_mapper = DangerZoneMapper()
+    detector.danger_zone_mapper.update_zones_from_data(list(zones))
+    detector.inference_width = inference_width
+    detector.zone_roi_config = {"enabled": True, "margin": 80, "full_frame_interval": 1.0, "max_area_ratio": 0.6,
+                                **roi_config}
+    detector._last_full_frame_time = {}
+    detector.person_detector = BlobPersonDetector()
+    detector.pose_detector = PassThroughPoseDetector()
+    return detector
+
+
+def roi_frame():
+    frame = np.zeros((ROI_FRAME_H, ROI_FRAME_W, 3), dtype=np.uint8)
+    x1, y1, x2, y2 = PERSON
+    frame[y1:y2, x1:x2] = 255
+    return frame
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """detect_facade의 time.monotonic을 테스트가 정한 값으로 고정합니다."""
+    now = [100.0]
+    monkeypatch.setattr(detect_facade.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.parametrize("inference_width, input_shape, imgsz, tolerance", [
+    (None, (361, 361), 384, 0),
+    (640, (180, 180), 192, 2),  # 전체 프레임 너비 기준 배율 0.5
+])
+def test_roi_crop_boxes_come_back_in_frame_coordinates(clock, inference_width, input_shape, imgsz, tolerance):
+    detector = make_roi_detector(inference_width)
+    detector._last_full_frame_time[None] = clock[0]  # 전체 프레임 추론 직후
+    persons = detector._run_models(roi_frame())
+
+    assert detector.person_detector.calls == [(input_shape, imgsz)]
+    assert len(persons) == 1
+    np.testing.assert_allclose(persons[0]["bbox"], PERSON, atol=tolerance)
+
+
+def test_full_frame_inference_without_roi_matches_roi_result(clock):
+    detector = make_roi_detector(640)
+    persons = detector._run_models(roi_frame())  # 첫 프레임은 전체 프레임 추론
+    assert detector.person_detector.calls == [((360, 640), None)]
+    np.testing.assert_allclose(persons[0]["bbox"], PERSON, atol=2)
+
+
+def test_full_frame_interval_forces_full_frame(clock):
+    detector = make_roi_detector(full_frame_interval=1.0)
+    frame = roi_frame()
+    assert detector._select_roi(frame) is None
+    clock[0] += 0.5
+    assert detector._select_roi(frame) == (720, 320, 361, 361)
+    clock[0] += 0.5
+    assert detector._select_roi(frame) is None
+    clock[0] += 0.1
+    assert detector._select_roi(frame) == (720, 320, 361, 361)
+
+
+def test_large_roi_and_missing_zones_use_full_frame(clock):
+    large = {"id": "large", "name": "large", "normalized": True,
+             "points": [{"x": 0.1, "y": 0.1}, {"x": 0.9, "y": 0.1}, {"x": 0.9, "y": 0.9}, {"x": 0.1, "y": 0.9}]}
+    detector = make_roi_detector(zones=(large,))
+    detector._last_full_frame_time[None] = clock[0]
+    assert detector._select_roi(roi_frame()) is None
+
+    detector = make_roi_detector(zones=())
+    detector._last_full_frame_time[None] = clock[0]
+    assert detector._select_roi(roi_frame()) is None
+
+    detector = make_roi_detector(enabled=False)
+    assert detector._select_roi(roi_frame()) is None
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from core.drawing_utils import tile_frames, tile_layout, tile_points_to_camera
+
+
+def frame(value, size=(40, 30)):
+    return np.full((size[1], size[0], 3), value, dtype=np.uint8)
+
+
+def test_missing_camera_keeps_tile_positions():
+    canvas = tile_frames([frame(10), None, frame(30)])
+    assert tile_layout(3) == (2, 2)
+    assert canvas.shape == (60, 80, 3)
+    assert canvas[0, 0, 0] == 10 and canvas[0, 40, 0] == 0 and canvas[30, 0, 0] == 30
+    assert tile_frames([None, None]) is None
+
+
+def test_tiled_zone_maps_back_to_camera_coordinates():
+    frames = [frame(10), frame(20), frame(30)]
+    canvas = tile_frames(frames)
+    h, w = canvas.shape[:2]
+    # 세 번째 카메라(왼쪽 아래 타일)의 (10~30, 5~25) 픽셀 사각형을 격자 이미지 비율 좌표로 그림
+    drawn = [{"x": x / w, "y": (30 + y) / h} for x, y in [(10, 5), (30, 5), (30, 25), (10, 25)]]
+    index, points = tile_points_to_camera(drawn, len(frames))
+    assert index == 2
+    local = [(round(p["x"] * 40, 6), round(p["y"] * 30, 6)) for p in points]
+    assert local == [(10, 5), (30, 5), (30, 25), (10, 25)]
+
+
+def test_points_outside_the_chosen_tile_are_clipped():
+    drawn = [{"x": 0.4, "y": 0.1}, {"x": 0.6, "y": 0.1}, {"x": 0.4, "y": 0.3}, {"x": 0.3, "y": 0.3}]
+    index, points = tile_points_to_camera(drawn, 2)
+    assert index == 0
+    assert points[1] == {"x": 1.0, "y": 0.1}
+
+
+def test_zone_in_empty_cell_is_rejected():
+    with pytest.raises(ValueError):
+        tile_points_to_camera([{"x": 0.7, "y": 0.7}, {"x": 0.9, "y": 0.7}, {"x": 0.8, "y": 0.9}], 3)
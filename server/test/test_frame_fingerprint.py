@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from input_adapter.frame_fingerprint import FrozenFeedDetector
+
+
+def frame(value=0):
+    return np.full((72, 128, 3), value, dtype=np.uint8)
+
+
+def test_change_between_sampled_pixels_is_not_a_duplicate():
+    detector = FrozenFeedDetector(sample_step=8)
+    first = frame()
+    second = first.copy()
+    second[1, 1] = 255  # 8픽셀 간격 샘플에 포함되지 않는 위치
+    assert not detector.update("cam", first, now=0.0, seq=1)["duplicate"]
+    assert not detector.update("cam", second, now=0.1, seq=2)["duplicate"]
+    assert detector.update("cam", second.copy(), now=0.2, seq=3)["duplicate"]
+
+
+def test_repeated_frames_become_stale_and_recover():
+    detector = FrozenFeedDetector(stale_after=1.0)
+    detector.update("cam", frame(10), now=0.0, seq=1)
+    results = [detector.update("cam", frame(10), now=t, seq=seq) for seq, t in enumerate([0.5, 0.9, 1.2], start=2)]
+    assert [r["duplicate"] for r in results] == [True, True, True]
+    assert [r["stale"] for r in results] == [False, False, True]
+    assert results[-1]["frozen_for"] == 1.2
+    assert detector.get_stats()["cam"] == {"duplicates": 3, "stale": True}
+
+    recovered = detector.update("cam", frame(11), now=1.3, seq=5)
+    assert recovered == {"duplicate": False, "frozen_for": 0.0, "stale": False}
+
+
+def test_same_seq_is_a_reread_of_the_same_capture():
+    detector = FrozenFeedDetector()
+    captured = frame(3)
+    detector.update("cam", captured, now=0.0, seq=7)
+    assert detector.update("cam", captured, now=0.05, seq=7)["duplicate"]
+    assert not detector.update("cam", frame(4), now=0.1, seq=8)["duplicate"]
+
+
+def test_cameras_are_tracked_independently():
+    detector = FrozenFeedDetector()
+    detector.update("a", frame(1), now=0.0)
+    assert not detector.update("b", frame(1), now=0.0)["duplicate"]
+    assert detector.update("a", frame(1), now=0.1)["duplicate"]
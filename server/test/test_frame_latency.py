@@ -0,0 +1,97 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+pytest.importorskip("torch")
+pytest.importorskip("serial")
+
+from control.control_facade import ControlFacade
+from core.frame_envelope import FrameEnvelope, frame_event_details, latency_ms
+from detect.danger_zone_mapper import DangerZoneMapper
+from detect.detect_facade import Detector
+from logic.logic_facade import LogicFacade
+
+ZONE = {"id": "zone", "name": "zone", "normalized": True,
+        "points": [{"x": 0.5, "y": 0.5}, {"x": 1.0, "y": 0.5}, {"x": 1.0, "y": 1.0}, {"x": 0.5, "y": 1.0}]}
+PERSON_IN_ZONE = [400, 300, 460, 460]
+
+
+class FakeCommunicator:
+    def __init__(self):
+        self.commands = []
+        self.port = "mock"
+        self.serial = None
+
+    def send_command(self, command):
+        self.commands.append(command)
+
+    def close(self):
+        pass
+
+
+def make_detector():
+    """구역 안의 사람 한 명을 돌려주는 모델 스텁을 쓰는 Detector."""
+    detector = Detector.__new__(Detector)
+    detector.danger_zone_mapper = DangerZoneMapper()
+    detector.danger_zone_mapper.update_zones_from_data([ZONE])
+    detector._motion_gate_config = None
+    detector.motion_gates = {}
+    detector._tracker_config = None
+    detector.trackers = {}
+    detector._last_persons = {}
+    detector.near_zone_margin = 80
+    detector._run_models = lambda frame, camera_id=None: [
+        {"bbox": list(PERSON_IN_ZONE), "confidence": 0.9, "pose_analysis": {"is_falling": False}}]
+    return detector
+
+
+def envelope(seq, camera_id, age=0.05):
+    return FrameEnvelope(frame=np.zeros((480, 640, 3), dtype=np.uint8), capture_ts=time.monotonic() - age,
+                         seq=seq, camera_id=camera_id)
+
+
+def test_frame_meta_reaches_actions_log_event_and_command_latency():
+    captured = envelope(42, "cam0")
+    detection_result = make_detector().detect(captured)
+    frame_meta = detection_result["frame_meta"]
+    assert frame_meta == {"seq": 42, "camera_id": "cam0", "capture_ts": captured.capture_ts, "shape": [480, 640, 3],
+                          "duplicate": False, "frozen_for": 0.0, "stale": False}
+    assert detection_result["danger_zone_alerts"]
+
+    logic_result = LogicFacade().process(detection_result, sensor_data={}, current_mode="AUTOMATIC",
+                                         current_conveyor_status=True, current_conveyor_speed=100)
+    actions = logic_result["actions"]
+    assert logic_result["frame_meta"] is frame_meta
+    assert {"REDUCE_SPEED_50", "TRIGGER_ALARM_HIGH"} <= {action["type"] for action in actions}
+    assert all(action["frame_meta"] is frame_meta for action in actions)
+
+    # 비전 워커가 LOG_ 액션에 첨부하는 이벤트 정보
+    log_frame = frame_event_details(logic_result["frame_meta"], now=captured.capture_ts + 0.1234)
+    assert log_frame == {**frame_meta, "latency_ms": 123.4}
+    assert frame_event_details(None) is None
+
+    control = ControlFacade(communicator=FakeCommunicator(), mock_mode=True)
+    control.power_controller.power_on()
+    control.speed_controller.set_speed(100)
+    control.execute_actions([a for a in actions if a["type"] in ("REDUCE_SPEED_50", "TRIGGER_ALARM_HIGH")])
+    command_latency = control.last_command_latency
+    assert (command_latency["seq"], command_latency["camera_id"]) == (42, "cam0")
+    assert command_latency["action"] in ("REDUCE_SPEED_50", "TRIGGER_ALARM_HIGH")
+    assert command_latency["latency_ms"] >= 50
+
+
+def test_multi_camera_result_reports_earliest_capture():
+    frames = {"cam0": envelope(7, "cam0", age=0.02), "cam1": envelope(3, "cam1", age=0.08)}
+    detection_result = make_detector().detect_cameras(frames)
+    assert (detection_result["frame_meta"]["seq"], detection_result["frame_meta"]["camera_id"]) == (3, "cam1")
+
+
+def test_latency_ms_without_capture_info():
+    assert latency_ms(None) is None
+    assert latency_ms({"seq": 1}) is None
+    assert latency_ms({"capture_ts": 10.0}, now=10.25) == 250.0
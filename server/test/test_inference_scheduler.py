@@ -0,0 +1,63 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from logic.inference_scheduler import InferenceRateScheduler
+
+EMPTY = {"persons": []}
+PERSONS = {"persons": [{"bbox": (0, 0, 10, 10)}]}
+IN_ZONE = {"persons": [{"bbox": (0, 0, 10, 10)}], "danger_zone_alerts": [{"zone_id": "z1"}]}
+
+
+@pytest.fixture
+def scheduler_at():
+    """시작 직후의 ACTIVE 유지 시간이 지난 시각을 기준(t0)으로 스케줄러를 만듭니다."""
+    scheduler = InferenceRateScheduler(idle_fps=3.0, persons_fps=8.0, max_fps=15.0, hold_time=2.0)
+    t0 = time.monotonic() + 10.0
+    scheduler.update(EMPTY, now=t0)
+    return scheduler, t0
+
+
+def test_starts_active_and_settles_to_idle(scheduler_at):
+    assert InferenceRateScheduler().level == "ACTIVE"
+    scheduler, _ = scheduler_at
+    assert scheduler.level == "IDLE"
+    assert scheduler.frame_interval == pytest.approx(1 / 3.0)
+
+
+def test_rate_rises_immediately(scheduler_at):
+    scheduler, t0 = scheduler_at
+    assert scheduler.update(PERSONS, now=t0 + 0.1) == 8.0
+    assert scheduler.update(IN_ZONE, now=t0 + 0.2) == 15.0
+    assert scheduler.get_status() == {"inference_level": "ACTIVE", "inference_fps": 15.0}
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"detection_result": {"persons": [], "near_zone": True}},
+    {"detection_result": EMPTY, "risk_level": "CRITICAL"},
+    {"detection_result": EMPTY, "risk_level": "STALE_FEED"},
+    {"detection_result": EMPTY, "mode": "MAINTENANCE"},
+])
+def test_active_triggers(scheduler_at, kwargs):
+    scheduler, t0 = scheduler_at
+    assert scheduler.update(now=t0 + 0.1, **kwargs) == 15.0
+
+
+def test_rate_falls_only_after_hold_time(scheduler_at):
+    scheduler, t0 = scheduler_at
+    scheduler.update(IN_ZONE, now=t0)
+    assert scheduler.update(EMPTY, now=t0 + 1.9) == 15.0
+    assert scheduler.update(EMPTY, now=t0 + 2.1) == 3.0
+
+
+def test_rate_falls_to_highest_level_seen_within_hold_time(scheduler_at):
+    scheduler, t0 = scheduler_at
+    scheduler.update(IN_ZONE, now=t0)
+    scheduler.update(PERSONS, now=t0 + 1.5)
+    assert scheduler.update(EMPTY, now=t0 + 2.5) == 8.0
+    assert scheduler.update(EMPTY, now=t0 + 3.6) == 3.0
+    assert scheduler.level_changes == 4  # 시작 ACTIVE→IDLE, IDLE→ACTIVE, ACTIVE→PERSONS, PERSONS→IDLE
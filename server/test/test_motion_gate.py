@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from detect.motion_gate import MotionGate
+
+
+def blank(value=0):
+    return np.full((480, 640, 3), value, dtype=np.uint8)
+
+
+def with_square(x, y, size=60):
+    frame = blank()
+    frame[y:y + size, x:x + size] = 255
+    return frame
+
+
+def test_reference_moves_only_after_mark_inferred():
+    gate = MotionGate(max_skip_interval=10.0)
+    assert gate.should_infer(blank(), now=0.0)
+    gate.mark_inferred(blank(), now=0.0)
+    moved = with_square(100, 100)
+    assert gate.should_infer(moved, now=0.1)
+    # 추론하지 않았으므로 같은 변화가 계속 감지되어야 함
+    assert gate.should_infer(moved, now=0.2)
+    gate.mark_inferred(moved, now=0.2)
+    assert not gate.should_infer(moved, now=0.3)
+
+
+def test_max_skip_interval_counts_from_last_real_inference():
+    gate = MotionGate(max_skip_interval=0.5)
+    gate.should_infer(blank(), now=0.0)
+    gate.mark_inferred(blank(), now=0.0)
+    # 게이트가 추론을 허용했지만 호출자가 모델을 실행하지 않은 프레임은 시계를 다시 시작하지 않음
+    assert gate.should_infer(with_square(100, 100), now=0.3)
+    assert not gate.should_infer(blank(), now=0.4)
+    assert gate.should_infer(blank(), now=0.5)
+    assert gate.overdue
+
+
+def test_motion_in_rects_reports_where_the_change_is():
+    gate = MotionGate(max_skip_interval=10.0)
+    gate.should_infer(blank(), now=0.0)
+    gate.mark_inferred(blank(), now=0.0)
+    assert gate.should_infer(with_square(500, 380), now=0.1)
+    assert gate.motion_in_rects([(480, 360, 100, 100)], (640, 480))
+    assert not gate.motion_in_rects([(0, 0, 100, 100)], (640, 480))
+    assert gate.motion_in_rects([(0, 0, 100, 100)], (640, 480), margin=420)
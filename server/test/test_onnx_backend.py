@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+pytest.importorskip("torch")
+
+from detect.box_utils import boxes_to_array
+from detect.onnx_backend import OnnxYoloModel, letterbox
+
+# 1280x720 프레임을 640x640 입력으로 레터박스: 배율 0.5, 상하 여백 140
+FRAME = np.zeros((720, 1280, 3), dtype=np.uint8)
+RATIO, PAD = 0.5, (0.0, 140.0)
+
+
+def yolo_output(anchors, num_classes=2):
+    """(cx, cy, w, h, 클래스, 점수) 목록으로 YOLOv8 형식 출력 (4 + nc, 앵커 수)을 만듭니다."""
+    output = np.zeros((4 + num_classes, len(anchors)), dtype=np.float32)
+    for i, (cx, cy, w, h, class_id, score) in enumerate(anchors):
+        output[:4, i] = cx, cy, w, h
+        output[4 + class_id, i] = score
+    return output
+
+
+ANCHORS = [
+    (100, 240, 40, 80, 0, 0.9),   # 프레임 좌표 (160, 120, 240, 280)
+    (102, 241, 40, 80, 0, 0.8),   # 같은 클래스의 중복 → NMS로 제거
+    (100, 240, 40, 80, 1, 0.85),  # 같은 위치의 다른 클래스 → 유지
+    (300, 300, 20, 20, 0, 0.1),   # 신뢰도 미달
+    (630, 150, 40, 40, 1, 0.7),   # 오른쪽/위쪽이 원본 밖 → 잘라냄
+]
+
+
+def make_model(fixed_batch=None, fixed_shape=(640, 640)):
+    model = OnnxYoloModel.__new__(OnnxYoloModel)
+    model.input_name = "images"
+    model.fixed_shape = fixed_shape
+    model.fixed_batch = fixed_batch
+    model.default_imgsz = 640
+    model.names = {0: "person", 1: "Fall-Detected"}
+    model.stride = 32
+    return model
+
+
+def test_letterbox_scales_and_pads_symmetrically():
+    image, ratio, pad = letterbox(FRAME, (640, 640))
+    assert image.shape == (640, 640, 3)
+    assert (ratio, pad) == (RATIO, PAD)
+    assert (image[:140] == 114).all() and (image[500:] == 114).all() and (image[140:500] == 0).all()
+    # auto=True는 stride 배수가 되는 최소 여백만 채움 (상하 여백 280 % 32 = 24)
+    image, _, pad = letterbox(FRAME, (640, 640), auto=True)
+    assert image.shape == (384, 640, 3) and pad == (0.0, 12.0)
+
+
+def test_postprocess_recovers_frame_boxes_with_per_class_nms():
+    detections = make_model()._postprocess(yolo_output(ANCHORS), 0.25, 0.7, None, RATIO, PAD, FRAME.shape[:2])
+    np.testing.assert_allclose(detections, [
+        [160, 120, 240, 280, 0.9, 0],
+        [160, 120, 240, 280, 0.85, 1],
+        [1220, 0, 1280, 60, 0.7, 1],
+    ], rtol=1e-6)
+    assert detections.dtype == np.float32
+
+
+def test_postprocess_class_filter_and_empty_result():
+    model = make_model()
+    detections = model._postprocess(yolo_output(ANCHORS), 0.25, 0.7, [1], RATIO, PAD, FRAME.shape[:2])
+    assert detections[:, 5].tolist() == [1, 1]
+    empty = model._postprocess(yolo_output(ANCHORS), 0.95, 0.7, None, RATIO, PAD, FRAME.shape[:2])
+    assert empty.shape == (0, 6)
+
+
+class FakeSession:
+    """입력 배치의 이미지마다 같은 YOLO 출력을 돌려주고, 호출별 배치 크기를 기록합니다."""
+
+    def __init__(self, output):
+        self.output = output
+        self.batch_sizes = []
+
+    def run(self, _, feeds):
+        batch = feeds["images"]
+        assert batch.shape[1:] == (3, 640, 640)
+        self.batch_sizes.append(len(batch))
+        return [np.repeat(self.output[None], len(batch), axis=0)]
+
+
+@pytest.mark.parametrize("fixed_batch, expected_calls", [(1, [1, 1]), (None, [2])])
+def test_predict_maps_each_image_with_its_own_letterbox(fixed_batch, expected_calls):
+    model = make_model(fixed_batch=fixed_batch)
+    model.session = FakeSession(yolo_output(ANCHORS[:1]))
+    square = np.zeros((640, 640, 3), dtype=np.uint8)
+    results = model.predict([FRAME, square], conf=0.25)
+
+    assert model.session.batch_sizes == expected_calls
+    assert [result.orig_shape for result in results] == [(720, 1280), (640, 640)]
+    np.testing.assert_allclose(boxes_to_array(results[0].boxes), [[160, 120, 240, 280, 0.9, 0]], rtol=1e-6)
+    np.testing.assert_allclose(boxes_to_array(results[1].boxes), [[80, 200, 120, 280, 0.9, 0]], rtol=1e-6)
+    assert model.predict([]) == []
@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+torch = pytest.importorskip("torch")
+
+from detect.onnx_backend import OnnxBoxes, OnnxResults
+from detect.person_detector import PersonDetector
+
+ROWS = [[10.7, 20.2, 50.9, 80.5, 0.87, 0], [300.2, 40.9, 360.1, 200.6, 0.41, 0], [0, 0, 1, 1, 0.3333, 0]]
+
+
+class FakeModel:
+    names = {0: "person"}
+
+    def __init__(self, results):
+        self.results = results
+
+    def predict(self, **kwargs):
+        return self.results
+
+
+def result(rows):
+    return OnnxResults(OnnxBoxes(torch.tensor(np.asarray(rows, dtype=np.float32).reshape(-1, 6))), FakeModel.names, (480, 640))
+
+
+def make_detector(results):
+    detector = PersonDetector.__new__(PersonDetector)
+    detector.model = FakeModel(results)
+    detector.conf_threshold = 0.3
+    detector.person_class_id = 0
+    detector.device = None
+    return detector
+
+
+def legacy_persons(results):
+    """박스별로 텐서에 접근하던 이전 추출 방식."""
+    persons = []
+    if results and results[0].boxes is not None:
+        for box in results[0].boxes:
+            conf = float(box.conf[0].item())
+            x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
+            persons.append({"bbox": [x1, y1, x2, y2], "confidence": conf})
+    return persons
+
+
+@pytest.mark.parametrize("results", [[result(ROWS)], [result([])], []], ids=["boxes", "no_boxes", "no_result"])
+def test_person_records_match_per_box_extraction(results):
+    persons = make_detector(results).detect(np.zeros((480, 640, 3), dtype=np.uint8))
+    assert persons == legacy_persons(results)
+    for person in persons:
+        assert all(type(v) is int for v in person["bbox"]) and type(person["confidence"]) is float
+
+
+def test_result_without_boxes_gives_no_persons():
+    empty = result([])
+    empty.boxes = None
+    assert make_detector([empty]).detect(np.zeros((480, 640, 3), dtype=np.uint8)) == []
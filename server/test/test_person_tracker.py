@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from detect.person_tracker import PersonTracker
+
+FRAME_SIZE = (640, 480)
+
+
+def person(x, y, w=60, h=160):
+    return {"bbox": [x, y, x + w, y + h], "confidence": 0.9, "pose_analysis": {"is_falling": False}}
+
+
+def test_track_ids_persist_while_moving():
+    tracker = PersonTracker(detect_interval=1)
+    first = tracker.update([person(100, 100), person(400, 100)], now=0.0)
+    second = tracker.update([person(405, 102), person(104, 101)], now=0.1)
+    assert [p["track_id"] for p in first] == [1, 2]
+    assert [p["track_id"] for p in second] == [2, 1]
+
+
+def test_detects_every_interval_and_predicts_between():
+    tracker = PersonTracker(detect_interval=3, max_detection_gap=10.0)
+    decisions = []
+    for frame in range(7):
+        now = frame * 0.05
+        detect = tracker.should_detect([], now)
+        decisions.append(detect)
+        if detect:
+            tracker.update([person(100 + frame * 5, 100)], now)
+        else:
+            predicted = tracker.predict(FRAME_SIZE, now)
+            assert predicted and predicted[0]["predicted"]
+    assert decisions == [True, False, False, True, False, False, True]
+
+
+def test_max_detection_gap_bounds_prediction_time():
+    tracker = PersonTracker(detect_interval=100, max_detection_gap=0.5)
+    assert tracker.should_detect([], 0.0)
+    tracker.update([person(100, 100)], 0.0)
+    assert not tracker.should_detect([], 0.4)
+    tracker.predict(FRAME_SIZE, 0.4)
+    assert tracker.should_detect([], 0.5)
+
+
+def test_skipped_frames_count_toward_detect_interval():
+    tracker = PersonTracker(detect_interval=3, max_detection_gap=10.0)
+    tracker.should_detect([], 0.0)
+    tracker.update([person(100, 100)], 0.0)
+    tracker.skip_frame(0.05)
+    tracker.skip_frame(0.1)
+    assert tracker.should_detect([], 0.15)
+
+
+def test_track_near_zone_and_forced_detection():
+    tracker = PersonTracker(detect_interval=100, max_detection_gap=10.0, zone_margin=20)
+    tracker.should_detect([], 0.0)
+    tracker.update([person(100, 100)], 0.0)
+    assert not tracker.should_detect([(400, 100, 100, 100)], 0.05)
+    assert tracker.should_detect([(170, 100, 100, 100)], 0.1)
+    assert tracker.should_detect([], 0.15, force=True)
+    assert tracker.get_stats()["forced_by_caller"] == 1
@@ -0,0 +1,170 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+torch = pytest.importorskip("torch")
+
+from detect import pose_detector
+from detect.onnx_backend import OnnxBoxes, OnnxResults
+from detect.pose_detector import PoseDetector, crop_person_regions
+
+FALL_CLASS = 0
+
+
+class _Array:
+    def __init__(self, data):
+        self._data = np.asarray(data, dtype=np.float32).reshape(-1, 6)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self._data
+
+
+class _Boxes:
+    def __init__(self, rows):
+        self.data = _Array(rows)
+
+    def __len__(self):
+        return len(self.data.numpy())
+
+
+class _Result:
+    def __init__(self, rows):
+        self.boxes = _Boxes(rows)
+
+
+class FakeFallModel:
+    """프레임 좌표의 넘어짐 bbox 목록을 받아, 입력(프레임 또는 크롭)에 보이는 부분을 입력 좌표로 돌려주는 가짜 모델."""
+
+    def __init__(self, frame, falls):
+        self.frame = frame
+        self.falls = falls
+
+    def _boxes_in(self, image):
+        if image is self.frame:
+            ox, oy = 0, 0
+        else:
+            # 크롭은 원본 프레임의 뷰이므로 메모리 위치로 좌상단 좌표를 구함
+            offset = (image.__array_interface__["data"][0] - self.frame.__array_interface__["data"][0]) // self.frame.itemsize
+            oy, ox = divmod(offset // self.frame.shape[2], self.frame.shape[1])
+        h, w = image.shape[:2]
+        rows = []
+        for x1, y1, x2, y2 in self.falls:
+            cx1, cy1 = max(x1 - ox, 0), max(y1 - oy, 0)
+            cx2, cy2 = min(x2 - ox, w), min(y2 - oy, h)
+            if cx2 > cx1 and cy2 > cy1:
+                rows.append([cx1, cy1, cx2, cy2, 0.9, FALL_CLASS])
+        return _Result(rows)
+
+    def predict(self, source, **kwargs):
+        images = source if isinstance(source, list) else [source]
+        return [self._boxes_in(image) for image in images]
+
+
+def make_detector(frame, falls, inference_mode, match_strategy="greedy"):
+    detector = PoseDetector.__new__(PoseDetector)
+    detector.inference_mode = inference_mode
+    detector.match_strategy = match_strategy
+    detector.fall_iou_threshold = 0.5
+    detector.crop_padding = 0.15
+    detector.crop_imgsz = 320
+    detector.conf_threshold = 0.4
+    detector.device = None
+    detector.fall_class_ids = [FALL_CLASS]
+    detector.fall_model = FakeFallModel(frame, falls)
+    return detector
+
+
+def persons(*bboxes):
+    return [{"bbox": list(bbox), "confidence": 0.9} for bbox in bboxes]
+
+
+FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+# 누워 있는 사람 A와, A 위로 몸을 숙여 bbox가 크게 겹치는 사람 B
+LYING = (100, 300, 300, 380)
+LEANING = (120, 290, 300, 390)
+
+
+@pytest.mark.parametrize("mode", ["full_frame", "crops"])
+def test_only_the_lying_person_is_falling(mode):
+    # 'crops'에서는 B의 크롭에도 A의 넘어짐 전체가 보이므로, 중복 bbox를 합치지 않으면 B도 넘어짐으로 배정됨
+    detector = make_detector(FRAME, [LYING], mode)
+    result = detector.detect(FRAME, persons(LYING, LEANING))
+    assert [p["pose_analysis"]["is_falling"] for p in result] == [True, False]
+
+
+def test_overlapping_crops_report_each_fall_once():
+    detector = make_detector(FRAME, [LYING], "crops")
+    fall_bboxes = detector._detect_falls_in_crops(FRAME, persons(LYING, LEANING))
+    assert [box.tolist() for box in fall_bboxes] == [list(LYING)]
+
+
+def test_greedy_matching_gives_one_fall_box_to_one_person():
+    detector = make_detector(FRAME, [], "full_frame")
+    person_bboxes = np.array([LYING, LEANING])
+    fall_bboxes = [np.array(LYING)]
+    assert detector._match_fall_bboxes(person_bboxes, fall_bboxes).tolist() == [True, False]
+    detector.match_strategy = "any"
+    assert detector._match_fall_bboxes(person_bboxes, fall_bboxes).tolist() == [True, True]
+
+
+def test_each_fall_box_goes_to_its_best_matching_person():
+    detector = make_detector(FRAME, [], "full_frame")
+    far = (400, 300, 600, 380)
+    person_bboxes = np.array([LYING, far, (400, 100, 440, 250)])
+    fall_bboxes = [np.array(far), np.array(LYING)]
+    assert detector._match_fall_bboxes(person_bboxes, fall_bboxes).tolist() == [True, True, False]
+
+
+def test_fall_match_requires_iou_above_threshold():
+    detector = make_detector(FRAME, [], "full_frame")
+    person_bboxes = np.array([(0, 0, 100, 100)])
+    # IoU가 정확히 임계값(0.5)인 넘어짐 bbox는 인정하지 않음
+    assert detector._match_fall_bboxes(person_bboxes, [np.array((0, 0, 50, 100))]).tolist() == [False]
+    assert detector._match_fall_bboxes(person_bboxes, [np.array((0, 0, 51, 100))]).tolist() == [True]
+    assert detector._match_fall_bboxes(np.zeros((0, 4)), [np.array((0, 0, 51, 100))]).tolist() == []
+
+
+# --- 넘어짐 bbox 추출 ---
+
+FALL_NAMES = {0: "Fall-Detected", 1: "Normal", 2: "Fall-Detected"}
+
+
+class NamedModel:
+    names = FALL_NAMES
+
+
+def test_fall_class_ids_are_resolved_once_at_load(monkeypatch):
+    monkeypatch.setattr(pose_detector, "load_yolo_model", lambda *args, **kwargs: NamedModel())
+    assert PoseDetector(fall_model_path="fake.pt").fall_class_ids == [0, 2]
+
+
+def legacy_fall_bboxes(result, names, offset):
+    """박스마다 클래스 이름을 조회하던 이전 추출 방식."""
+    fall_bboxes = []
+    if result.boxes:
+        ox, oy = offset
+        for box in result.boxes:
+            if names[int(box.cls)] == "Fall-Detected":
+                fall_bboxes.append(box.xyxy[0].cpu().numpy().astype(int) + np.array([ox, oy, ox, oy]))
+    return fall_bboxes
+
+
+@pytest.mark.parametrize("rows", [
+    [[10.7, 20.2, 50.9, 80.5, 0.9, 0], [5, 5, 30, 30, 0.8, 1], [100.5, 60.1, 220.9, 99.9, 0.7, 2]],
+    [],
+], ids=["boxes", "empty"])
+def test_fall_bboxes_match_per_box_extraction(rows):
+    detector = make_detector(FRAME, [], "full_frame")
+    detector.fall_class_ids = [0, 2]
+    result = OnnxResults(OnnxBoxes(torch.tensor(np.asarray(rows, dtype=np.float32).reshape(-1, 6))), FALL_NAMES, (480, 640))
+    for offset in ((0, 0), (40, 15)):
+        actual = detector._extract_fall_bboxes(result, offset)
+        expected = legacy_fall_bboxes(result, FALL_NAMES, offset)
+        assert [box.tolist() for box in actual] == [box.tolist() for box in expected]
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from input_adapter.input_facade import InputAdapter
+from input_adapter.preprocess import FusedPreprocessPipeline, VideoPreprocessor
+
+
+def random_frame(shape=(120, 160, 3), dtype=np.uint8, seed=0):
+    rng = np.random.default_rng(seed)
+    if dtype == np.uint8:
+        return rng.integers(0, 256, size=shape, dtype=np.uint8)
+    return rng.random(shape).astype(dtype)
+
+
+@pytest.mark.parametrize("normalize", [True, False])
+@pytest.mark.parametrize("apply_noise_reduction", [True, False])
+def test_fused_output_matches_process_frame(normalize, apply_noise_reduction):
+    options = dict(target_size=(64, 48), normalize=normalize, apply_noise_reduction=apply_noise_reduction)
+    baseline = VideoPreprocessor(**options)
+    fused = VideoPreprocessor(fused=True, **options)
+    frame = random_frame()
+
+    expected = baseline.process_frame(frame)
+    result = fused.process_frame(frame)
+
+    assert result.shape == expected.shape == (48, 64, 3)
+    assert result.dtype == expected.dtype == (np.float32 if normalize else np.uint8)
+    np.testing.assert_allclose(result, expected, rtol=1e-6, atol=1e-7)
+    # 입력 프레임은 변경되지 않음
+    np.testing.assert_array_equal(frame, random_frame())
+
+
+def test_fused_matches_for_float_input_without_normalizing_again():
+    baseline = VideoPreprocessor(target_size=(64, 48))
+    fused = VideoPreprocessor(target_size=(64, 48), fused=True)
+    frame = random_frame(dtype=np.float32)
+    np.testing.assert_allclose(fused.process_frame(frame), baseline.process_frame(frame), rtol=1e-6, atol=1e-7)
+
+
+def test_buffers_are_reused_for_same_input_shape():
+    pipeline = FusedPreprocessPipeline((64, 48))
+    first = pipeline(random_frame(seed=1))
+    buffers = (pipeline._blur_buffer, pipeline._resize_buffer, pipeline._output_buffer)
+
+    second = pipeline(random_frame(seed=2))
+    assert second is first
+    assert all(a is b for a, b in zip((pipeline._blur_buffer, pipeline._resize_buffer, pipeline._output_buffer), buffers))
+    # 반환 배열은 다음 호출의 결과로 덮어써짐
+    np.testing.assert_allclose(first, VideoPreprocessor(target_size=(64, 48)).process_frame(random_frame(seed=2)),
+                               rtol=1e-6, atol=1e-7)
+
+
+def test_buffers_are_reallocated_when_shape_or_dtype_changes():
+    pipeline = FusedPreprocessPipeline((64, 48))
+    first = pipeline(random_frame(shape=(120, 160, 3)))
+    first_blur = pipeline._blur_buffer
+
+    resized = pipeline(random_frame(shape=(90, 200, 3)))
+    assert pipeline._blur_buffer is not first_blur
+    assert pipeline._blur_buffer.shape == (90, 200, 3)
+    assert resized.shape == (48, 64, 3)
+    assert pipeline._input_shape == ((90, 200, 3), np.uint8)
+
+    gray = pipeline(random_frame(shape=(90, 200)))
+    assert gray.shape == (48, 64)
+    assert pipeline._blur_buffer.shape == (90, 200)
+
+    float_input = pipeline(random_frame(shape=(90, 200), dtype=np.float32))
+    assert pipeline._input_shape == ((90, 200), np.float32)
+    assert pipeline._output_buffer is None  # 이미 실수형인 입력은 다시 정규화하지 않음
+    assert float_input is pipeline._resize_buffer
+    assert float_input.dtype == np.float32
+    assert first is not resized
+
+
+def test_input_adapter_enables_fused_preprocess_from_config():
+    adapter = InputAdapter({"mock_mode": True, "fused_preprocess": True})
+    try:
+        assert adapter.preprocessor.fused
+        first = adapter.get_input()["frame"]
+        second = adapter.get_input()["frame"]
+        assert second is first
+        assert first.shape == (640, 640, 3) and first.dtype == np.float32
+    finally:
+        adapter.release()
+
+    adapter = InputAdapter({"mock_mode": True})
+    try:
+        assert not adapter.preprocessor.fused
+    finally:
+        adapter.release()
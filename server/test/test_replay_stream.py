@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from input_adapter.replay import ReplayStream
+
+
+def write_images(directory, values):
+    for i, value in enumerate(values):
+        cv2.imwrite(str(directory / f"frame_{i:03d}.png"), np.full((24, 32, 3), value, dtype=np.uint8))
+
+
+def play(stream):
+    frames = []
+    while True:
+        frame = stream.get_frame()
+        if frame is None:
+            return frames
+        frames.append(int(frame[0, 0, 0]))
+
+
+def test_unreadable_image_is_skipped_not_end_of_playback(tmp_path):
+    write_images(tmp_path, [10, 20, 30])
+    (tmp_path / "frame_001.png").write_bytes(b"not an image")
+    with ReplayStream(tmp_path, pacing="fast") as stream:
+        assert play(stream) == [10, 30]
+        assert stream.frames_skipped == 1
+        assert stream.get_camera_info()["frames_served"] == 2
+
+
+def test_image_sequence_replay_is_deterministic(tmp_path):
+    write_images(tmp_path, [5, 15, 25, 35])
+    with ReplayStream(tmp_path, pacing="fast") as first, ReplayStream(tmp_path, pacing="fast") as second:
+        assert play(first) == play(second) == [5, 15, 25, 35]
+
+
+def test_looped_video_repeats_the_same_frames(tmp_path):
+    path = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (32, 24))
+    for value in [40, 120, 200]:
+        writer.write(np.full((24, 32, 3), value, dtype=np.uint8))
+    writer.release()
+
+    with ReplayStream(path, pacing="fast", loop=True) as stream:
+        frames = [stream.get_frame() for _ in range(6)]
+    assert stream.loop_count == 1
+    for a, b in zip(frames[:3], frames[3:]):
+        assert np.array_equal(a, b)
@@ -0,0 +1,67 @@
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from input_adapter.sensor import SensorReader
+from input_adapter.sensor_history import SensorRingBuffer
+
+
+def test_window_stats_over_recent_seconds():
+    buffer = SensorRingBuffer(10)
+    for t, value in enumerate([1.0, 5.0, 2.0, 8.0, 3.0]):
+        buffer.append(100.0 + t, value, value > 4)
+    stats = buffer.window_stats(2.5, threshold=2.5, now=104.5)
+    assert stats["count"] == 3  # t=102, 103, 104
+    assert (stats["min"], stats["max"], stats["mean"]) == (2.0, 8.0, pytest.approx(13 / 3))
+    assert stats["alert_count"] == 1
+    # 8.0(102~103초 사이 1초) + 3.0(104~104.5초 사이 0.5초)
+    assert stats["time_above_threshold"] == pytest.approx(1.5)
+
+
+def test_oldest_samples_are_overwritten_in_order():
+    buffer = SensorRingBuffer(3)
+    for t in range(5):
+        buffer.append(float(t), float(t), False)
+    assert len(buffer) == 3
+    assert buffer.last(10)["timestamps"].tolist() == [2.0, 3.0, 4.0]
+    assert [record["value"] for record in buffer.to_records(2)] == [3.0, 4.0]
+
+
+def test_capacity_covers_the_configured_window():
+    assert SensorRingBuffer.capacity_for(60.0, 0.02) == 3001
+    sensor = SensorReader(sensor_types=["touch"], history_seconds=10.0, sample_interval=0.02)
+    buffer = sensor.history["touch"]
+    for i in range(2000):
+        buffer.append(i * 0.02, 1.0, False)
+    # 10초 구간 전체가 버퍼에 남아 있어야 함 (기존 100개 버퍼는 약 2초만 보관)
+    assert buffer.window_stats(9.99, now=1999 * 0.02)["count"] == 500
+    with pytest.raises(ValueError):
+        SensorRingBuffer.capacity_for(10.0, 0)
+
+
+def test_reads_are_consistent_while_a_sampler_appends():
+    buffer = SensorRingBuffer(64)
+    stop = threading.Event()
+
+    def sampler():
+        t = 0.0
+        while not stop.is_set():
+            t += 1.0
+            buffer.append(t, t, False)
+
+    thread = threading.Thread(target=sampler)
+    thread.start()
+    try:
+        for _ in range(2000):
+            window = buffer.window(1e9, now=1e9)
+            # 샘플마다 값 = 타임스탬프이고 오래된 순서이므로, 쓰는 도중의 샘플이 섞이면 깨짐
+            assert np.array_equal(window["timestamps"], window["values"])
+            assert np.all(np.diff(window["timestamps"]) == 1.0)
+    finally:
+        stop.set()
+        thread.join()
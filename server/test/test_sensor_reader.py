@@ -0,0 +1,78 @@
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from input_adapter.input_facade import _create_sensor_reader
+
+
+class FakeGPIO:
+    """RPi.GPIO 대신 핀 값과 등록된 에지 콜백을 기억하는 가짜 모듈."""
+    BCM, IN, PUD_UP, BOTH = "BCM", "IN", "PUD_UP", "BOTH"
+
+    def __init__(self):
+        self.level = 0
+        self.callbacks = {}
+
+    def setmode(self, mode):
+        pass
+
+    def setup(self, pin, direction, pull_up_down=None):
+        pass
+
+    def input(self, pin):
+        return self.level
+
+    def add_event_detect(self, pin, edge, callback, bouncetime):
+        self.callbacks[pin] = callback
+
+    def remove_event_detect(self, pin):
+        self.callbacks.pop(pin, None)
+
+
+@pytest.fixture
+def gpio(monkeypatch):
+    fake = FakeGPIO()
+    package = types.ModuleType("RPi")
+    module = types.ModuleType("RPi.GPIO")
+    for name in dir(fake):
+        if not name.startswith("_"):
+            setattr(module, name, getattr(fake, name))
+    package.GPIO = module
+    monkeypatch.setitem(sys.modules, "RPi", package)
+    monkeypatch.setitem(sys.modules, "RPi.GPIO", module)
+    return fake
+
+
+def test_real_touch_sensor_uses_edge_callback(gpio):
+    sensor = _create_sensor_reader({"sensor_mock_mode": False, "sensor_pin": 17, "sensor_types": ["touch"]})
+    alerts = []
+    sensor.add_alert_listener(lambda sensor_type, is_alert, data: alerts.append((sensor_type, is_alert)))
+    sensor.start_event_driven()
+    try:
+        assert not sensor.mock_mode
+        assert 17 in gpio.callbacks
+        assert sensor._sampler_thread is None
+
+        gpio.level = 1
+        gpio.callbacks[17](17)
+        assert alerts == [("touch", True)]
+        assert sensor.read()["sensors"]["touch"]["value"] == 1
+    finally:
+        sensor.stop_event_driven()
+    assert 17 not in gpio.callbacks
+
+
+def test_real_mode_without_pin_falls_back_to_mock():
+    sensor = _create_sensor_reader({"sensor_mock_mode": False, "sensor_types": ["touch"]})
+    assert sensor.mock_mode
+    assert list(sensor.read()["sensors"]) == ["touch"]
+
+
+def test_default_config_is_mock_with_all_sensor_types():
+    sensor = _create_sensor_reader({})
+    assert sensor.mock_mode
+    assert sensor.sensor_types == ["touch", "distance", "temperature", "humidity"]
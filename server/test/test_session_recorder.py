@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from core.frame_envelope import FrameEnvelope
+from input_adapter.session import SessionPlayer, SessionRecorder
+
+
+def envelope(seq, camera_id=None):
+    frame = np.full((120, 160, 3), seq * 20 % 256, dtype=np.uint8)
+    return FrameEnvelope(frame=frame, capture_ts=100.0 + seq * 0.1, seq=seq, camera_id=camera_id)
+
+
+def test_same_seq_is_recorded_once(tmp_path):
+    recorder = SessionRecorder(tmp_path, max_duration=None)
+    first = envelope(1)
+    assert recorder.record_frame(first)
+    assert not recorder.record_frame(first)
+    assert recorder.record_frame(envelope(2))
+    recorder.record_status({"risk_level": "SAFE"}, t=100.25)
+    session_path = recorder.close()
+
+    with SessionPlayer(session_path, pacing="fast") as player:
+        assert [event["seq"] for event in player.frame_events["default"]] == [1, 2]
+        assert player.status_at(100.3) == {"risk_level": "SAFE"}
+        stream = player.stream()
+        assert stream.get_frame() is not None and stream.get_frame() is not None
+        assert stream.get_frame() is None
+
+
+def test_record_frame_does_not_wait_for_encoding(tmp_path):
+    recorder = SessionRecorder(tmp_path, max_duration=None, max_pending_frames=2)
+    # 기록 스레드가 인코딩 중인 상황: 기록 잠금을 잡고 있어도 record_frame은 막히지 않고, 대기 한도를 넘는 프레임은 버림
+    with recorder._lock:
+        accepted = [recorder.record_frame(envelope(seq)) for seq in range(1, 6)]
+    assert accepted == [True, True, False, False, False]
+    assert recorder.frames_dropped == 3
+    session_path = recorder.close()
+
+    with SessionPlayer(session_path, pacing="fast") as player:
+        assert [event["seq"] for event in player.frame_events["default"]] == [1, 2]
+
+
+def test_close_is_idempotent(tmp_path):
+    recorder = SessionRecorder(tmp_path)
+    recorder.record_frame(envelope(1))
+    assert recorder.close() is not None
+    assert recorder.close() is None
+    assert not recorder.record_frame(envelope(2))
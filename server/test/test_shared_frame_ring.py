@@ -0,0 +1,79 @@
+import multiprocessing as mp
+import subprocess
+import sys
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from core.shared_frame_ring import SharedFrameRing
+
+SHAPE = (48, 64, 3)
+
+
+def _reader(spec, results):
+    """다른 프로세스에서 링에 연결하여 최신 프레임을 읽고, 값을 돌려준 뒤 종료합니다."""
+    ring = SharedFrameRing.attach(spec["name"], spec["shape"], dtype=spec["dtype"], slots=spec["slots"],
+                                  camera_id=spec["camera_id"])
+    envelope = ring.wait_next(0, timeout=5.0, copy=True)
+    results.put((envelope.seq, int(envelope.frame[0, 0, 0]), envelope.camera_id))
+    ring.close()
+
+
+def test_publish_and_read_across_processes_keeps_segment_alive():
+    ring = SharedFrameRing.create(SHAPE, slots=3, camera_id="cam0")
+    try:
+        ring.publish(np.full(SHAPE, 7, dtype=np.uint8), capture_ts=1.0)
+        ctx = mp.get_context("spawn")
+        results = ctx.Queue()
+        process = ctx.Process(target=_reader, args=(ring.spec(), results))
+        process.start()
+        seq, value, camera_id = results.get(timeout=30)
+        process.join(timeout=30)
+
+        assert process.exitcode == 0
+        assert (seq, value, camera_id) == (1, 7, "cam0")
+        # 읽는 프로세스가 종료되어도 생산자의 공유 메모리는 남아 있어야 합니다.
+        probe = shared_memory.SharedMemory(name=ring.name)
+        probe.close()
+        assert ring.publish(np.full(SHAPE, 8, dtype=np.uint8)) == 2
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_independent_reader_exit_does_not_unlink_segment():
+    # 생산자와 무관하게 시작된 프로세스는 자체 resource_tracker를 가지므로, 종료 시 등록된 공유 메모리를 정리합니다.
+    ring = SharedFrameRing.create(SHAPE, slots=3)
+    try:
+        ring.publish(np.full(SHAPE, 5, dtype=np.uint8))
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "from core.shared_frame_ring import SharedFrameRing\n"
+            f"ring = SharedFrameRing.attach({ring.name!r}, {SHAPE!r}, slots=3)\n"
+            "assert int(ring.read_latest(copy=True).frame[0, 0, 0]) == 5\n"
+            "ring.close()\n"
+        )
+        root = str(Path(__file__).resolve().parent.parent.parent)
+        subprocess.run([sys.executable, "-c", script, root], check=True, timeout=60)
+
+        probe = shared_memory.SharedMemory(name=ring.name)
+        probe.close()
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_overwritten_slot_is_rejected():
+    with SharedFrameRing.create(SHAPE, slots=2) as ring:
+        for value in range(1, 4):
+            ring.publish(np.full(SHAPE, value, dtype=np.uint8))
+        zero_copy = ring.read(2)
+        assert ring.read(1) is None  # 슬롯이 seq 3으로 덮어쓰임
+        assert int(ring.read(3, copy=True).frame[0, 0, 0]) == 3
+
+        ring.publish(np.full(SHAPE, 4, dtype=np.uint8))
+        assert not ring.is_valid(zero_copy)
+        assert ring.read_latest().seq == 4
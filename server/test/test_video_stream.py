@@ -0,0 +1,166 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from input_adapter import stream as stream_module
+from input_adapter.input_facade import InputAdapter
+from input_adapter.stream import VideoStream
+
+
+def write_video(path, frames=5, size=(64, 48)):
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 10.0, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), i * 40, dtype=np.uint8))
+    writer.release()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_missing_camera_starts_lost_and_reconnects(tmp_path):
+    source = tmp_path / "camera.mp4"
+    stream = VideoStream(source=str(source), reconnect=True, backoff_initial=0.05, backoff_max=0.1)
+    try:
+        assert not stream.connected
+        assert stream.get_frame() is None
+        assert stream.get_connection_status()["connected"] is False
+
+        write_video(source)
+        assert wait_for(lambda: stream.connected)
+        assert stream.get_frame() is not None
+        assert stream.reconnect_attempts >= 1
+    finally:
+        stream.release()
+
+
+def test_missing_camera_without_reconnect_raises(tmp_path):
+    with pytest.raises(RuntimeError):
+        VideoStream(source=str(tmp_path / "missing.mp4"), reconnect=False)
+
+
+class FakeCapture:
+    """cv2.VideoCapture 대역. 프레임마다 순번을 픽셀 값으로 채우고, read()를 호출한 스레드를 기록합니다."""
+
+    start_ready = True
+
+    def __init__(self, source):
+        self.source = source
+        self.opened = True
+        self.reads = 0
+        self.read_threads = set()
+        self.ready = threading.Event()  # set() 전까지 read()가 첫 프레임을 내주지 않음
+        if self.start_ready:
+            self.ready.set()
+        FakeCapture.instances.append(self)
+
+    def isOpened(self):
+        return self.opened
+
+    def set(self, prop, value):
+        return True
+
+    def get(self, prop):
+        return 0.0
+
+    def read(self):
+        self.read_threads.add(threading.get_ident())
+        if not self.ready.wait(timeout=0.01):
+            return False, None
+        self.reads += 1
+        time.sleep(0.005)
+        return True, np.full((48, 64, 3), self.reads % 256, dtype=np.uint8)
+
+    def release(self):
+        self.opened = False
+
+
+@pytest.fixture
+def fake_capture(monkeypatch):
+    monkeypatch.setattr(FakeCapture, "instances", [], raising=False)
+    monkeypatch.setattr(FakeCapture, "start_ready", True)
+    monkeypatch.setattr(stream_module.cv2, "VideoCapture", FakeCapture)
+    return FakeCapture
+
+
+def test_capture_thread_publishes_newest_frame_with_increasing_seq(fake_capture):
+    stream = VideoStream(source=0, threaded=True)
+    try:
+        capture = fake_capture.instances[0]
+        assert wait_for(lambda: stream.get_latest() is not None and stream.get_latest()[2] >= 3)
+
+        frame, first_ts, first_seq = stream.get_latest()
+        assert wait_for(lambda: stream.get_latest()[2] > first_seq + 2)
+        frame, latest_ts, latest_seq = stream.get_latest()
+        assert latest_ts > first_ts
+        # 캡처 스레드가 마지막으로 읽은 프레임이 그대로 게시됨 (버퍼에 쌓인 오래된 프레임이 아님)
+        assert int(frame[0, 0, 0]) == latest_seq % 256
+        assert latest_seq <= capture.reads
+    finally:
+        stream.release()
+    assert not capture.opened
+
+
+def test_get_latest_is_none_before_first_frame(fake_capture):
+    fake_capture.start_ready = False
+    stream = VideoStream(source=0, threaded=True)
+    try:
+        capture = fake_capture.instances[0]
+        assert wait_for(lambda: capture.read_threads)
+        assert stream.get_latest() is None
+        assert stream.get_frame() is None
+        assert stream.get_frame_with_timestamp() is None
+
+        capture.ready.set()
+        assert wait_for(lambda: stream.get_latest() is not None)
+        assert stream.get_latest()[2] >= 1
+    finally:
+        stream.release()
+
+
+def test_threaded_get_frame_never_reads_on_caller_thread(fake_capture):
+    stream = VideoStream(source=0, threaded=True)
+    try:
+        capture = fake_capture.instances[0]
+        assert wait_for(lambda: stream.get_latest() is not None)
+        for _ in range(20):
+            assert stream.get_frame() is not None
+        assert threading.get_ident() not in capture.read_threads
+        assert capture.read_threads == {stream._capture_thread.ident}
+    finally:
+        stream.release()
+
+
+def test_input_adapter_envelope_uses_capture_thread_timestamp_and_seq(fake_capture):
+    adapter = InputAdapter({"threaded_capture": True, "camera_id": "cam0"})
+    try:
+        assert adapter.stream.threaded
+        assert wait_for(lambda: adapter.stream.get_latest() is not None)
+
+        first = adapter.get_frame_envelope()
+        _, capture_ts, seq = adapter.stream.get_latest()
+        assert first.camera_id == "cam0"
+        assert first.seq <= seq and first.capture_ts <= capture_ts
+        assert first.capture_ts <= time.monotonic()
+
+        assert wait_for(lambda: adapter.stream.get_latest()[2] > first.seq)
+        second = adapter.get_frame_envelope()
+        assert second.seq > first.seq
+        assert second.capture_ts > first.capture_ts
+        # 봉투의 순번은 어댑터 자체 카운터가 아니라 캡처 스레드의 순번
+        assert adapter._frame_seq == {}
+        assert threading.get_ident() not in fake_capture.instances[0].read_threads
+    finally:
+        adapter.release()
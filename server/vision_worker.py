@@ -18,15 +18,18 @@ project_root = Path(__file__).resolve().parent
 sys.path.append(str(project_root))
 
 from config.config import get_config
-from input_adapter.input_facade import InputAdapter
+from input_adapter.input_facade import create_input_adapter
 from detect.detect_facade import Detector
 from logic.logic_facade import LogicFacade
+from logic.inference_scheduler import InferenceRateScheduler
 from control.control_facade import ControlFacade
 from server.state_manager import SystemStateManager
 from server.services.zone_service import ZoneService
 from server.models.websockets import StatusUpdateMessage
 from core.serial_communicator import SerialCommunicator
-from core.drawing_utils import put_text_korean
+from core.drawing_utils import put_text_korean, tile_frames
+from core.frame_envelope import frame_event_details
+from input_adapter.session import SessionRecorder
 
 # --------------------------------------------------------------------------
 # 컴포넌트 초기화 함수
@@ -37,7 +40,8 @@ def initialize_components(config: Dict[str, Any]):
     """
     logger.info("비전 워커 컴포넌트 초기화를 시작합니다...")
 
-    input_adapter = InputAdapter(config["input"])
+    # 'cameras' 목록이 설정되어 있으면 한 워커가 여러 카메라를 공유 모델로 처리합니다.
+    input_adapter = create_input_adapter(config["input"])
     # ZoneService는 이제 Vision Worker에서 직접 사용되지 않습니다.
     # detector = Detector(config["detection"], zone_service=zone_service)
     detector = Detector(config["detection"])
@@ -88,6 +92,36 @@ async def run_safety_system(command_queue: Queue, log_queue: Queue, frame_queue:
             log_queue.put({"type": "LOG", "data": event_data})
             logger.info("하드웨어 비상 정지 로그를 큐에 추가했습니다.")
 
+        # --- 센서 경보 이벤트 콜백 정의 ---
+        worker_loop = asyncio.get_running_loop()
+
+        def handle_sensor_alert(sensor_type: str, is_alert: bool, sensor_data: Dict[str, Any]):
+            """
+            센서 경보 전환 시 이벤트 루프에서 실행되는 핸들러.
+            탐지가 실행기에서 진행 중이어도 다음 프레임을 기다리지 않고 즉시 전원을 차단합니다.
+            """
+            if not is_alert or not state_manager.is_active():
+                return
+            reason = f"Sensor alert: {sensor_type}"
+            logger.warning(f"센서 경보 이벤트 수신: {sensor_type}. 즉시 비상 정지합니다.")
+            state_manager.lock_system(reason)
+            control_facade.execute_actions([
+                {"type": "POWER_OFF", "details": {"reason": reason}},
+                {"type": "TRIGGER_ALARM_CRITICAL", "details": {"reason": reason}}
+            ])
+            event_data = {
+                "event_type": "LOG_CRITICAL_SENSOR",
+                "details": {"description": f"An emergency signal from sensor '{sensor_type}' has been detected."},
+                "log_risk_level": "CRITICAL",
+                "operation_mode": state_manager.get_status().get("operation_mode", "UNKNOWN")
+            }
+            log_queue.put({"type": "LOG", "data": event_data})
+
+        # 센서 스레드에서 호출되므로 이벤트 루프로 넘겨 제어 계층과 같은 스레드에서 처리합니다.
+        input_adapter.set_sensor_alert_callback(
+            lambda sensor_type, is_alert, data: worker_loop.call_soon_threadsafe(handle_sensor_alert, sensor_type, is_alert, data)
+        )
+
         # --- 하드웨어 비상 정지 신호 리스너 설정 및 시작 ---
         communicator.set_lock_system_callback(handle_hardware_emergency_stop)
         communicator.set_is_locked_checker(state_manager.is_locked_status)
@@ -130,300 +164,442 @@ async def run_safety_system(command_queue: Queue, log_queue: Queue, frame_queue:
         }
     })
 
+    # 세션 녹화기: 원본 프레임/센서/명령/상태 메시지를 같은 monotonic 시계로 기록 (사고 재현 및 버전 간 비교용)
+    recording_config = config.get("recording", {})
+    recorder = None
+    if recording_config.get("enabled", False):
+        recorder = SessionRecorder(
+            directory=recording_config.get("directory", "recordings"),
+            codec=recording_config.get("codec", "mp4v"),
+            max_duration=recording_config.get("max_duration", 300.0)
+        )
+        logger.info(f"세션 녹화를 시작합니다: {recorder.directory}")
+    # 세션 재생 중이면 녹화된 명령을 재생 시각에 맞춰 command_queue에 다시 넣습니다.
+    session_player = getattr(input_adapter, "session_player", None)
+
     last_status_message_data = None
     was_locked = False # 이전 프레임의 잠금 상태를 기억하는 변수
-    TARGET_FPS = 15  # 목표 FPS를 15로 설정
-    FRAME_DURATION = 1 / TARGET_FPS
-    last_processed_time = time.perf_counter()
-
-    while True:
-        try:
-            # 1. FastAPI 서버로부터 명령 수신 및 처리
-            loop_start_time = time.perf_counter()
-
-            if not command_queue.empty():
-                command = command_queue.get_nowait()
-                logger.info(f"FastAPI 서버로부터 명령 수신: {command}")
-                cmd_type = command.get("command")
-                
-                # 모드 변경 커맨드 처리
-                if cmd_type in ["START_AUTOMATIC", "START_MAINTENANCE", "STOP"]:
-                    if cmd_type == "START_AUTOMATIC":
-                        state_manager.start_automatic_mode()
-                    elif cmd_type == "START_MAINTENANCE":
-                        state_manager.start_maintenance_mode()
-                    elif cmd_type == "STOP":
-                        state_manager.stop_system_globally()
-                        logger.info("STOP 명령 수신, 시스템은 정지 상태로 전환됩니다. 영상 스트림은 유지됩니다.")
+    lost_cameras = []  # 연결이 끊긴 카메라 ID 목록 (재연결 감독 스레드가 복구하면 비워짐)
+    # 위험도 적응형 추론 속도: 사람 없음(IDLE) / 사람 있음(PERSONS) / 구역 안·근처, 위험 등급, MAINTENANCE(ACTIVE)
+    # 단계별로 루프 주기를 조절하여, 한가할 때는 CPU를 아끼고 보호가 필요할 때는 최대 속도로 동작합니다.
+    inference_rate_config = config.get("inference_rate", {})
+    TARGET_FPS = inference_rate_config.get("max_fps", 15)  # 최대(보호 우선) FPS
+    rate_scheduler = InferenceRateScheduler(**{**inference_rate_config, "max_fps": TARGET_FPS})
+    MOTION_GATE_STATS_INTERVAL = 60  # 모션 게이트 통계 로그 주기 (초)
+    last_gate_stats_time = time.perf_counter()
+
+    try:
+        while True:
+            try:
+                # 1. FastAPI 서버로부터 명령 수신 및 처리
+                loop_start_time = time.perf_counter()
+
+                if session_player is not None:
+                    session_player.pump_commands(command_queue)
+
+                if not command_queue.empty():
+                    command = command_queue.get_nowait()
+                    logger.info(f"FastAPI 서버로부터 명령 수신: {command}")
+                    if recorder is not None:
+                        recorder.record_command(command)
+                    cmd_type = command.get("command")
                     
-                    # 모드 변경 후 즉시 루프를 다시 시작하여 새로운 상태를 적용
-                    continue
-                
-                elif cmd_type == "RESET": # 리셋 명령 처리
-                    state_manager.reset_system()
-                    logger.info("RESET 명령 수신, 시스템 잠금 상태를 해제합니다.")
-                    # 만약을 위해 전원 차단 명령을 한 번 더 보냄
-                    control_facade.execute_actions([{"type": "POWER_OFF", "details": {"reason": "System reset"}}])
+                    # 모드 변경 커맨드 처리
+                    if cmd_type in ["START_AUTOMATIC", "START_MAINTENANCE", "STOP"]:
+                        if cmd_type == "START_AUTOMATIC":
+                            state_manager.start_automatic_mode()
+                        elif cmd_type == "START_MAINTENANCE":
+                            state_manager.start_maintenance_mode()
+                        elif cmd_type == "STOP":
+                            state_manager.stop_system_globally()
+                            logger.info("STOP 명령 수신, 시스템은 정지 상태로 전환됩니다. 영상 스트림은 유지됩니다.")
+                        
+                        # 모드 변경 후 즉시 루프를 다시 시작하여 새로운 상태를 적용
+                        continue
                     
-                    # --- 상태 변경 후 즉시 UI에 업데이트 전송 ---
+                    elif cmd_type == "RESET": # 리셋 명령 처리
+                        state_manager.reset_system()
+                        logger.info("RESET 명령 수신, 시스템 잠금 상태를 해제합니다.")
+                        # 만약을 위해 전원 차단 명령을 한 번 더 보냄
+                        control_facade.execute_actions([{"type": "POWER_OFF", "details": {"reason": "System reset"}}])
+                        
+                        # --- 상태 변경 후 즉시 UI에 업데이트 전송 ---
+                        try:
+                            logical_status = state_manager.get_status()
+                            physical_status = control_facade.get_all_statuses()
+                            final_status = {**logical_status, **physical_status}
+                            
+                            # operation_mode가 None일 경우를 대비하여 기본값 설정
+                            op_mode = final_status.get('operation_mode') or 'STOPPED'
+
+                            status_message = StatusUpdateMessage(
+                                operation_mode=op_mode,
+                                conveyor_status="STOPPED", # 리셋 후에는 항상 정지 상태
+                                conveyor_speed=0,
+                                risk_level="SAFE", # 리셋 후에는 안전 상태
+                                is_locked=False, # 리셋되었으므로 False
+                                **rate_scheduler.get_status()
+                            )
+                            status_message_data = status_message.model_dump()
+                            log_queue.put({"type": "STATUS_UPDATE", "data": status_message_data})
+                            if recorder is not None:
+                                recorder.record_status(status_message_data)
+                            last_status_message_data = status_message_data
+                            logger.info("시스템 리셋 후 상태 정보를 UI로 전송했습니다.")
+                        except Exception as e:
+                            logger.error(f"리셋 후 상태 정보 전송 실패: {e}")
+
+                        continue
+
+                    # 기타 커맨드 처리
+                    elif cmd_type == "UPDATE_ZONES":
+                        zones = command.get("data", [])
+                        detector.danger_zone_mapper.update_zones_from_data(zones)
+                        logger.info(f"Vision Worker의 Zone 정보가 {len(zones)}개로 업데이트되었습니다. "
+                                    f"(스냅샷 v{detector.danger_zone_mapper.version})")
+
+                # 2. 영상 프레임 획득
+                capture_start_time = time.perf_counter()
+                # 프레임은 캡처 시각/순번/카메라 ID를 담은 FrameEnvelope로 받아 파이프라인 전체에 전달합니다.
+                camera_frames = None
+                if input_adapter.is_multi_camera:
+                    # 다중 카메라: {camera_id: envelope}을 받고, 잠금/비활성 화면용으로 격자 이미지를 구성
+                    camera_envelopes = input_adapter.get_frame_envelopes()
+                    # 격자는 항상 설정의 카메라 순서로 구성합니다. (프레임이 없는 카메라는 빈 타일로 두어,
+                    # 대시보드에서 격자 위에 그린 구역을 서버가 같은 배치로 카메라별 좌표로 변환할 수 있도록)
+                    camera_frames = {camera_id: camera_envelopes[camera_id].frame if camera_id in camera_envelopes else None
+                                     for camera_id in input_adapter.camera_ids}
+                    raw_frame = tile_frames(list(camera_frames.values()))
+                else:
+                    frame_envelope = input_adapter.get_frame_envelope()
+                    raw_frame = frame_envelope.frame if frame_envelope is not None else None
+                capture_end_time = time.perf_counter()
+
+                # 인코딩은 녹화기의 기록 스레드에서 수행되고, 직전과 같은 seq의 프레임은 다시 기록하지 않습니다.
+                if recorder is not None:
+                    recorded_envelopes = camera_envelopes.values() if camera_frames is not None else [frame_envelope]
+                    for envelope in recorded_envelopes:
+                        if envelope is not None:
+                            recorder.record_frame(envelope)
+
+                # --- 카메라 연결 상태 확인 ---
+                # 재연결은 스트림의 감독 스레드가 백그라운드에서 수행하므로, 루프는 멈추지 않고 상태만 반영합니다.
+                previous_lost_cameras = lost_cameras
+                lost_cameras = [str(camera_id or "default") for camera_id, connected in input_adapter.get_camera_status().items() if not connected]
+                if lost_cameras != previous_lost_cameras:
+                    if lost_cameras:
+                        # 영상 없이는 작업자 안전을 확인할 수 없으므로 보수적으로 컨베이어를 정지시킵니다.
+                        reason = f"Camera lost: {', '.join(lost_cameras)}"
+                        logger.error(f"카메라 연결 끊김: {lost_cameras}. 컨베이어를 정지시킵니다.")
+                        control_facade.execute_actions([{"type": "POWER_OFF", "details": {"reason": reason}}])
+                        event_type, log_risk_level = "LOG_CAMERA_LOST", "CRITICAL"
+                        description = f"Camera feed lost: {', '.join(lost_cameras)}. Conveyor stopped until the feed is restored."
+                    else:
+                        logger.info("모든 카메라 연결이 복구되었습니다.")
+                        event_type, log_risk_level = "LOG_CAMERA_RESTORED", "INFO"
+                        description = "All camera feeds restored."
+                    log_queue.put({"type": "LOG", "data": {
+                        "event_type": event_type,
+                        "details": {"description": description, "lost_cameras": lost_cameras},
+                        "log_risk_level": log_risk_level,
+                        "operation_mode": state_manager.get_status().get("operation_mode", "UNKNOWN")
+                    }})
+
                     try:
                         logical_status = state_manager.get_status()
                         physical_status = control_facade.get_all_statuses()
-                        final_status = {**logical_status, **physical_status}
-                        
-                        # operation_mode가 None일 경우를 대비하여 기본값 설정
-                        op_mode = final_status.get('operation_mode') or 'STOPPED'
-
                         status_message = StatusUpdateMessage(
-                            operation_mode=op_mode,
-                            conveyor_status="STOPPED", # 리셋 후에는 항상 정지 상태
-                            conveyor_speed=0,
-                            risk_level="SAFE", # 리셋 후에는 안전 상태
-                            is_locked=False # 리셋되었으므로 False
+                            operation_mode=logical_status.get('operation_mode') or 'STOPPED',
+                            conveyor_status="RUNNING" if physical_status.get('conveyor_is_on', False) else "STOPPED",
+                            conveyor_speed=physical_status.get('conveyor_speed', 0),
+                            risk_level="CAMERA_LOST" if lost_cameras else "SAFE",
+                            is_locked=logical_status.get('is_locked', False),
+                            camera_status="LOST" if lost_cameras else "CONNECTED",
+                            lost_cameras=lost_cameras,
+                            **rate_scheduler.get_status()
                         )
                         status_message_data = status_message.model_dump()
                         log_queue.put({"type": "STATUS_UPDATE", "data": status_message_data})
+                        if recorder is not None:
+                            recorder.record_status(status_message_data)
                         last_status_message_data = status_message_data
-                        logger.info("시스템 리셋 후 상태 정보를 UI로 전송했습니다.")
                     except Exception as e:
-                        logger.error(f"리셋 후 상태 정보 전송 실패: {e}")
-
+                        logger.warning(f"카메라 상태 업데이트 메시지 생성 실패: {e}")
+
+                if raw_frame is None:
+                    if lost_cameras and not frame_queue.full():
+                        # 스트림이 멈춘 것처럼 보이지 않도록 카메라 끊김 안내 화면을 전송
+                        lost_frame = put_text_korean(np.zeros((480, 640, 3), dtype=np.uint8), "CAMERA LOST", (15, 50), 30, (0, 0, 255))
+                        lost_frame = put_text_korean(lost_frame, "카메라 재연결 중...", (15, 90), 22, (0, 255, 255))
+                        _, encoded_frame = cv2.imencode('.jpg', lost_frame)
+                        frame_queue.put_nowait(encoded_frame.tobytes())
+                    await asyncio.sleep(0.1)
                     continue
-
-                # 기타 커맨드 처리
-                elif cmd_type == "UPDATE_ZONES":
-                    zones = command.get("data", [])
-                    detector.danger_zone_mapper.update_zones_from_data(zones)
-                    logger.info(f"Vision Worker의 Zone 정보가 {len(zones)}개로 업데이트되었습니다.")
-
-            # 2. 영상 프레임 획득
-            capture_start_time = time.perf_counter()
-            raw_frame = input_adapter.get_frame()
-            capture_end_time = time.perf_counter()
-
-            if raw_frame is None:
-                await asyncio.sleep(0.1)
-                continue
-            
-            display_frame = raw_frame.copy()
-            loop = asyncio.get_running_loop()
-
-            # --- 시스템 잠금 상태 확인 및 처리 ---
-            is_locked_now = state_manager.is_locked_status()
-
-            # 1. 잠금 상태로 "전환"되는 순간을 감지하여 전원을 차단합니다.
-            if is_locked_now and not was_locked:
-                logger.warning("시스템 잠금 상태로 전환됨! 전원을 즉시 차단합니다.")
-                control_facade.execute_actions([{"type": "POWER_OFF", "details": {"reason": "System LOCKED"}}])
-
-            # 2. 현재 프레임이 잠금 상태인지 확인하고 UI 처리 및 로직 실행을 결정합니다.
-            if is_locked_now:
-                # 잠금 상태일 경우, 모든 로직을 중단하고 화면에 경고만 표시
-                display_frame = put_text_korean(display_frame, "SYSTEM LOCKED", (15, 50), 30, (0, 0, 255))
-                display_frame = put_text_korean(display_frame, "관리자 리셋 필요", (15, 90), 22, (0, 255, 255))
-            
-            # 3. 시스템 활성화 상태였을 때만 안전 로직 및 시각화 수행
-            # TODO 아두이누 하드코딩 자체 정지 데이터 받을때, 비정형 작업이면 굳이 lock을 안해도 되지 않나?
-            elif state_manager.is_active():
-                sensor_data = input_adapter.get_sensor_data()
                 
-                # 객체 탐지 (CPU 집약적 작업을 별도 스레드에서 실행하여 이벤트 루프 블로킹 방지)
-                detect_start_time = time.perf_counter()
-                detection_result = await loop.run_in_executor(None, detector.detect, raw_frame)
-                detect_end_time = time.perf_counter()
-
-                # 논리적 상태는 메인 루프에서 직접 가져옴
-                current_status = state_manager.get_status()
-                current_mode = current_status.get("operation_mode")
-
-                # 물리적 상태는 ControlFacade를 통해 동기적으로 가져옴 (캐시된 상태)
-                physical_status = control_facade.get_all_statuses()
-                conveyor_is_on = physical_status.get("conveyor_is_on", False)
-                conveyor_speed = physical_status.get("conveyor_speed", 100)
-
-                # 로직 처리
-                logic_facade_start_time = time.perf_counter()
-                logic_result = logic_facade.process(
-                    detection_result=detection_result,
-                    sensor_data=sensor_data,
-                    current_mode=current_mode,
-                    current_conveyor_status=conveyor_is_on,
-                    current_conveyor_speed=conveyor_speed
-                )
-                actions = logic_result.get("actions", [])
-                current_risk_level = logic_result.get("status", {}).get("risk_level", "SAFE") # LogicFacade가 결정한 위험 등급
-                logic_facade_end_time = time.perf_counter()
-
-                # 액션 실행
-                control_start_time = time.perf_counter()
-                control_actions = []
-                for action in actions:
-                    action_type = action.get("type")
-                    if action_type == 'LOCK_SYSTEM':
-                        reason = action.get("details", {}).get("reason", "Logic-driven lock")
-                        state_manager.lock_system(reason)
-                        # LOCK_SYSTEM은 다른 제어 액션과 함께 처리될 수 있으므로 continue하지 않음
-
-                    if action_type in ['POWER_ON', 'POWER_OFF', 'REDUCE_SPEED_50', 'RESUME_FULL_SPEED'] or action_type.startswith('TRIGGER_ALARM_'):
-                        control_actions.append(action)
+                display_frame = raw_frame.copy()
+                loop = asyncio.get_running_loop()
+
+                # --- 시스템 잠금 상태 확인 및 처리 ---
+                is_locked_now = state_manager.is_locked_status()
+
+                # 1. 잠금 상태로 "전환"되는 순간을 감지하여 전원을 차단합니다.
+                if is_locked_now and not was_locked:
+                    logger.warning("시스템 잠금 상태로 전환됨! 전원을 즉시 차단합니다.")
+                    control_facade.execute_actions([{"type": "POWER_OFF", "details": {"reason": "System LOCKED"}}])
+
+                # 2. 현재 프레임이 잠금 상태인지 확인하고 UI 처리 및 로직 실행을 결정합니다.
+                if is_locked_now:
+                    # 잠금 상태일 경우, 모든 로직을 중단하고 화면에 경고만 표시
+                    display_frame = put_text_korean(display_frame, "SYSTEM LOCKED", (15, 50), 30, (0, 0, 255))
+                    display_frame = put_text_korean(display_frame, "관리자 리셋 필요", (15, 90), 22, (0, 255, 255))
+                
+                # 3. 시스템 활성화 상태였을 때만 안전 로직 및 시각화 수행
+                # TODO 아두이누 하드코딩 자체 정지 데이터 받을때, 비정형 작업이면 굳이 lock을 안해도 되지 않나?
+                elif state_manager.is_active():
+                    sensor_data = input_adapter.get_sensor_data()
+                    if recorder is not None:
+                        recorder.record_sensor(sensor_data)
                     
-                    elif action_type and action_type.startswith('LOG_'):
-                        risk_factors = logic_facade.last_risk_analysis.get("risk_factors", [])
-
-                        # 로그 레벨과 설명을 결정
-                        log_risk_level = "INFO"  # 기본값
-                        description = "System is operating normally."
-
-                        # 가장 중요한 위험 사실 하나를 찾아 설명과 레벨을 설정
-                        if any(f["type"] == "SENSOR_ALERT" for f in risk_factors):
-                            log_risk_level = "CRITICAL"
-                            sensor_type = next((f.get("sensor_type") for f in risk_factors if f["type"] == "SENSOR_ALERT"), "unknown")
-                            description = f"An emergency signal from sensor '{sensor_type}' has been detected."
-                        elif any(f["type"] == "POSTURE_FALLING" for f in risk_factors):
-                            log_risk_level = "CRITICAL"
-                            description = "A person falling has been detected."
-                        elif any(f["type"] == "ZONE_INTRUSION" for f in risk_factors):
-                            log_risk_level = "WARNING"
-                            intrusion_details = next((f.get("details") for f in risk_factors if f["type"] == "ZONE_INTRUSION"), [])
-                            zone_names = ", ".join(list(set(alert["zone_name"] for alert in intrusion_details)))
-                            description = f"Person detected in danger zone(s): {zone_names}."
-                        elif any(f["type"] == "POSTURE_CROUCHING" for f in risk_factors):
-                            log_risk_level = "NOTICE"
-                            description = "A person in a crouching pose has been detected."
-
-                        event_data = {
-                            "event_type": action_type,
-                            "details": {"description": description},
-                            "log_risk_level": log_risk_level,
-                            "operation_mode": current_mode  # 현재 동작 모드 추가
-                        }
-                        log_queue.put({"type": "LOG", "data": event_data})
+                    # 객체 탐지 (CPU 집약적 작업을 별도 스레드에서 실행하여 이벤트 루프 블로킹 방지)
+                    detect_start_time = time.perf_counter()
+                    if camera_frames is not None:
+                        detection_result = await loop.run_in_executor(None, detector.detect_cameras, camera_envelopes)
+                    else:
+                        detection_result = await loop.run_in_executor(None, detector.detect, frame_envelope)
+                    detect_end_time = time.perf_counter()
+
+                    # 논리적 상태는 메인 루프에서 직접 가져옴
+                    current_status = state_manager.get_status()
+                    current_mode = current_status.get("operation_mode")
+
+                    # 물리적 상태는 ControlFacade를 통해 동기적으로 가져옴 (캐시된 상태)
+                    physical_status = control_facade.get_all_statuses()
+                    conveyor_is_on = physical_status.get("conveyor_is_on", False)
+                    conveyor_speed = physical_status.get("conveyor_speed", 100)
+
+                    # 로직 처리
+                    logic_facade_start_time = time.perf_counter()
+                    logic_result = logic_facade.process(
+                        detection_result=detection_result,
+                        sensor_data=sensor_data,
+                        current_mode=current_mode,
+                        current_conveyor_status=conveyor_is_on,
+                        current_conveyor_speed=conveyor_speed
+                    )
+                    actions = logic_result.get("actions", [])
+                    current_risk_level = logic_result.get("status", {}).get("risk_level", "SAFE") # LogicFacade가 결정한 위험 등급
+                    frame_meta = logic_result.get("frame_meta")
+                    logic_facade_end_time = time.perf_counter()
+
+                    # 이번 결과의 위험 상황으로 다음 루프의 추론 속도를 결정
+                    rate_scheduler.update(detection_result, mode=current_mode, risk_level=current_risk_level)
+
+                    # 액션 실행
+                    control_start_time = time.perf_counter()
+                    control_actions = []
+                    for action in actions:
+                        action_type = action.get("type")
+                        if action_type == 'LOCK_SYSTEM':
+                            reason = action.get("details", {}).get("reason", "Logic-driven lock")
+                            state_manager.lock_system(reason)
+                            # LOCK_SYSTEM은 다른 제어 액션과 함께 처리될 수 있으므로 continue하지 않음
+
+                        if action_type in ['POWER_ON', 'POWER_OFF', 'REDUCE_SPEED_50', 'RESUME_FULL_SPEED'] or action_type.startswith('TRIGGER_ALARM_'):
+                            control_actions.append(action)
+                        
+                        elif action_type and action_type.startswith('LOG_'):
+                            risk_factors = logic_facade.last_risk_analysis.get("risk_factors", [])
+
+                            # 로그 레벨과 설명을 결정
+                            log_risk_level = "INFO"  # 기본값
+                            description = "System is operating normally."
+
+                            # 가장 중요한 위험 사실 하나를 찾아 설명과 레벨을 설정
+                            if any(f["type"] == "SENSOR_ALERT" for f in risk_factors):
+                                log_risk_level = "CRITICAL"
+                                sensor_type = next((f.get("sensor_type") for f in risk_factors if f["type"] == "SENSOR_ALERT"), "unknown")
+                                description = f"An emergency signal from sensor '{sensor_type}' has been detected."
+                            elif any(f["type"] == "POSTURE_FALLING" for f in risk_factors):
+                                log_risk_level = "CRITICAL"
+                                description = "A person falling has been detected."
+                            elif any(f["type"] == "STALE_FEED" for f in risk_factors):
+                                log_risk_level = "WARNING"
+                                stale_cameras = next((f.get("cameras") for f in risk_factors if f["type"] == "STALE_FEED"), [])
+                                description = f"Camera feed frozen (repeating identical frames): {', '.join(stale_cameras)}."
+                            elif any(f["type"] == "ZONE_INTRUSION" for f in risk_factors):
+                                log_risk_level = "WARNING"
+                                intrusion_details = next((f.get("details") for f in risk_factors if f["type"] == "ZONE_INTRUSION"), [])
+                                zone_names = ", ".join(list(set(alert["zone_name"] for alert in intrusion_details)))
+                                description = f"Person detected in danger zone(s): {zone_names}."
+                            elif any(f["type"] == "POSTURE_CROUCHING" for f in risk_factors):
+                                log_risk_level = "NOTICE"
+                                description = "A person in a crouching pose has been detected."
+
+                            event_details = {"description": description}
+                            if frame_meta is not None:
+                                # 이벤트별 종단 지연 시간 측정을 위해 캡처 정보와 현재까지의 지연 시간을 첨부
+                                event_details["frame"] = frame_event_details(frame_meta)
+
+                            event_data = {
+                                "event_type": action_type,
+                                "details": event_details,
+                                "log_risk_level": log_risk_level,
+                                "operation_mode": current_mode  # 현재 동작 모드 추가
+                            }
+                            log_queue.put({"type": "LOG", "data": event_data})
+                        
+                        elif action_type == 'NOTIFY_UI':
+                            log_queue.put({"type": "ALERT", "data": action.get("details", {})})
+
+                    if lost_cameras:
+                        # 일부 카메라가 끊긴 동안에는 사각지대가 생기므로 가동/증속 명령을 보내지 않습니다.
+                        control_actions = [a for a in control_actions if a.get("type") not in ("POWER_ON", "RESUME_FULL_SPEED")]
+
+                    if control_actions:
+                        control_facade.execute_actions(control_actions)
+                    control_end_time = time.perf_counter()
+
+                    # 시각화 및 스트리밍 프레임 업데이트
+                    draw_start_time = time.perf_counter()
+                    if camera_frames is not None:
+                        display_frame = detector.draw_camera_detections(camera_frames, detection_result)
+                    else:
+                        display_frame = detector.draw_detections(raw_frame, detection_result)
+                    draw_end_time = time.perf_counter()
                     
-                    elif action_type == 'NOTIFY_UI':
-                        log_queue.put({"type": "ALERT", "data": action.get("details", {})})
-
-                if control_actions:
-                    control_facade.execute_actions(control_actions)
-                control_end_time = time.perf_counter()
-
-                # 시각화 및 스트리밍 프레임 업데이트
-                draw_start_time = time.perf_counter()
-                display_frame = detector.draw_detections(raw_frame, detection_result)
-                draw_end_time = time.perf_counter()
-                
-                # 최종 상태를 다시 가져와서 화면에 표시
-                logical_status = state_manager.get_status()
-                physical_status = control_facade.get_all_statuses()
-                final_status = {**logical_status, **physical_status}
-
-                # --- 텍스트 및 색상 표준화 ---
-                op_mode = final_status.get('operation_mode', 'N/A')
-                if op_mode == 'AUTOMATIC':
-                    mode_text = "Mode: 운전 모드"
-                elif op_mode == 'MAINTENANCE':
-                    mode_text = "Mode: 정비 모드"
-                else:
-                    mode_text = f"Mode: {op_mode}"
-
-                is_on = final_status.get('conveyor_is_on', False)
-                speed = final_status.get('conveyor_speed', 100)
+                    # 최종 상태를 다시 가져와서 화면에 표시
+                    logical_status = state_manager.get_status()
+                    physical_status = control_facade.get_all_statuses()
+                    final_status = {**logical_status, **physical_status}
+
+                    # --- 텍스트 및 색상 표준화 ---
+                    op_mode = final_status.get('operation_mode', 'N/A')
+                    if op_mode == 'AUTOMATIC':
+                        mode_text = "Mode: 운전 모드"
+                    elif op_mode == 'MAINTENANCE':
+                        mode_text = "Mode: 정비 모드"
+                    else:
+                        mode_text = f"Mode: {op_mode}"
+
+                    is_on = final_status.get('conveyor_is_on', False)
+                    speed = final_status.get('conveyor_speed', 100)
+
+                    if not is_on:
+                        status_text = "Status: 정지"
+                    elif speed < 100:
+                        status_text = f"Status: 감속 ({speed}%)"
+                    else:
+                        status_text = "Status: 정상 운전"
+
+                    risk_text = f"Risk: {current_risk_level}"
+                    
+                    # 표준 색상 팔레트 (BGR)
+                    color_white = (255, 255, 255)
+                    color_red = (79, 83, 217)      # #d9534f
+                    color_orange = (78, 173, 240) # #f0ad4e
+                    color_green = (92, 184, 92)     # #5cb85c
+
+                    if current_risk_level in ["CRITICAL", "LOTO_RISK_DETECTED", "STALE_FEED"]:
+                        risk_color = color_red
+                    elif current_risk_level == "WARNING":
+                        risk_color = color_orange
+                    else:
+                        risk_color = color_green
+
+                    display_frame = put_text_korean(display_frame, mode_text, (15, 50), 22, color_white)
+                    display_frame = put_text_korean(display_frame, status_text, (15, 80), 22, color_white)
+                    display_frame = put_text_korean(display_frame, risk_text, (15, 110), 22, risk_color)
+
+                    # --- 실시간 상태 업데이트 메시지 생성 및 전송 ---
+                    status_message_data = None
+                    try:
+                        # conveyor_status를 변수에서 직접 결정하여 안정성 확보
+                        conveyor_final_status = "STOPPED"
+                        if final_status.get('conveyor_is_on', False):
+                            if final_status.get('conveyor_speed', 100) < 100:
+                                conveyor_final_status = "SLOWDOWN"
+                            else:
+                                conveyor_final_status = "RUNNING"
 
-                if not is_on:
-                    status_text = "Status: 정지"
-                elif speed < 100:
-                    status_text = f"Status: 감속 ({speed}%)"
-                else:
-                    status_text = "Status: 정상 운전"
+                        status_message = StatusUpdateMessage(
+                            operation_mode=final_status.get('operation_mode', 'N/A'),
+                            conveyor_status=conveyor_final_status,
+                            conveyor_speed=final_status.get('conveyor_speed', 0),
+                            risk_level=current_risk_level,
+                            is_locked=final_status.get('is_locked', False), # is_locked 상태 추가
+                            camera_status="LOST" if lost_cameras else "CONNECTED",
+                            lost_cameras=lost_cameras,
+                            **rate_scheduler.get_status()
+                        )
+                        status_message_data = status_message.model_dump()
+                    except Exception as e:
+                        logger.warning(f"상태 업데이트 메시지 생성 실패: {e}")
 
-                risk_text = f"Risk: {current_risk_level}"
+                    if status_message_data and status_message_data != last_status_message_data:
+                        log_queue.put({"type": "STATUS_UPDATE", "data": status_message_data})
+                        if recorder is not None:
+                            recorder.record_status(status_message_data)
+                        last_status_message_data = status_message_data
                 
-                # 표준 색상 팔레트 (BGR)
-                color_white = (255, 255, 255)
-                color_red = (79, 83, 217)      # #d9534f
-                color_orange = (78, 173, 240) # #f0ad4e
-                color_green = (92, 184, 92)     # #5cb85c
-
-                if current_risk_level in ["CRITICAL", "LOTO_RISK_DETECTED"]:
-                    risk_color = color_red
-                elif current_risk_level == "WARNING":
-                    risk_color = color_orange
-                else:
-                    risk_color = color_green
-
-                display_frame = put_text_korean(display_frame, mode_text, (15, 50), 22, color_white)
-                display_frame = put_text_korean(display_frame, status_text, (15, 80), 22, color_white)
-                display_frame = put_text_korean(display_frame, risk_text, (15, 110), 22, risk_color)
-
-                # --- 실시간 상태 업데이트 메시지 생성 및 전송 ---
-                status_message_data = None
-                try:
-                    # conveyor_status를 변수에서 직접 결정하여 안정성 확보
-                    conveyor_final_status = "STOPPED"
-                    if final_status.get('conveyor_is_on', False):
-                        if final_status.get('conveyor_speed', 100) < 100:
-                            conveyor_final_status = "SLOWDOWN"
-                        else:
-                            conveyor_final_status = "RUNNING"
-
-                    status_message = StatusUpdateMessage(
-                        operation_mode=final_status.get('operation_mode', 'N/A'),
-                        conveyor_status=conveyor_final_status,
-                        conveyor_speed=final_status.get('conveyor_speed', 0),
-                        risk_level=current_risk_level,
-                        is_locked=final_status.get('is_locked', False) # is_locked 상태 추가
-                    )
-                    status_message_data = status_message.model_dump()
-                except Exception as e:
-                    logger.warning(f"상태 업데이트 메시지 생성 실패: {e}")
-
-                if status_message_data and status_message_data != last_status_message_data:
-                    log_queue.put({"type": "STATUS_UPDATE", "data": status_message_data})
-                    last_status_message_data = status_message_data
-            
-            else: # state_manager.is_active()가 False일 때
-                # 시스템이 비활성화되었을 때, 컨베이어 전원이 켜져 있다면 끈다.
-                physical_status = control_facade.get_all_statuses()
-                if physical_status.get("conveyor_is_on", False):
-                    logger.info("시스템 비활성 상태 확인: 컨베이어 전원을 차단합니다.")
-                    control_facade.execute_actions([{"type": "POWER_OFF", "details": {"reason": "System inactive"}}])
+                else: # state_manager.is_active()가 False일 때
+                    # 시스템이 비활성화되었을 때, 컨베이어 전원이 켜져 있다면 끈다.
+                    physical_status = control_facade.get_all_statuses()
+                    if physical_status.get("conveyor_is_on", False):
+                        logger.info("시스템 비활성 상태 확인: 컨베이어 전원을 차단합니다.")
+                        control_facade.execute_actions([{"type": "POWER_OFF", "details": {"reason": "System inactive"}}])
+                    
+                    display_frame = put_text_korean(display_frame, "SYSTEM INACTIVE", (15, 50), 30, (0, 0, 255))
+                    await asyncio.sleep(0.1)
+
+                # 4. 처리된 프레임을 FastAPI 서버로 전송
+                queue_put_start_time = time.perf_counter()
+                if not frame_queue.full():
+                    # 프레임을 JPEG로 인코딩하여 바이트로 변환
+                    _, encoded_frame = cv2.imencode('.jpg', display_frame)
+                    frame_queue.put_nowait(encoded_frame.tobytes())
+                queue_put_end_time = time.perf_counter()
+
+                loop_end_time = time.perf_counter()
                 
-                display_frame = put_text_korean(display_frame, "SYSTEM INACTIVE", (15, 50), 30, (0, 0, 255))
-                await asyncio.sleep(0.1)
-
-            # 4. 처리된 프레임을 FastAPI 서버로 전송
-            queue_put_start_time = time.perf_counter()
-            if not frame_queue.full():
-                # 프레임을 JPEG로 인코딩하여 바이트로 변환
-                _, encoded_frame = cv2.imencode('.jpg', display_frame)
-                frame_queue.put_nowait(encoded_frame.tobytes())
-            queue_put_end_time = time.perf_counter()
-
-            loop_end_time = time.perf_counter()
-            
-            # --- 성능 측정 로그 ---
-            # if state_manager.is_active():
-            #     logger.debug(f"[PERF] Capture: {((capture_end_time - capture_start_time) * 1000):.2f}ms | "
-            #                  f"Detect: {((detect_end_time - detect_start_time) * 1000):.2f}ms | "
-            #                  f"Logic: {((logic_facade_end_time - logic_facade_start_time) * 1000):.2f}ms | "
-            #                  f"Control: {((control_end_time - control_start_time) * 1000):.2f}ms | "
-            #                  f"Draw: {((draw_end_time - draw_start_time) * 1000):.2f}ms | "
-            #                  f"QueuePut: {((queue_put_end_time - queue_put_start_time) * 1000):.2f}ms | "
-            #                  f"TOTAL: {((loop_end_time - loop_start_time) * 1000):.2f}ms")
-
-            # --- 다음 루프를 위해 현재 잠금 상태를 저장 ---
-            was_locked = is_locked_now
-
-            await asyncio.sleep(0.01)
-
-        except Exception as e:
-            logger.error(f"비전 워커 루프에서 예외 발생: {e}", exc_info=True)
-            log_queue.put({"type": "LOG", "data": {"event_type": "LOG_SYSTEM_ERROR", "details": {"message": str(e)}, "log_level": "ERROR"}})
-            await asyncio.sleep(5)
-
-    # 어플리케이션 종료 시 시리얼 리소스 정리
-    communicator.close()
-    input_adapter.release()
-    logger.info("비전 워커 프로세스가 종료되었습니다.")
+                # --- 성능 측정 로그 ---
+                # if state_manager.is_active():
+                #     logger.debug(f"[PERF] Capture: {((capture_end_time - capture_start_time) * 1000):.2f}ms | "
+                #                  f"Detect: {((detect_end_time - detect_start_time) * 1000):.2f}ms | "
+                #                  f"Logic: {((logic_facade_end_time - logic_facade_start_time) * 1000):.2f}ms | "
+                #                  f"Control: {((control_end_time - control_start_time) * 1000):.2f}ms | "
+                #                  f"Draw: {((draw_end_time - draw_start_time) * 1000):.2f}ms | "
+                #                  f"QueuePut: {((queue_put_end_time - queue_put_start_time) * 1000):.2f}ms | "
+                #                  f"TOTAL: {((loop_end_time - loop_start_time) * 1000):.2f}ms")
+
+                # --- 모션 게이트 통계 (추론 건너뛰기 비율로 CPU 절감량 확인) ---
+                if loop_end_time - last_gate_stats_time >= MOTION_GATE_STATS_INTERVAL:
+                    for camera_id, stats in detector.get_motion_gate_stats().items():
+                        logger.info(f"[MotionGate] camera={camera_id} | skip_rate={stats['skip_rate']:.1%} | "
+                                    f"skipped={stats['frames_skipped']}/{stats['frames_total']} | forced={stats['forced_inferences']}")
+                    for camera_id, stats in detector.get_tracker_stats().items():
+                        logger.info(f"[Tracker] camera={camera_id} | detection_rate={stats['detection_rate']:.1%} | "
+                                    f"tracks={stats['active_tracks']} | forced_zone={stats['forced_by_zone']} | "
+                                    f"forced_posture={stats['forced_by_posture']}")
+                    last_gate_stats_time = loop_end_time
+
+                # --- 다음 루프를 위해 현재 잠금 상태를 저장 ---
+                was_locked = is_locked_now
+
+                # 현재 추론 속도 단계의 주기에 맞춰 남은 시간만큼 대기 (처리 시간이 주기를 넘으면 최소한만 양보)
+                elapsed = time.perf_counter() - loop_start_time
+                await asyncio.sleep(max(0.001, rate_scheduler.frame_interval - elapsed))
+
+            except Exception as e:
+                logger.error(f"비전 워커 루프에서 예외 발생: {e}", exc_info=True)
+                log_queue.put({"type": "LOG", "data": {"event_type": "LOG_SYSTEM_ERROR", "details": {"message": str(e)}, "log_level": "ERROR"}})
+                await asyncio.sleep(5)
+    finally:
+        # 루프가 취소(asyncio.CancelledError)되거나 예외로 끝나도 녹화 파일과 장치 자원을 정리합니다.
+        if recorder is not None:
+            recorder.close()
+        communicator.close()
+        input_adapter.release()
+        logger.info("비전 워커 프로세스가 종료되었습니다.")
 
 # --------------------------------------------------------------------------
 # 워커 실행기